@@ -1,3 +1,5 @@
+import os
+
 import pytest
 import allure
 from playwright.sync_api import Page
@@ -8,7 +10,27 @@ from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutStepOnePage, CheckoutStepTwoPage, CheckoutCompletePage
 from pages.product_detail_page import ProductDetailPage
 from data.users import Users
+from local_app.server import LocalApp
+from utils.async_runner import AsyncBrowserSession, AsyncContextFactory, AsyncRunner
+from utils.auth_state import AuthStateCache
+from utils.budgets import LatencyBudgets
+from utils.cart_seeder import CartSeeder
+from utils.config import Config
+from utils.context_pool import ContextPool
+from utils.failure_trace import FailureTracer, attach_trace, trace_path_for
+from utils.har import HarIndex, har_path_for
+from utils.journey_state import JourneySnapshotCache
+from utils.network import NetworkProfile
+from utils.parallel import resolve_worker_count
+from utils.profiler import SuiteProfiler
+from utils.report_budget import ReportBudget
+from utils.retry import RetryPolicy
+from utils.screenshot import attach_screenshot, should_capture
+from utils.timing_store import DurationScheduler
+from utils import allure_writer, impact, instrumentation, web_vitals
 
+# tests/unit에서 플러그인(RetryPolicy 등)을 별도 pytest 실행으로 검증 (pytester fixture)
+pytest_plugins = ["pytester"]
 
 # 테스트 모듈 실행 순서 정의
 TEST_ORDER = [
@@ -20,8 +42,98 @@ TEST_ORDER = [
 ]
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--workers",
+        default=Config.WORKERS,
+        help="병렬 워커 프로세스 수 (숫자 또는 auto, pytest-xdist 필요)",
+    )
+    parser.addoption(
+        "--schedule",
+        default=Config.SCHEDULE,
+        choices=("order", "duration"),
+        help="테스트 실행 순서 (order: TEST_ORDER, duration: 과거 소요 시간이 긴 테스트 우선)",
+    )
+    parser.addoption(
+        "--record-har",
+        action="store_true",
+        help="테스트별 네트워크 트래픽을 HAR_DIR에 HAR 파일로 녹화",
+    )
+    parser.addoption(
+        "--replay-har",
+        action="store_true",
+        help="HAR_DIR의 녹화본으로 모든 요청에 응답 (실제 네트워크 사용 안 함)",
+    )
+    parser.addoption(
+        "--context-pool",
+        action="store_true",
+        default=Config.CONTEXT_POOL,
+        help="브라우저 컨텍스트를 테스트 간에 재사용 (반납 시 상태 초기화 및 검증)",
+    )
+    parser.addoption(
+        "--local-app",
+        action="store_true",
+        default=Config.LOCAL_APP,
+        help="TEST_URL 대신 로컬 대체 서버(local_app)를 띄워 대상으로 실행",
+    )
+    parser.addoption(
+        "--profile-suite",
+        action="store_true",
+        default=Config.PROFILE_SUITE,
+        help="fixture/본문/페이지 객체 메서드/Allure I/O별 소요 시간 보고서와 flamegraph 파일 생성 (PROFILE_DIR)",
+    )
+    parser.addoption(
+        "--changed-since",
+        metavar="REF",
+        default=Config.CHANGED_SINCE,
+        help="git REF 이후 변경된 페이지 객체/data/fixture/테스트 파일에 영향을 받는 테스트만 실행 (IMPACT_MAP_FILE 기록 기준)",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """--workers 값을 pytest-xdist 설정으로 변환"""
+    if hasattr(config, "workerinput"):
+        return  # xdist 워커 프로세스
+    workers = resolve_worker_count(config.getoption("workers"))
+    if workers <= 1:
+        return
+    if not config.pluginmanager.hasplugin("xdist"):
+        config.issue_config_time_warning(pytest.PytestConfigWarning(
+            f"pytest-xdist가 설치되어 있지 않아 --workers {workers}를 무시하고 단일 프로세스로 실행합니다"
+        ), stacklevel=2)
+        return
+    if config.option.numprocesses:
+        return  # -n을 직접 지정한 경우 우선
+    config.option.numprocesses = workers
+    config.option.dist = "load"
+
+
+def pytest_configure(config):
+    if Config.ALLURE_ASYNC_WRITER:
+        allure_writer.install(config)  # allure-pytest의 pytest_configure보다 먼저 실행됨
+    config.pluginmanager.register(DurationScheduler(config), "duration_scheduler")
+    config.pluginmanager.register(LatencyBudgets(config), "latency_budgets")
+    if Config.RETRY_MAX > 0:
+        config.pluginmanager.register(RetryPolicy(config), "retry_policy")
+    if Config.REPORT_SIZE_BUDGET_MB > 0:
+        config.pluginmanager.register(ReportBudget(config), "report_budget")
+    if Config.IMPACT_MAP or config.getoption("changed_since"):
+        config.pluginmanager.register(impact.ImpactAnalysis(config), "impact_analysis")
+    if config.getoption("profile_suite"):
+        config.pluginmanager.register(SuiteProfiler(config), "suite_profiler")
+
+
+def pytest_unconfigure(config):
+    allure_writer.close_all()
+
+
 def pytest_collection_modifyitems(items):
-    """테스트 실행 순서를 TEST_ORDER에 따라 정렬"""
+    """테스트 실행 순서를 TEST_ORDER에 따라 정렬
+
+    병렬 실행 시에도 xdist load 스케줄러가 정렬된 순서대로 워커에 테스트를 나눠주므로
+    TEST_ORDER는 완전한 직렬화가 아닌 우선순위로 동작한다.
+    """
     def get_order(item):
         # 모듈 이름에서 순서 결정
         module_name = item.module.__name__.split(".")[-1]
@@ -41,6 +153,14 @@ def pytest_runtest_makereport(item, call):
     setattr(item, f"rep_{rep.when}", rep)
 
 
+@pytest.fixture(autouse=True)
+def network_profile(request, context, har_replay):
+    """BLOCK_RESOURCES와 block_resources/allow_resources 마커에 따라 불필요한 요청 차단"""
+    profile = NetworkProfile.for_test(request.node)
+    profile.install(context)
+    return profile
+
+
 @pytest.fixture
 def login_page(page: Page):
     """LoginPage 인스턴스 반환"""
@@ -55,13 +175,190 @@ def inventory_page(page: Page):
     return InventoryPage(page)
 
 
+def _login_user(request):
+    """login_as 마커로 지정된 사용자 반환 (기본값: 표준 사용자)"""
+    marker = request.node.get_closest_marker("login_as")
+    return Users.get_by_username(marker.args[0]) if marker else Users.STANDARD
+
+
+def _uses_auth_cache(request) -> bool:
+    return Config.AUTH_CACHE and "logged_in_page" in request.fixturenames
+
+
+@pytest.fixture(scope="session")
+def har_index(pytestconfig):
+    """--replay-har 실행 시 HAR_DIR의 녹화본 인덱스 (아니면 None)"""
+    if not pytestconfig.getoption("replay_har"):
+        return None
+    index = HarIndex.load_dir()
+    if not len(index):
+        raise FileNotFoundError(f"{Config.HAR_DIR}에 HAR 녹화본이 없습니다. 먼저 --record-har로 녹화하세요")
+    return index
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_app(pytestconfig):
+    """--local-app 실행 시 로컬 대체 서버를 띄우고 BASE_URL을 교체 (아니면 None)"""
+    if not pytestconfig.getoption("local_app"):
+        yield None
+        return
+    app = LocalApp().start()
+    base_url = Config.BASE_URL
+    Config.BASE_URL = app.url
+    try:
+        yield app
+    finally:
+        Config.BASE_URL = base_url
+        app.stop()
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache(browser, har_index, local_app):
+    """사용자별 로그인 storage_state 캐시 (세션당 사용자별 1회 로그인)"""
+    return AuthStateCache(browser, prepare_context=har_index.install if har_index else None)
+
+
+@pytest.fixture(scope="session")
+def journey_snapshots(browser, har_index, local_app, request):
+    """여정 상태 스냅샷 캐시 (세션(워커)당 여정/사용자별 1회 생성)"""
+    auth_state_cache = request.getfixturevalue("auth_state_cache") if Config.AUTH_CACHE else None
+    return JourneySnapshotCache(browser, auth_state_cache, prepare_context=har_index.install if har_index else None,
+                                enabled=Config.JOURNEY_SNAPSHOTS)
+
+
+@pytest.fixture
+def journey_state(request, context, page, journey_snapshots):
+    """테스트 페이지를 여정 상태로 만드는 함수 반환 - journey_state(journey) -> steps 반환값
+
+    login_as 마커의 사용자(기본값: 표준 사용자)로 진행하며, 스냅샷 복원에 실패하면 단계를 처음부터 실행한다.
+    """
+    user = _login_user(request)
+    return lambda journey: journey_snapshots.enter(context, page, journey, user)
+
+
+@pytest.fixture
+def browser_context_args(browser_context_args, request, pytestconfig):
+    """테스트별 컨텍스트 옵션
+
+    - --record-har / --replay-har: 서비스 워커 차단 (라우팅/녹화를 우회하지 않도록)
+    - --record-har: 테스트별 HAR 파일 녹화
+    - logged_in_page 사용 시: 캐시된 로그인 상태로 컨텍스트 생성
+    """
+    args = dict(browser_context_args)
+    if pytestconfig.getoption("record_har") or pytestconfig.getoption("replay_har"):
+        args["service_workers"] = "block"
+    if pytestconfig.getoption("record_har"):
+        os.makedirs(Config.HAR_DIR, exist_ok=True)
+        args["record_har_path"] = har_path_for(request.node.nodeid)
+        args["record_har_content"] = "embed"
+    if _uses_auth_cache(request):
+        cache = request.getfixturevalue("auth_state_cache")
+        args["storage_state"] = cache.get(_login_user(request))
+    return args
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, pytestconfig):
+    """--context-pool 실행 시 컨텍스트 풀 (아니면 None)
+
+    테스트별로 새 컨텍스트가 필요한 --record-har와 pytest-playwright의 --tracing/--video 사용 시에는 비활성화
+    """
+    if not pytestconfig.getoption("context_pool") or pytestconfig.getoption("record_har"):
+        yield None
+        return
+    if pytestconfig.getoption("tracing") != "off" or pytestconfig.getoption("video") != "off":
+        yield None
+        return
+    pool = ContextPool(browser)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def context(request, browser_context_args, context_pool):
+    """테스트용 브라우저 컨텍스트 (컨텍스트 풀 사용 시 초기화된 컨텍스트를 대여, 재시도 시에는 항상 새 컨텍스트)"""
+    if context_pool is None or getattr(request.node, "execution_count", 1) > 1:
+        return request.getfixturevalue("new_context")()
+    pooled = context_pool.acquire(browser_context_args)
+    request.addfinalizer(lambda: context_pool.release(pooled))
+    return pooled.context
+
+
+@pytest.fixture
+def page(request, context, context_pool):
+    """테스트용 페이지 (컨텍스트 풀 사용 시 대여한 컨텍스트의 기본 페이지)"""
+    if context_pool is None or getattr(request.node, "execution_count", 1) > 1:
+        return context.new_page()
+    return context_pool.leased(context).page
+
+
+@pytest.fixture(autouse=True)
+def har_replay(context, har_index):
+    """--replay-har 실행 시 컨텍스트의 모든 요청을 HAR 녹화본으로 응답"""
+    if har_index:
+        har_index.install(context)
+
+
+@pytest.fixture(scope="session")
+def async_runner():
+    """비동기 페이지 객체를 실행하는 백그라운드 이벤트 루프 (session)"""
+    runner = AsyncRunner().start()
+    yield runner
+    runner.stop()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_runner, browser_name, browser_type_launch_args):
+    """async_runner 루프에서 동작하는 비동기 API 브라우저 (session)"""
+    session = AsyncBrowserSession(async_runner, browser_name, browser_type_launch_args).start()
+    yield session.browser
+    session.stop()
+
+
 @pytest.fixture
-def logged_in_page(page: Page):
-    """표준 사용자로 로그인된 상태의 InventoryPage 반환"""
+def async_pages(request, async_runner, async_browser, browser_context_args, har_index):
+    """사용자마다 분리된 컨텍스트의 비동기 페이지 생성기 (await async_pages.new_page())
+
+    HAR 재생과 네트워크 차단 프로필은 동기 컨텍스트와 동일하게 적용된다.
+    """
+    profile = NetworkProfile.for_test(request.node)
+    context_args = {
+        key: value for key, value in browser_context_args.items()
+        if key not in ("storage_state", "record_har_path", "record_har_content")
+    }
+
+    async def prepare_context(context):
+        if har_index:
+            await har_index.install_async(context)
+        await profile.install_async(context)
+
+    factory = AsyncContextFactory(async_browser, context_args, prepare_context)
+    yield factory
+    async_runner.run(factory.close())
+
+
+@pytest.fixture
+def logged_in_page(page: Page, request):
+    """로그인된 상태의 InventoryPage 반환 (캐시가 만료되었으면 UI 로그인으로 대체)"""
+    user = _login_user(request)
+    inventory = InventoryPage(page)
+    if _uses_auth_cache(request):
+        inventory.open()
+        page.wait_for_selector(f"{InventoryPage.INVENTORY_LIST}, {LoginPage.LOGIN_BUTTON}")
+        if inventory.is_present_now(InventoryPage.INVENTORY_LIST):
+            return inventory
+        request.getfixturevalue("auth_state_cache").invalidate(user)
+
     login = LoginPage(page)
     login.open()
-    login.login(Users.STANDARD.username, Users.STANDARD.password)
-    return InventoryPage(page)
+    login.login(user.username, user.password)
+    return inventory
+
+
+@pytest.fixture
+def cart_seeder(page: Page):
+    """UI 대신 브라우저 저장소에 장바구니를 직접 기록하는 CartSeeder 반환"""
+    return CartSeeder(page)
 
 
 @pytest.fixture
@@ -94,17 +391,105 @@ def product_detail_page(page: Page):
     return ProductDetailPage(page)
 
 
+@pytest.fixture(autouse=True)
+def web_vitals_metrics(request, context):
+    """화면 전환마다 Navigation Timing/paint/LCP/CLS/long task를 수집해 Allure에 JSON으로 첨부 (WEB_VITALS 또는 web_vitals 마커)
+
+    수집 결과는 request.node.web_vitals에도 저장되어 다른 fixture/hook에서 사용할 수 있다.
+    """
+    if not Config.WEB_VITALS and request.node.get_closest_marker("web_vitals") is None:
+        yield None
+        return
+    web_vitals.install(context)
+    collector = web_vitals.WebVitalsCollector()
+    request.node.web_vitals = collector.records
+    web_vitals.set_active(collector)
+    try:
+        yield collector
+    finally:
+        web_vitals.set_active(None)
+    if collector.records:
+        allure.attach(collector.to_json(), name="web_vitals", attachment_type=allure.attachment_type.JSON)
+        web_vitals.append_results(Config.WEB_VITALS_FILE, request.node.nodeid, collector.records)
+
+
+@pytest.fixture(autouse=True)
+def action_trace(request):
+    """BasePage 액션(셀렉터, 대기/실행 시간)을 기록해 INSTRUMENT_EXPORTS 형식으로 내보냄 (INSTRUMENT_ACTIONS 또는 instrument_actions 마커)
+
+    기록은 request.node.action_trace에도 저장되어 다른 fixture/hook에서 사용할 수 있다.
+    """
+    if not Config.INSTRUMENT_ACTIONS and request.node.get_closest_marker("instrument_actions") is None:
+        yield None
+        return
+    exports = instrumentation.parse_exports(Config.INSTRUMENT_EXPORTS)
+    tracer = instrumentation.ActionTracer()
+    request.node.action_trace = tracer
+    instrumentation.set_active(tracer)
+    try:
+        yield tracer
+    finally:
+        instrumentation.set_active(None)
+    if not tracer.events:
+        return
+    nodeid = request.node.nodeid
+    if "jsonl" in exports:
+        instrumentation.append_jsonl(Config.INSTRUMENT_FILE, nodeid, tracer)
+    if "trace" in exports:
+        instrumentation.write_chrome_trace(Config.INSTRUMENT_TRACE_DIR, nodeid, tracer)
+    if "allure" in exports:
+        instrumentation.add_allure_steps(tracer)
+
+
+@pytest.fixture(autouse=True)
+def impact_deps(request, action_trace):
+    """테스트가 사용한 페이지 객체 메서드/셀렉터/fixture/data 클래스를 영향 분석 기록에 저장"""
+    analysis = request.config.pluginmanager.get_plugin("impact_analysis")
+    if analysis is None or action_trace is None:
+        # 액션 계측 없이는 페이지 객체 의존성을 알 수 없어 기록하지 않음 (불완전한 기록으로 테스트가 제외되지 않도록)
+        yield None
+        return
+    recorder = impact.DependencyRecorder()
+    action_trace.add_listener(recorder)
+    yield recorder
+    analysis.record(request.node, recorder)
+
+
+@pytest.fixture(scope="session")
+def failure_tracer(pytestconfig):
+    """TRACE_ON_FAILURE 사용 시 컨텍스트별 trace 기록기 (pytest-playwright --tracing 사용 시에는 None)"""
+    if not Config.TRACE_ON_FAILURE or pytestconfig.getoption("tracing") != "off":
+        return None
+    return FailureTracer()
+
+
+@pytest.fixture(autouse=True)
+def failure_trace(request, context, failure_tracer):
+    """테스트마다 trace 구간을 기록하고 setup/call이 실패한 경우에만 zip으로 저장해 Allure에 첨부"""
+    if failure_tracer is None:
+        yield None
+        return
+    node = request.node
+    failure_tracer.begin(context, node.nodeid)
+    yield failure_tracer
+    failed = any(getattr(getattr(node, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+    if not failed:
+        failure_tracer.end(context)
+        return
+    path = trace_path_for(node.nodeid, getattr(node, "execution_count", 1))
+    failure_tracer.end(context, path)
+    if os.path.exists(path):
+        attach_trace(path)
+
+
 @pytest.fixture(autouse=True)
 def capture_screenshot(request, page: Page):
-    """모든 테스트에서 스크린샷 첨부"""
+    """SCREENSHOT_POLICY에 따라 테스트 종료 시 스크린샷 첨부"""
     yield
-    # 테스트 완료 후 항상 스크린샷 저장
-    status = "passed"
-    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
-        status = "failed"
-
-    allure.attach(
-        page.screenshot(full_page=True),
-        name=f"screenshot_{status}",
-        attachment_type=allure.attachment_type.PNG
-    )
+    node = request.node
+    failed = any(getattr(getattr(node, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+    retried = getattr(node, "execution_count", 1) > 1
+
+    # 캡처가 필요한 경우에만 렌더링/인코딩 수행
+    if should_capture(Config.SCREENSHOT_POLICY, failed, retried):
+        attach_screenshot(page, failed)
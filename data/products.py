@@ -0,0 +1,151 @@
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_UP, Decimal
+from typing import NamedTuple
+
+CENT = Decimal("0.01")
+
+# 인벤토리 정렬 옵션 (InventoryLocators.SORT_*)
+SORT_ORDERS = ("az", "za", "lohi", "hilo")
+
+
+@dataclass(frozen=True, slots=True)
+class Product:
+    """상품 데이터 클래스"""
+    id: int
+    name: str
+    price: Decimal
+    description: str
+    image: str
+    slug: str = field(init=False)  # data-test 속성의 상품 ID (예: add-to-cart-sauce-labs-backpack)
+
+    def __post_init__(self):
+        object.__setattr__(self, "slug", self.name.lower().replace(" ", "-"))
+
+
+class OrderTotals(NamedTuple):
+    """주문 확인 페이지의 소계/세금/총액"""
+    subtotal: Decimal
+    tax: Decimal
+    total: Decimal
+
+
+def _sort_orders(products: tuple) -> dict[str, tuple]:
+    """정렬 옵션별 상품 순서 (가격이 같으면 이름순 - 사이트의 안정 정렬과 같음)"""
+    by_name = tuple(sorted(products, key=lambda p: p.name))
+    return {
+        "az": by_name,
+        "za": by_name[::-1],
+        "lohi": tuple(sorted(by_name, key=lambda p: p.price)),
+        "hilo": tuple(sorted(by_name, key=lambda p: -p.price)),
+    }
+
+
+def _subset_totals(products: tuple, tax_rate: Decimal) -> dict[int, OrderTotals]:
+    """상품 ID 비트마스크별 주문 합계 (모든 부분집합)"""
+    totals = {}
+    for mask in range(1 << len(products)):
+        subtotal = sum((p.price for p in products if mask >> p.id & 1), Decimal("0"))
+        tax = (subtotal * tax_rate).quantize(CENT, rounding=ROUND_HALF_UP)
+        totals[mask] = OrderTotals(subtotal, tax, subtotal + tax)
+    return totals
+
+
+class Products:
+    """테스트 상품 데이터 (saucedemo 카탈로그)"""
+
+    TAX_RATE = Decimal("0.08")
+
+    # 상품 정의 (이름 오름차순 = 인벤토리 기본 표시 순서)
+    BACKPACK = Product(
+        id=4,
+        name="Sauce Labs Backpack",
+        price=Decimal("29.99"),
+        description="carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising "
+                    "style with unequaled laptop and tablet protection.",
+        image="sauce-backpack-1200x1500.jpg"
+    )
+
+    BIKE_LIGHT = Product(
+        id=0,
+        name="Sauce Labs Bike Light",
+        price=Decimal("9.99"),
+        description="A red light isn't the desired state in testing but it sure helps when riding your bike "
+                    "at night. Water-resistant with 3 lighting modes, 1 AAA battery included.",
+        image="bike-light-1200x1500.jpg"
+    )
+
+    BOLT_T_SHIRT = Product(
+        id=1,
+        name="Sauce Labs Bolt T-Shirt",
+        price=Decimal("15.99"),
+        description="Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, "
+                    "100% ringspun combed cotton, heather gray with red bolt.",
+        image="bolt-shirt-1200x1500.jpg"
+    )
+
+    FLEECE_JACKET = Product(
+        id=5,
+        name="Sauce Labs Fleece Jacket",
+        price=Decimal("49.99"),
+        description="It's not every day that you come across a midweight quarter-zip fleece jacket capable "
+                    "of handling everything from a relaxing day outdoors to a busy day at the office.",
+        image="sauce-pullover-1200x1500.jpg"
+    )
+
+    ONESIE = Product(
+        id=2,
+        name="Sauce Labs Onesie",
+        price=Decimal("7.99"),
+        description="Rib snap infant onesie for the junior automation engineer in development. Reinforced "
+                    "3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel.",
+        image="red-onesie-1200x1500.jpg"
+    )
+
+    RED_T_SHIRT = Product(
+        id=3,
+        name="Test.allTheThings() T-Shirt (Red)",
+        price=Decimal("15.99"),
+        description="This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to "
+                    "automate a few tests. Super-soft and comfy ringspun combed cotton.",
+        image="red-tatt-1200x1500.jpg"
+    )
+
+    # 인벤토리 기본 표시 순서 (이름 오름차순)
+    ALL = (BACKPACK, BIKE_LIGHT, BOLT_T_SHIRT, FLEECE_JACKET, ONESIE, RED_T_SHIRT)
+
+    # 미리 계산한 기대값: 정렬 옵션별 순서, 모든 상품 조합의 주문 합계
+    SORTED = _sort_orders(ALL)
+    SORTED_NAMES = {order: tuple(p.name for p in products) for order, products in SORTED.items()}
+    SORTED_PRICES = {order: tuple(p.price for p in products) for order, products in SORTED.items()}
+    _TOTALS = _subset_totals(ALL, TAX_RATE)
+    _BY_NAME = {p.name: p for p in ALL}
+    _BY_ID = {p.id: p for p in ALL}
+
+    @classmethod
+    def get_all_products(cls):
+        """모든 상품 목록 반환 (인벤토리 기본 표시 순서)"""
+        return list(cls.ALL)
+
+    @classmethod
+    def get_by_name(cls, name: str) -> Product:
+        """상품 이름으로 상품 반환"""
+        try:
+            return cls._BY_NAME[name]
+        except KeyError:
+            raise KeyError(f"Unknown product: {name}") from None
+
+    @classmethod
+    def get_by_id(cls, product_id: int) -> Product:
+        """상품 ID로 상품 반환"""
+        try:
+            return cls._BY_ID[product_id]
+        except KeyError:
+            raise KeyError(f"Unknown product id: {product_id}") from None
+
+    @classmethod
+    def totals(cls, *products) -> OrderTotals:
+        """상품(Product 또는 이름) 조합의 주문 합계 (같은 상품은 한 번만 계산)"""
+        mask = 0
+        for product in products:
+            mask |= 1 << (cls.get_by_name(product) if isinstance(product, str) else product).id
+        return cls._TOTALS[mask]
@@ -22,6 +22,7 @@ class User:
     description: str
     can_login: bool = True
     expected_error: Optional[str] = None
+    login_budget_ms: Optional[float] = None  # 로그인 지연 시간 예산 (None이면 LoginPage 기본 예산)
 
 
 class Users:
@@ -60,7 +61,8 @@ class Users:
         password=PASSWORD,
         user_type=UserType.PERFORMANCE_GLITCH,
         description="성능 문제가 있는 사용자 - 응답이 느림",
-        can_login=True
+        can_login=True,
+        login_budget_ms=10000
     )
 
     ERROR = User(
@@ -91,6 +93,14 @@ class Users:
             cls.VISUAL
         ]
 
+    @classmethod
+    def get_by_username(cls, username: str) -> User:
+        """사용자명으로 사용자 반환"""
+        for user in cls.get_all_users():
+            if user.username == username:
+                return user
+        raise KeyError(f"Unknown user: {username}")
+
     @classmethod
     def get_valid_users(cls):
         """로그인 가능한 사용자 목록 반환"""
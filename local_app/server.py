@@ -0,0 +1,190 @@
+"""SauceDemo 대체 로컬 서버
+
+페이지 객체가 사용하는 화면(로그인, 인벤토리, 상품 상세, 장바구니, 체크아웃 1/2단계, 완료)을
+정적 SPA로 제공한다. 특수 사용자(data/users.py)의 동작을 흉내 내며, 응답 지연을 설정해
+performance_glitch_user 상황을 결정적으로 재현할 수 있다.
+
+    python -m local_app.server --port 8000 --latency-ms 50 --glitch-ms 3000
+"""
+import argparse
+import base64
+import json
+import os
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from data.products import Products
+from data.users import Users, UserType
+from utils.config import Config
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# SPA 셸(shell.html)을 돌려주는 화면 경로
+PAGE_PATHS = {
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+}
+
+STATIC_FILES = {
+    "/app.js": ("app.js", "application/javascript; charset=utf-8"),
+    "/app.css": ("app.css", "text/css; charset=utf-8"),
+}
+
+# 상품 이미지 대신 제공하는 1x1 PNG
+PLACEHOLDER_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+SESSION_COOKIE = "session-username"
+
+
+def build_app_data(glitch_ms: int) -> dict:
+    """클라이언트(app.js)에 전달할 상품/사용자/설정 데이터"""
+    return {
+        "products": [
+            {
+                "id": p.id,
+                "name": p.name,
+                "price": float(p.price),
+                "description": p.description,
+                "image": p.image,
+            }
+            for p in Products.get_all_products()
+        ],
+        "users": {
+            u.username: {"can_login": u.can_login, "expected_error": u.expected_error}
+            for u in Users.get_all_users()
+        },
+        "password": Users.PASSWORD,
+        "taxRate": float(Products.TAX_RATE),
+        "glitchDelayMs": glitch_ms,
+    }
+
+
+class LocalApp:
+    """SauceDemo 대체 로컬 서버 (백그라운드 스레드에서 실행)"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = None,
+                 latency_ms: int = None, glitch_ms: int = None):
+        self.host = host
+        self.port = Config.LOCAL_APP_PORT if port is None else port
+        self.latency_ms = Config.LOCAL_APP_LATENCY_MS if latency_ms is None else latency_ms
+        self.glitch_ms = Config.LOCAL_APP_GLITCH_MS if glitch_ms is None else glitch_ms
+        self._files = self._load_static_files()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host = "127.0.0.1" if self.host in ("", "0.0.0.0") else self.host
+        return f"http://{host}:{self.port}"
+
+    def start(self) -> "LocalApp":
+        """서버 시작 (port=0이면 빈 포트 자동 할당)"""
+        handler = type("LocalAppHandler", (_Handler,), {"app": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-app", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (CLI용)"""
+        self.start()
+        try:
+            self._thread.join()
+        except KeyboardInterrupt:
+            self.stop()
+
+    def delay_for(self, path: str, username: str) -> float:
+        """요청 지연 시간(초) - 모든 요청에 latency_ms, performance_glitch_user의 화면 요청에는 glitch_ms 추가"""
+        delay = self.latency_ms
+        if path in PAGE_PATHS and username == UserType.PERFORMANCE_GLITCH.value:
+            delay += self.glitch_ms
+        return delay / 1000
+
+    def config_script(self) -> bytes:
+        data = json.dumps(build_app_data(self.glitch_ms), ensure_ascii=False)
+        return f"window.APP_DATA = {data};\n".encode("utf-8")
+
+    def static_file(self, name: str) -> bytes:
+        return self._files[name]
+
+    @staticmethod
+    def _load_static_files() -> dict[str, bytes]:
+        files = {}
+        for name in ["shell.html"] + [name for name, _ in STATIC_FILES.values()]:
+            with open(os.path.join(STATIC_DIR, name), "rb") as f:
+                files[name] = f.read()
+        return files
+
+
+class _Handler(BaseHTTPRequestHandler):
+    app: LocalApp = None
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        delay = self.app.delay_for(path, self._session_user())
+        if delay:
+            time.sleep(delay)
+
+        if path in PAGE_PATHS:
+            self._send(self.app.static_file("shell.html"), "text/html; charset=utf-8")
+        elif path in STATIC_FILES:
+            name, content_type = STATIC_FILES[path]
+            self._send(self.app.static_file(name), content_type)
+        elif path == "/config.js":
+            self._send(self.app.config_script(), "application/javascript; charset=utf-8")
+        elif path.startswith("/static/media/"):
+            self._send(PLACEHOLDER_PNG, "image/png")
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass  # 테스트 출력이 요청 로그로 뒤덮이지 않도록 생략
+
+    def _session_user(self) -> str:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else ""
+
+    def _send(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SauceDemo 대체 로컬 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=int, default=None, help="모든 요청에 추가할 지연 (ms)")
+    parser.add_argument("--glitch-ms", type=int, default=None, help="performance_glitch_user 지연 (ms)")
+    args = parser.parse_args()
+
+    app = LocalApp(args.host, args.port, args.latency_ms, args.glitch_ms)
+    print(f"Serving SauceDemo stand-in on {app.host}:{app.port}")
+    app.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
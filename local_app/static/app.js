@@ -0,0 +1,453 @@
+// SauceDemo 대체 SPA - 페이지 객체가 사용하는 DOM 구조/셀렉터를 실제 사이트와 동일하게 유지한다.
+(function () {
+    "use strict";
+
+    const DATA = window.APP_DATA;
+    const SESSION_COOKIE = "session-username";
+    const CART_KEY = "cart-contents";
+    const PROTECTED_PATHS = [
+        "/inventory.html",
+        "/inventory-item.html",
+        "/cart.html",
+        "/checkout-step-one.html",
+        "/checkout-step-two.html",
+        "/checkout-complete.html",
+    ];
+    const SORTS = {
+        az: (a, b) => a.name.localeCompare(b.name),
+        za: (a, b) => b.name.localeCompare(a.name),
+        lohi: (a, b) => a.price - b.price,
+        hilo: (a, b) => b.price - a.price,
+    };
+
+    const root = document.getElementById("root");
+    const state = {
+        sort: "az",
+        menuOpen: false,
+        login: { username: "", password: "", error: "" },
+        checkout: { firstName: "", lastName: "", postalCode: "", error: "" },
+    };
+
+    // ---- 세션 / 장바구니 (실제 사이트와 같은 쿠키, localStorage 키 사용) ----
+
+    function currentUser() {
+        const match = document.cookie.match(/(?:^|;\s*)session-username=([^;]*)/);
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setSession(username) {
+        document.cookie = `${SESSION_COOKIE}=${encodeURIComponent(username)}; path=/; max-age=600`;
+    }
+
+    function clearSession() {
+        document.cookie = `${SESSION_COOKIE}=; path=/; max-age=0`;
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        localStorage.setItem(CART_KEY, JSON.stringify(ids));
+    }
+
+    // ---- 유틸 ----
+
+    function h(tag, attrs, ...children) {
+        const el = document.createElement(tag);
+        for (const [key, value] of Object.entries(attrs || {})) {
+            if (value === null || value === undefined || value === false) continue;
+            if (key.startsWith("on")) el.addEventListener(key.slice(2), value);
+            else if (key === "className") el.className = value;
+            else if (key === "value") el.value = value;
+            else el.setAttribute(key, value);
+        }
+        for (const child of children.flat()) {
+            if (child === null || child === undefined || child === false) continue;
+            el.append(child instanceof Node ? child : String(child));
+        }
+        return el;
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/ /g, "-");
+    }
+
+    function money(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    function findProduct(id) {
+        return DATA.products.find((p) => p.id === id);
+    }
+
+    function imageSrc(product, index) {
+        const user = currentUser();
+        if (user === "problem_user" || (user === "visual_user" && index === 0)) {
+            return "/static/media/sl-404.jpg";
+        }
+        return "/static/media/" + product.image;
+    }
+
+    function detailPath(product) {
+        return `/inventory-item.html?id=${product.id}`;
+    }
+
+    function go(path) {
+        history.pushState(null, "", path);
+        render();
+    }
+
+    function link(path) {
+        return (event) => {
+            event.preventDefault();
+            go(path);
+        };
+    }
+
+    function errorBox(message, onClose) {
+        return h("div", { className: "error-message-container" + (message ? " error" : "") },
+            message ? h("h3", { "data-test": "error" },
+                h("button", { className: "error-button", type: "button", "data-test": "error-button",
+                              "aria-label": "close error", onclick: onClose }),
+                message) : null);
+    }
+
+    // ---- 동작 ----
+
+    function login(username, password) {
+        Object.assign(state.login, { username, password });
+        const user = DATA.users[username];
+        let error = "";
+        if (!username) error = "Epic sadface: Username is required";
+        else if (!password) error = "Epic sadface: Password is required";
+        else if (!user || password !== DATA.password) {
+            error = "Epic sadface: Username and password do not match any user in this service";
+        } else if (!user.can_login) error = user.expected_error;
+
+        state.login.error = error;
+        if (error) return render();
+
+        state.login = { username: "", password: "", error: "" };
+        setSession(username);
+        if (username === "performance_glitch_user" && DATA.glitchDelayMs) {
+            setTimeout(() => go("/inventory.html"), DATA.glitchDelayMs);
+        } else {
+            go("/inventory.html");
+        }
+    }
+
+    function toggleCart(id) {
+        const cart = getCart();
+        if (cart.includes(id)) {
+            if (currentUser() === "error_user") return;  // error_user는 장바구니에서 제거가 되지 않음
+            setCart(cart.filter((x) => x !== id));
+        } else {
+            setCart([...cart, id]);
+        }
+        render();
+    }
+
+    function changeSort(value) {
+        if (currentUser() === "error_user") {
+            alert("Sorting is broken! This error has been reported to Backtrace.");
+        } else {
+            state.sort = value;
+        }
+        render();
+    }
+
+    function setMenu(open) {
+        state.menuOpen = open;
+        render();
+    }
+
+    function continueCheckout() {
+        const info = state.checkout;
+        const missing = !info.firstName ? "First Name"
+            : !info.lastName ? "Last Name"
+            : !info.postalCode ? "Postal Code" : null;
+        info.error = missing ? `Error: ${missing} is required` : "";
+        if (missing) return render();
+        go("/checkout-step-two.html");
+    }
+
+    function finishCheckout() {
+        if (currentUser() === "error_user") return;  // error_user는 주문 완료가 되지 않음
+        setCart([]);
+        go("/checkout-complete.html");
+    }
+
+    // ---- 공통 레이아웃 ----
+
+    function menu() {
+        const menuLink = (id, text, onclick, href) =>
+            h("a", { id, className: "bm-item menu-item", "data-test": id.replace(/_/g, "-"), href: href || "#", onclick }, text);
+        return h("div", { className: "bm-menu-wrap", "aria-hidden": String(!state.menuOpen),
+                          style: state.menuOpen ? null : "display: none" },
+            h("nav", { className: "bm-item-list" },
+                menuLink("inventory_sidebar_link", "All Items", (e) => {
+                    e.preventDefault();
+                    state.menuOpen = false;
+                    go("/inventory.html");
+                }),
+                menuLink("about_sidebar_link", "About", null, "https://saucelabs.com/"),
+                menuLink("logout_sidebar_link", "Logout", (e) => {
+                    e.preventDefault();
+                    state.menuOpen = false;
+                    clearSession();
+                    go("/");
+                }),
+                menuLink("reset_sidebar_link", "Reset App State", (e) => {
+                    e.preventDefault();
+                    setCart([]);
+                    render();
+                })),
+            h("div", { className: "bm-cross-button" },
+                h("button", { id: "react-burger-cross-btn", type: "button", onclick: () => setMenu(false) }, "Close Menu")));
+    }
+
+    function header(title, secondary) {
+        const count = getCart().length;
+        const cartClass = "shopping_cart_link" + (currentUser() === "visual_user" ? " visual_failure" : "");
+        return h("div", { id: "header_container", className: "header_container" },
+            h("div", { className: "primary_header" },
+                h("div", { id: "menu_button_container" },
+                    h("div", { className: "bm-burger-button" },
+                        h("button", { id: "react-burger-menu-btn", type: "button", onclick: () => setMenu(true) }, "Open Menu")),
+                    menu()),
+                h("div", { className: "header_label" }, h("div", { className: "app_logo" }, "Swag Labs")),
+                h("div", { id: "shopping_cart_container", className: "shopping_cart_container" },
+                    h("a", { className: cartClass, "data-test": "shopping-cart-link", href: "/cart.html", onclick: link("/cart.html") },
+                        count ? h("span", { className: "shopping_cart_badge", "data-test": "shopping-cart-badge" }, count) : null))),
+            h("div", { className: "header_secondary_container" },
+                title ? h("span", { className: "title", "data-test": "title" }, title) : null,
+                secondary || null));
+    }
+
+    function footer() {
+        const social = (name, href, text) =>
+            h("li", { className: `social_${name}` }, h("a", { href, target: "_blank", rel: "noreferrer", "data-test": `social-${name}` }, text));
+        return h("footer", { className: "footer", "data-test": "footer" },
+            h("ul", { className: "social" },
+                social("twitter", "https://twitter.com/saucelabs", "Twitter"),
+                social("facebook", "https://www.facebook.com/saucelabs", "Facebook"),
+                social("linkedin", "https://www.linkedin.com/company/sauce-labs/", "LinkedIn")),
+            h("div", { className: "footer_copy" }, "© 2026 Sauce Labs. All Rights Reserved. Terms of Service | Privacy Policy"));
+    }
+
+    function layout(title, content, secondary) {
+        return h("div", { id: "page_wrapper", className: "page_wrapper" },
+            h("div", { id: "contents_wrapper" }, header(title, secondary), content),
+            footer());
+    }
+
+    function cartButton(product, detail) {
+        const inCart = getCart().includes(product.id);
+        const action = inCart ? "remove" : "add-to-cart";
+        const id = detail ? action : `${action}-${slug(product.name)}`;
+        return h("button", {
+            className: "btn btn_small btn_inventory " + (inCart ? "btn_secondary" : "btn_primary"),
+            "data-test": id, id, name: id, onclick: () => toggleCart(product.id),
+        }, inCart ? "Remove" : "Add to cart");
+    }
+
+    function cartItem(product, withButton) {
+        return h("div", { className: "cart_item", "data-test": "inventory-item" },
+            h("div", { className: "cart_quantity", "data-test": "item-quantity" }, "1"),
+            h("div", { className: "cart_item_label" },
+                h("a", { href: "#", id: `item_${product.id}_title_link`, onclick: link(detailPath(product)) },
+                    h("div", { className: "inventory_item_name", "data-test": "inventory-item-name" }, product.name)),
+                h("div", { className: "inventory_item_desc", "data-test": "inventory-item-desc" }, product.description),
+                h("div", { className: "item_pricebar" },
+                    h("div", { className: "inventory_item_price", "data-test": "inventory-item-price" }, money(product.price)),
+                    withButton ? cartButton(product) : null)));
+    }
+
+    function cartList(products, withButton) {
+        return h("div", { className: "cart_list", "data-test": "cart-list" },
+            h("div", { className: "cart_quantity_label" }, "QTY"),
+            h("div", { className: "cart_desc_label" }, "Description"),
+            products.map((p) => cartItem(p, withButton)));
+    }
+
+    function cartProducts() {
+        return getCart().map(findProduct).filter(Boolean);
+    }
+
+    // ---- 화면 ----
+
+    function loginPage() {
+        const form = state.login;
+        const input = (id, type, placeholder) => h("input", {
+            className: "input_error form_input", id, name: id, type, placeholder,
+            "data-test": id === "user-name" ? "username" : id, value: form[id === "user-name" ? "username" : id],
+        });
+        const username = input("user-name", "text", "Username");
+        const password = input("password", "password", "Password");
+        return h("div", { className: "login_container" },
+            h("div", { className: "login_logo" }, "Swag Labs"),
+            h("div", { className: "login_wrapper" },
+                h("form", { onsubmit: (e) => { e.preventDefault(); login(username.value, password.value); } },
+                    h("div", { className: "form_group" }, username),
+                    h("div", { className: "form_group" }, password),
+                    errorBox(form.error, () => { form.error = ""; render(); }),
+                    h("input", { type: "submit", className: "submit-button btn_action", "data-test": "login-button",
+                                 id: "login-button", name: "login-button", value: "Login" }))));
+    }
+
+    function inventoryPage() {
+        const products = DATA.products.slice().sort(SORTS[state.sort]);
+        const select = h("select", { className: "product_sort_container", "data-test": "product-sort-container",
+                                     onchange: (e) => changeSort(e.target.value) },
+            h("option", { value: "az" }, "Name (A to Z)"),
+            h("option", { value: "za" }, "Name (Z to A)"),
+            h("option", { value: "lohi" }, "Price (low to high)"),
+            h("option", { value: "hilo" }, "Price (high to low)"));
+        select.value = state.sort;
+
+        const item = (product, index) => h("div", { className: "inventory_item", "data-test": "inventory-item" },
+            h("div", { className: "inventory_item_img" },
+                h("a", { href: "#", id: `item_${product.id}_img_link`, onclick: link(detailPath(product)) },
+                    h("img", { alt: product.name, className: "inventory_item_img", src: imageSrc(product, index) }))),
+            h("div", { className: "inventory_item_description" },
+                h("div", { className: "inventory_item_label" },
+                    h("a", { href: "#", id: `item_${product.id}_title_link`, onclick: link(detailPath(product)) },
+                        h("div", { className: "inventory_item_name", "data-test": "inventory-item-name" }, product.name)),
+                    h("div", { className: "inventory_item_desc", "data-test": "inventory-item-desc" }, product.description)),
+                h("div", { className: "pricebar" },
+                    h("div", { className: "inventory_item_price", "data-test": "inventory-item-price" }, money(product.price)),
+                    cartButton(product))));
+
+        return layout("Products",
+            h("div", { id: "inventory_container", className: "inventory_container" },
+                h("div", { className: "inventory_list", "data-test": "inventory-list" }, products.map(item))),
+            h("div", { className: "right_component" }, select));
+    }
+
+    function detailPage() {
+        const product = findProduct(Number(new URLSearchParams(location.search).get("id")));
+        const back = h("button", { className: "btn btn_secondary back", "data-test": "back-to-products",
+                                   id: "back-to-products", onclick: () => go("/inventory.html") }, "Back to products");
+        if (!product) {
+            return layout(null, h("div", { className: "inventory_details" }, "ITEM NOT FOUND"), back);
+        }
+        return layout(null,
+            h("div", { className: "inventory_details", "data-test": "inventory-container" },
+                h("div", { className: "inventory_details_container" },
+                    h("div", { className: "inventory_details_img_container" },
+                        h("img", { alt: product.name, className: "inventory_details_img", src: imageSrc(product, -1) })),
+                    h("div", { className: "inventory_details_desc_container" },
+                        h("div", { className: "inventory_details_name large_size", "data-test": "inventory-item-name" }, product.name),
+                        h("div", { className: "inventory_details_desc large_size", "data-test": "inventory-item-desc" }, product.description),
+                        h("div", { className: "inventory_details_price", "data-test": "inventory-item-price" }, money(product.price)),
+                        cartButton(product, true)))),
+            back);
+    }
+
+    function cartPage() {
+        return layout("Your Cart",
+            h("div", { id: "cart_contents_container", className: "cart_contents_container" },
+                cartList(cartProducts(), true),
+                h("div", { className: "cart_footer" },
+                    h("button", { className: "btn btn_secondary back btn_medium", "data-test": "continue-shopping",
+                                  id: "continue-shopping", onclick: () => go("/inventory.html") }, "Continue Shopping"),
+                    h("button", { className: "btn btn_action btn_medium checkout_button", "data-test": "checkout", id: "checkout",
+                                  onclick: () => {
+                                      state.checkout = { firstName: "", lastName: "", postalCode: "", error: "" };
+                                      go("/checkout-step-one.html");
+                                  } }, "Checkout"))));
+    }
+
+    function checkoutStepOnePage() {
+        const info = state.checkout;
+        const input = (key, placeholder) => h("input", {
+            className: "input_error form_input", type: "text", placeholder, "data-test": key, id: key, name: key,
+            value: info[key],
+            oninput: (e) => {
+                // error_user는 성(lastName)을 입력할 수 없음
+                if (key === "lastName" && currentUser() === "error_user") e.target.value = "";
+                info[key] = e.target.value;
+            },
+        });
+        return layout("Checkout: Your Information",
+            h("div", { className: "checkout_info_container" },
+                h("form", { onsubmit: (e) => { e.preventDefault(); continueCheckout(); } },
+                    h("div", { className: "checkout_info" },
+                        input("firstName", "First Name"),
+                        input("lastName", "Last Name"),
+                        input("postalCode", "Zip/Postal Code"),
+                        errorBox(info.error, () => { info.error = ""; render(); })),
+                    h("div", { className: "checkout_buttons" },
+                        h("button", { type: "button", className: "btn btn_secondary back btn_medium cart_cancel_link",
+                                      "data-test": "cancel", id: "cancel", onclick: () => go("/cart.html") }, "Cancel"),
+                        h("input", { type: "submit", className: "submit-button btn btn_primary cart_button btn_action",
+                                     "data-test": "continue", id: "continue", name: "continue", value: "Continue" })))));
+    }
+
+    function checkoutStepTwoPage() {
+        const products = cartProducts();
+        const subtotal = products.reduce((sum, p) => sum + p.price, 0);
+        const tax = Number((subtotal * DATA.taxRate).toFixed(2));
+        return layout("Checkout: Overview",
+            h("div", { id: "checkout_summary_container", className: "checkout_summary_container" },
+                cartList(products, false),
+                h("div", { className: "summary_info" },
+                    h("div", { className: "summary_info_label" }, "Payment Information:"),
+                    h("div", { className: "summary_value_label", "data-test": "payment-info-value" }, "SauceCard #31337"),
+                    h("div", { className: "summary_info_label" }, "Shipping Information:"),
+                    h("div", { className: "summary_value_label", "data-test": "shipping-info-value" }, "Free Pony Express Delivery!"),
+                    h("div", { className: "summary_info_label" }, "Price Total"),
+                    h("div", { className: "summary_subtotal_label", "data-test": "subtotal-label" }, "Item total: " + money(subtotal)),
+                    h("div", { className: "summary_tax_label", "data-test": "tax-label" }, "Tax: " + money(tax)),
+                    h("div", { className: "summary_total_label", "data-test": "total-label" }, "Total: " + money(subtotal + tax)),
+                    h("div", { className: "cart_footer" },
+                        h("button", { className: "btn btn_secondary back btn_medium cart_cancel_link", "data-test": "cancel",
+                                      id: "cancel", onclick: () => go("/inventory.html") }, "Cancel"),
+                        h("button", { className: "btn btn_action btn_medium cart_button", "data-test": "finish", id: "finish",
+                                      onclick: finishCheckout }, "Finish")))));
+    }
+
+    function checkoutCompletePage() {
+        return layout("Checkout: Complete!",
+            h("div", { id: "checkout_complete_container", className: "checkout_complete_container", "data-test": "checkout-complete-container" },
+                h("img", { alt: "Pony Express", className: "pony_express", "data-test": "pony-express", src: "/static/media/pony-express.png" }),
+                h("h2", { className: "complete-header", "data-test": "complete-header" }, "Thank you for your order!"),
+                h("div", { className: "complete-text", "data-test": "complete-text" },
+                    "Your order has been dispatched, and will arrive just as fast as the pony can get there!"),
+                h("button", { className: "btn btn_primary btn_small", "data-test": "back-to-products", id: "back-to-products",
+                              onclick: () => go("/inventory.html") }, "Back Home")));
+    }
+
+    const PAGES = {
+        "/": loginPage,
+        "/index.html": loginPage,
+        "/inventory.html": inventoryPage,
+        "/inventory-item.html": detailPage,
+        "/cart.html": cartPage,
+        "/checkout-step-one.html": checkoutStepOnePage,
+        "/checkout-step-two.html": checkoutStepTwoPage,
+        "/checkout-complete.html": checkoutCompletePage,
+    };
+
+    function render() {
+        const path = location.pathname;
+        if (PROTECTED_PATHS.includes(path) && !currentUser()) {
+            state.login.error = `Epic sadface: You can only access '${path}' when you are logged in.`;
+            history.replaceState(null, "", "/");
+            return render();
+        }
+        if (path === "/" && currentUser() && !state.login.error) {
+            history.replaceState(null, "", "/inventory.html");
+            return render();
+        }
+        root.replaceChildren((PAGES[path] || loginPage)());
+    }
+
+    window.addEventListener("popstate", render);
+    render();
+})();
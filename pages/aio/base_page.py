@@ -0,0 +1,122 @@
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from pages.locators import BaseLocators
+from utils.config import Config
+
+
+class BasePage(BaseLocators):
+    """모든 비동기 페이지 객체의 기본 클래스 (pages/base_page.py와 같은 메서드 이름)"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.page.set_default_timeout(Config.DEFAULT_TIMEOUT)
+        self.page.set_default_navigation_timeout(Config.PAGE_LOAD_TIMEOUT)
+
+    async def navigate(self, url: str):
+        """URL로 이동"""
+        await self.page.goto(url)
+        return self
+
+    async def click(self, selector: str):
+        """요소 클릭"""
+        await self.page.click(selector)
+        return self
+
+    async def fill(self, selector: str, text: str):
+        """텍스트 입력"""
+        await self.page.fill(selector, text)
+        return self
+
+    async def get_text(self, selector: str) -> str:
+        """요소의 텍스트 반환"""
+        return await self.page.text_content(selector) or ""
+
+    async def is_visible(self, selector: str, timeout: int = None) -> bool:
+        """요소가 보이는지 확인"""
+        try:
+            await self.page.wait_for_selector(
+                selector,
+                state="visible",
+                timeout=timeout or Config.DEFAULT_TIMEOUT
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def is_hidden(self, selector: str, timeout: int = None) -> bool:
+        """요소가 사라질 때까지 대기 (이미 없거나 숨겨져 있으면 즉시 True)"""
+        try:
+            await self.page.wait_for_selector(
+                selector,
+                state="hidden",
+                timeout=timeout or Config.DEFAULT_TIMEOUT
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def is_present_now(self, selector: str) -> bool:
+        """요소가 현재 DOM에 있는지 확인 (대기하지 않음)"""
+        return await self.page.locator(selector).count() > 0
+
+    async def is_visible_now(self, selector: str) -> bool:
+        """요소가 현재 보이는지 확인 (대기하지 않음)"""
+        return await self.page.locator(selector).first.is_visible()
+
+    async def wait_for_selector(self, selector: str, state: str = "visible"):
+        """요소 대기"""
+        await self.page.wait_for_selector(selector, state=state)
+        return self
+
+    async def get_elements(self, selector: str):
+        """여러 요소 반환"""
+        return await self.page.locator(selector).all()
+
+    async def read_all(self, *specs) -> list[list[str]]:
+        """여러 셀렉터의 텍스트/속성 값을 한 번의 evaluate로 읽어 반환"""
+        return await self.page.evaluate(self._BULK_READ_SCRIPT, self._bulk_read_args(specs))
+
+    async def get_all_texts(self, selector: str) -> list[str]:
+        """셀렉터에 해당하는 모든 요소의 텍스트 반환"""
+        return (await self.read_all(selector))[0]
+
+    async def get_all_attributes(self, selector: str, attribute: str) -> list[str]:
+        """셀렉터에 해당하는 모든 요소의 속성 값 반환"""
+        return (await self.read_all((selector, attribute)))[0]
+
+    async def read_records(self, container: str, fields: dict) -> list[dict]:
+        """컨테이너 요소마다 필드 값을 읽어 dict 목록으로 반환 (evaluate 1회)"""
+        return (await self.read_record_sets({"records": (container, fields)}))["records"]
+
+    async def read_record_sets(self, sets: dict) -> dict[str, list[dict]]:
+        """여러 컨테이너의 레코드를 한 번의 evaluate로 읽어 반환 ({키: (컨테이너, fields)})"""
+        return await self.page.evaluate(self._RECORD_READ_SCRIPT, self._record_sets_args(sets))
+
+    async def get_element_count(self, selector: str) -> int:
+        """요소 개수 반환"""
+        return await self.page.locator(selector).count()
+
+    def get_current_url(self) -> str:
+        """현재 URL 반환"""
+        return self.page.url
+
+    async def get_title(self) -> str:
+        """페이지 타이틀 반환"""
+        return await self.page.title()
+
+    async def take_screenshot(self, path: str):
+        """스크린샷 저장"""
+        await self.page.screenshot(path=path)
+
+    async def get_screenshot_bytes(self) -> bytes:
+        """스크린샷 바이트 반환"""
+        return await self.page.screenshot()
+
+    async def get_page_title(self) -> str:
+        """페이지 상단 타이틀 텍스트 반환"""
+        return await self.get_text(self.PAGE_TITLE)
+
+    async def get_cart_badge_count(self) -> int:
+        """장바구니 배지 숫자 반환 (헤더 렌더링 후 대기 없이 확인)"""
+        await self.page.wait_for_selector(self.SHOPPING_CART_LINK, state="attached")
+        texts = await self.get_all_texts(self.SHOPPING_CART_BADGE)
+        return int(texts[0]) if texts and texts[0] else 0
@@ -0,0 +1,77 @@
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.locators import CartLocators
+from pages.records import CartItemRecord
+from utils.config import Config
+
+
+class CartPage(BasePage, CartLocators):
+    """장바구니 페이지 객체 (비동기)"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}{self.PATH}"
+
+    async def open(self):
+        """장바구니 페이지 열기"""
+        await self.navigate(self.url)
+        return self
+
+    async def is_cart_page(self) -> bool:
+        """현재 페이지가 장바구니 페이지인지 확인"""
+        return await self.is_visible(self.CART_LIST, timeout=5000)
+
+    async def get_cart_item_count(self) -> int:
+        """장바구니 아이템 개수 반환"""
+        return await self.get_element_count(self.CART_ITEM)
+
+    async def get_item_names(self) -> list[str]:
+        """장바구니 내 모든 아이템 이름 반환"""
+        return await self.get_all_texts(self.CART_ITEM_NAME)
+
+    async def get_item_prices(self) -> list[str]:
+        """장바구니 내 모든 아이템 가격 반환"""
+        return await self.get_all_texts(self.CART_ITEM_PRICE)
+
+    async def get_item_quantities(self) -> list[int]:
+        """장바구니 내 모든 아이템 수량 반환"""
+        return [int(text or "0") for text in await self.get_all_texts(self.CART_ITEM_QUANTITY)]
+
+    async def snapshot(self) -> list[CartItemRecord]:
+        """장바구니 아이템 상태를 한 번에 읽어 반환"""
+        rows = await self.read_records(self.CART_ITEM, self.SNAPSHOT_FIELDS)
+        return [CartItemRecord.from_row(row) for row in rows]
+
+    async def remove_item_by_index(self, index: int = 0):
+        """인덱스로 아이템 제거"""
+        buttons = await self.page.locator(self.REMOVE_BUTTON).all()
+        if index < len(buttons):
+            await buttons[index].click()
+        return self
+
+    async def remove_item_by_name(self, item_name: str):
+        """이름으로 아이템 제거"""
+        remove_selector = f"[data-test='remove-{self._item_name_to_id(item_name)}']"
+        await self.page.wait_for_selector(self.CART_LIST, state="attached")
+        if await self.is_visible_now(remove_selector):
+            await self.click(remove_selector)
+        return self
+
+    async def click_continue_shopping(self):
+        """쇼핑 계속하기 버튼 클릭"""
+        await self.click(self.CONTINUE_SHOPPING_BUTTON)
+        return self
+
+    async def click_checkout(self):
+        """체크아웃 버튼 클릭"""
+        await self.click(self.CHECKOUT_BUTTON)
+        return self
+
+    async def is_cart_empty(self) -> bool:
+        """장바구니가 비어있는지 확인"""
+        return await self.get_cart_item_count() == 0
+
+    async def get_item_description_by_index(self, index: int = 0) -> str:
+        """인덱스로 아이템 설명 반환"""
+        descriptions = await self.get_all_texts(self.CART_ITEM_DESC)
+        return descriptions[index] if index < len(descriptions) else ""
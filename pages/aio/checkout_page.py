@@ -0,0 +1,159 @@
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.locators import CheckoutStepOneLocators, CheckoutStepTwoLocators, CheckoutCompleteLocators
+from pages.records import OrderSnapshot
+from utils.config import Config
+
+
+class CheckoutStepOnePage(BasePage, CheckoutStepOneLocators):
+    """체크아웃 1단계 - 정보 입력 페이지 (비동기)"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}{self.PATH}"
+
+    async def is_checkout_step_one_page(self) -> bool:
+        """현재 페이지가 체크아웃 1단계인지 확인"""
+        return await self.is_visible(self.FIRST_NAME_INPUT, timeout=5000)
+
+    async def enter_first_name(self, first_name: str):
+        """이름 입력"""
+        await self.fill(self.FIRST_NAME_INPUT, first_name)
+        return self
+
+    async def enter_last_name(self, last_name: str):
+        """성 입력"""
+        await self.fill(self.LAST_NAME_INPUT, last_name)
+        return self
+
+    async def enter_postal_code(self, postal_code: str):
+        """우편번호 입력"""
+        await self.fill(self.POSTAL_CODE_INPUT, postal_code)
+        return self
+
+    async def fill_checkout_info(self, first_name: str, last_name: str, postal_code: str):
+        """체크아웃 정보 모두 입력"""
+        await self.enter_first_name(first_name)
+        await self.enter_last_name(last_name)
+        await self.enter_postal_code(postal_code)
+        return self
+
+    async def click_continue(self):
+        """계속 버튼 클릭"""
+        await self.click(self.CONTINUE_BUTTON)
+        return self
+
+    async def click_cancel(self):
+        """취소 버튼 클릭"""
+        await self.click(self.CANCEL_BUTTON)
+        return self
+
+    async def is_error_displayed(self) -> bool:
+        """에러 메시지가 표시되는지 확인"""
+        return await self.is_visible(self.ERROR_MESSAGE, timeout=3000)
+
+    async def get_error_message(self) -> str:
+        """에러 메시지 텍스트 반환"""
+        return await self.get_text(self.ERROR_MESSAGE)
+
+    async def close_error(self):
+        """에러 메시지 닫기"""
+        await self.click(self.ERROR_BUTTON)
+        return self
+
+
+class CheckoutStepTwoPage(BasePage, CheckoutStepTwoLocators):
+    """체크아웃 2단계 - 주문 확인 페이지 (비동기)"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}{self.PATH}"
+
+    async def is_checkout_step_two_page(self) -> bool:
+        """현재 페이지가 체크아웃 2단계인지 확인"""
+        return await self.is_visible(self.SUMMARY_INFO, timeout=5000)
+
+    async def get_cart_item_count(self) -> int:
+        """장바구니 아이템 개수 반환"""
+        return await self.get_element_count(self.CART_ITEM)
+
+    async def get_item_names(self) -> list[str]:
+        """모든 아이템 이름 반환"""
+        return await self.get_all_texts(self.CART_ITEM_NAME)
+
+    async def get_item_prices(self) -> list[str]:
+        """모든 아이템 가격 반환"""
+        return await self.get_all_texts(self.CART_ITEM_PRICE)
+
+    async def snapshot(self) -> OrderSnapshot:
+        """주문 아이템과 소계/세금/총액을 한 번에 읽어 반환"""
+        return OrderSnapshot.from_sets(await self.read_record_sets(self.SNAPSHOT_SETS))
+
+    async def get_subtotal(self) -> str:
+        """소계 반환"""
+        text = await self.get_text(self.SUMMARY_SUBTOTAL)
+        return text.replace("Item total: ", "") if text else ""
+
+    async def get_tax(self) -> str:
+        """세금 반환"""
+        text = await self.get_text(self.SUMMARY_TAX)
+        return text.replace("Tax: ", "") if text else ""
+
+    async def get_total(self) -> str:
+        """총액 반환"""
+        text = await self.get_text(self.SUMMARY_TOTAL)
+        return text.replace("Total: ", "") if text else ""
+
+    async def get_subtotal_value(self) -> float:
+        """소계 숫자 값 반환"""
+        subtotal = await self.get_subtotal()
+        return float(subtotal.replace("$", "")) if subtotal else 0.0
+
+    async def get_tax_value(self) -> float:
+        """세금 숫자 값 반환"""
+        tax = await self.get_tax()
+        return float(tax.replace("$", "")) if tax else 0.0
+
+    async def get_total_value(self) -> float:
+        """총액 숫자 값 반환"""
+        total = await self.get_total()
+        return float(total.replace("$", "")) if total else 0.0
+
+    async def click_finish(self):
+        """완료 버튼 클릭"""
+        await self.click(self.FINISH_BUTTON)
+        return self
+
+    async def click_cancel(self):
+        """취소 버튼 클릭"""
+        await self.click(self.CANCEL_BUTTON)
+        return self
+
+
+class CheckoutCompletePage(BasePage, CheckoutCompleteLocators):
+    """체크아웃 완료 페이지 (비동기)"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}{self.PATH}"
+
+    async def is_checkout_complete_page(self) -> bool:
+        """현재 페이지가 체크아웃 완료 페이지인지 확인"""
+        return await self.is_visible(self.COMPLETE_CONTAINER, timeout=5000)
+
+    async def get_complete_header(self) -> str:
+        """완료 헤더 텍스트 반환"""
+        return await self.get_text(self.COMPLETE_HEADER)
+
+    async def get_complete_text(self) -> str:
+        """완료 메시지 텍스트 반환"""
+        return await self.get_text(self.COMPLETE_TEXT)
+
+    async def is_pony_express_displayed(self) -> bool:
+        """Pony Express 이미지가 표시되는지 확인"""
+        return await self.is_visible(self.PONY_EXPRESS_IMAGE, timeout=3000)
+
+    async def click_back_home(self):
+        """홈으로 돌아가기 버튼 클릭"""
+        await self.click(self.BACK_HOME_BUTTON)
+        return self
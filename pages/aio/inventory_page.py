@@ -0,0 +1,190 @@
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.locators import InventoryLocators
+from pages.records import ProductRecord
+from utils.config import Config
+
+
+class InventoryPage(BasePage, InventoryLocators):
+    """인벤토리(제품 목록) 페이지 객체 (비동기)"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}{self.PATH}"
+
+    async def open(self):
+        """인벤토리 페이지 열기"""
+        await self.navigate(self.url)
+        return self
+
+    async def is_inventory_page(self) -> bool:
+        """현재 페이지가 인벤토리 페이지인지 확인"""
+        return await self.is_visible(self.INVENTORY_LIST, timeout=5000)
+
+    async def get_inventory_count(self) -> int:
+        """인벤토리 아이템 개수 반환"""
+        return await self.get_element_count(self.INVENTORY_ITEM)
+
+    async def get_item_names(self) -> list[str]:
+        """모든 아이템 이름 목록 반환"""
+        return await self.get_all_texts(self.INVENTORY_ITEM_NAME)
+
+    async def get_item_prices(self) -> list[str]:
+        """모든 아이템 가격 목록 반환"""
+        return await self.get_all_texts(self.INVENTORY_ITEM_PRICE)
+
+    async def snapshot(self) -> list[ProductRecord]:
+        """모든 상품의 화면 상태를 한 번에 읽어 반환"""
+        rows = await self.read_records(self.INVENTORY_ITEM, self.SNAPSHOT_FIELDS)
+        return [ProductRecord.from_row(row) for row in rows]
+
+    async def add_item_to_cart_by_index(self, index: int = 0):
+        """인덱스로 아이템을 장바구니에 추가"""
+        buttons = await self.page.locator(self.ADD_TO_CART_BUTTON).all()
+        if index < len(buttons):
+            await buttons[index].click()
+        return self
+
+    async def open_menu(self):
+        """햄버거 메뉴 열기"""
+        await self.click(self.BURGER_MENU_BUTTON)
+        return self
+
+    async def logout(self):
+        """로그아웃 수행"""
+        await self.open_menu()
+        await self.page.wait_for_selector(self.LOGOUT_LINK, state="visible")
+        await self.click(self.LOGOUT_LINK)
+        return self
+
+    async def close_menu(self):
+        """햄버거 메뉴 닫기"""
+        await self.click(self.CLOSE_MENU_BUTTON)
+        await self.page.wait_for_selector(self.CLOSE_MENU_BUTTON, state="hidden")
+        return self
+
+    async def click_all_items(self):
+        """전체 아이템 메뉴 클릭"""
+        await self.open_menu()
+        await self.page.wait_for_selector(self.ALL_ITEMS_LINK, state="visible")
+        await self.click(self.ALL_ITEMS_LINK)
+        return self
+
+    async def click_about(self):
+        """About 메뉴 클릭"""
+        await self.open_menu()
+        await self.page.wait_for_selector(self.ABOUT_LINK, state="visible")
+        await self.click(self.ABOUT_LINK)
+        return self
+
+    async def reset_app_state(self):
+        """앱 상태 초기화"""
+        await self.open_menu()
+        await self.page.wait_for_selector(self.RESET_APP_LINK, state="visible")
+        await self.click(self.RESET_APP_LINK)
+        return self
+
+    async def sort_by(self, sort_option: str):
+        """정렬 옵션 선택 (az, za, lohi, hilo)"""
+        await self.page.select_option(self.SORT_DROPDOWN, sort_option)
+        return self
+
+    async def sort_by_name_asc(self):
+        """이름 오름차순 정렬 (A to Z)"""
+        return await self.sort_by(self.SORT_AZ)
+
+    async def sort_by_name_desc(self):
+        """이름 내림차순 정렬 (Z to A)"""
+        return await self.sort_by(self.SORT_ZA)
+
+    async def sort_by_price_asc(self):
+        """가격 오름차순 정렬 (Low to High)"""
+        return await self.sort_by(self.SORT_LOHI)
+
+    async def sort_by_price_desc(self):
+        """가격 내림차순 정렬 (High to Low)"""
+        return await self.sort_by(self.SORT_HILO)
+
+    async def get_current_sort_option(self) -> str:
+        """현재 정렬 옵션 반환"""
+        return await self.page.locator(self.SORT_DROPDOWN).input_value()
+
+    async def get_item_prices_as_float(self) -> list[float]:
+        """모든 아이템 가격을 숫자로 반환"""
+        prices = await self.get_item_prices()
+        return [float(p.replace("$", "")) for p in prices]
+
+    async def click_product_by_name(self, product_name: str):
+        """상품 이름으로 상품 상세 페이지 이동"""
+        await self.page.locator(self.INVENTORY_ITEM_NAME, has_text=product_name).click()
+        return self
+
+    async def click_product_by_index(self, index: int = 0):
+        """인덱스로 상품 상세 페이지 이동"""
+        items = await self.page.locator(self.INVENTORY_ITEM_NAME).all()
+        if index < len(items):
+            await items[index].click()
+        return self
+
+    async def click_product_image_by_index(self, index: int = 0):
+        """이미지 클릭으로 상품 상세 페이지 이동"""
+        images = await self.page.locator(self.INVENTORY_ITEM_IMAGE).all()
+        if index < len(images):
+            await images[index].click()
+        return self
+
+    async def add_item_to_cart_by_name(self, item_name: str):
+        """이름으로 아이템을 장바구니에 추가"""
+        add_button = f"[data-test='add-to-cart-{self._item_name_to_id(item_name)}']"
+        await self.page.wait_for_selector(self.INVENTORY_LIST, state="attached")
+        if await self.is_visible_now(add_button):
+            await self.click(add_button)
+        return self
+
+    async def remove_item_from_cart_by_name(self, item_name: str):
+        """이름으로 아이템을 장바구니에서 제거"""
+        remove_button = f"[data-test='remove-{self._item_name_to_id(item_name)}']"
+        await self.page.wait_for_selector(self.INVENTORY_LIST, state="attached")
+        if await self.is_visible_now(remove_button):
+            await self.click(remove_button)
+        return self
+
+    async def remove_item_from_cart_by_index(self, index: int = 0):
+        """인덱스로 아이템을 장바구니에서 제거"""
+        buttons = await self.page.locator(self.REMOVE_BUTTON).all()
+        if index < len(buttons):
+            await buttons[index].click()
+        return self
+
+    async def get_add_to_cart_button_count(self) -> int:
+        """Add to cart 버튼 개수 반환"""
+        return await self.get_element_count(self.ADD_TO_CART_BUTTON)
+
+    async def get_remove_button_count(self) -> int:
+        """Remove 버튼 개수 반환"""
+        return await self.get_element_count(self.REMOVE_BUTTON)
+
+    async def click_shopping_cart(self):
+        """장바구니 아이콘 클릭"""
+        await self.click(self.SHOPPING_CART_LINK)
+        return self
+
+    async def get_item_descriptions(self) -> list[str]:
+        """모든 아이템 설명 반환"""
+        return await self.get_all_texts(self.INVENTORY_ITEM_DESC)
+
+    async def is_footer_visible(self) -> bool:
+        """푸터가 표시되는지 확인"""
+        return await self.is_visible(self.FOOTER, timeout=3000)
+
+    async def get_twitter_link(self) -> str:
+        """Twitter 링크 반환"""
+        return await self.page.locator(self.TWITTER_LINK).get_attribute("href") or ""
+
+    async def get_facebook_link(self) -> str:
+        """Facebook 링크 반환"""
+        return await self.page.locator(self.FACEBOOK_LINK).get_attribute("href") or ""
+
+    async def get_linkedin_link(self) -> str:
+        """LinkedIn 링크 반환"""
+        return await self.page.locator(self.LINKEDIN_LINK).get_attribute("href") or ""
@@ -0,0 +1,56 @@
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.locators import LoginLocators
+from utils.config import Config
+
+
+class LoginPage(BasePage, LoginLocators):
+    """로그인 페이지 객체 (비동기)"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}{self.PATH}"
+
+    async def open(self):
+        """로그인 페이지 열기"""
+        await self.navigate(self.url)
+        return self
+
+    async def enter_username(self, username: str):
+        """사용자명 입력"""
+        await self.fill(self.USERNAME_INPUT, username)
+        return self
+
+    async def enter_password(self, password: str):
+        """비밀번호 입력"""
+        await self.fill(self.PASSWORD_INPUT, password)
+        return self
+
+    async def click_login(self):
+        """로그인 버튼 클릭"""
+        await self.click(self.LOGIN_BUTTON)
+        return self
+
+    async def login(self, username: str, password: str):
+        """로그인 수행"""
+        await self.enter_username(username)
+        await self.enter_password(password)
+        await self.click_login()
+        return self
+
+    async def get_error_message(self) -> str:
+        """에러 메시지 텍스트 반환"""
+        return await self.get_text(self.ERROR_MESSAGE)
+
+    async def is_error_displayed(self) -> bool:
+        """에러 메시지가 표시되는지 확인"""
+        return await self.is_visible(self.ERROR_MESSAGE, timeout=3000)
+
+    async def close_error(self):
+        """에러 메시지 닫기"""
+        await self.click(self.ERROR_BUTTON)
+        return self
+
+    async def is_login_page(self) -> bool:
+        """현재 페이지가 로그인 페이지인지 확인"""
+        return await self.is_visible(self.LOGIN_BUTTON, timeout=3000)
@@ -0,0 +1,77 @@
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.locators import ProductDetailLocators
+from utils.config import Config
+
+
+class ProductDetailPage(BasePage, ProductDetailLocators):
+    """상품 상세 페이지 객체 (비동기)"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}{self.PATH}"
+
+    async def is_product_detail_page(self) -> bool:
+        """현재 페이지가 상품 상세 페이지인지 확인"""
+        return await self.is_visible(self.INVENTORY_DETAILS, timeout=5000)
+
+    async def get_product_name(self) -> str:
+        """상품 이름 반환"""
+        return await self.get_text(self.PRODUCT_NAME)
+
+    async def get_product_description(self) -> str:
+        """상품 설명 반환"""
+        return await self.get_text(self.PRODUCT_DESC)
+
+    async def get_product_price(self) -> str:
+        """상품 가격 반환"""
+        return await self.get_text(self.PRODUCT_PRICE)
+
+    async def get_product_price_value(self) -> float:
+        """상품 가격 숫자 값 반환"""
+        price = await self.get_product_price()
+        return float(price.replace("$", "")) if price else 0.0
+
+    async def is_product_image_displayed(self) -> bool:
+        """상품 이미지가 표시되는지 확인"""
+        return await self.is_visible(self.PRODUCT_IMAGE, timeout=3000)
+
+    async def get_product_image_src(self) -> str:
+        """상품 이미지 src 반환"""
+        return await self.page.locator(self.PRODUCT_IMAGE).get_attribute("src") or ""
+
+    async def add_to_cart(self):
+        """장바구니에 추가"""
+        await self.click(self.ADD_TO_CART_BUTTON)
+        return self
+
+    async def remove_from_cart(self):
+        """장바구니에서 제거"""
+        await self.click(self.REMOVE_BUTTON)
+        return self
+
+    async def is_add_to_cart_visible(self) -> bool:
+        """장바구니 추가 버튼이 표시되는지 확인"""
+        return await self.is_visible(self.ADD_TO_CART_BUTTON, timeout=2000)
+
+    async def is_add_to_cart_hidden(self) -> bool:
+        """장바구니 추가 버튼이 없는지 확인 (이미 없으면 대기하지 않음)"""
+        return await self.is_hidden(self.ADD_TO_CART_BUTTON, timeout=2000)
+
+    async def is_remove_visible(self) -> bool:
+        """제거 버튼이 표시되는지 확인"""
+        return await self.is_visible(self.REMOVE_BUTTON, timeout=2000)
+
+    async def is_remove_hidden(self) -> bool:
+        """제거 버튼이 없는지 확인 (이미 없으면 대기하지 않음)"""
+        return await self.is_hidden(self.REMOVE_BUTTON, timeout=2000)
+
+    async def click_back_to_products(self):
+        """제품 목록으로 돌아가기"""
+        await self.click(self.BACK_BUTTON)
+        return self
+
+    async def click_shopping_cart(self):
+        """장바구니 클릭"""
+        await self.click(self.SHOPPING_CART_LINK)
+        return self
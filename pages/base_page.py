@@ -1,48 +1,82 @@
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Page, expect, TimeoutError as PlaywrightTimeoutError
+from pages.locators import BaseLocators
+from utils import web_vitals
+from utils.instrumentation import instrumented
 from utils.config import Config
 
 
-class BasePage:
+class BasePage(BaseLocators):
     """모든 페이지 객체의 기본 클래스 (Playwright)"""
 
-    PAGE_TITLE = ".title"
-    SHOPPING_CART_BADGE = ".shopping_cart_badge"
+    # 액션별 세션 지연 시간 예산 (ms, utils/budgets.py의 @timed 액션 이름 기준)
+    LATENCY_BUDGETS: dict[str, float] = {}
 
     def __init__(self, page: Page):
         self.page = page
         self.page.set_default_timeout(Config.DEFAULT_TIMEOUT)
+        self.page.set_default_navigation_timeout(Config.PAGE_LOAD_TIMEOUT)
 
+    @instrumented("navigate")
     def navigate(self, url: str):
         """URL로 이동"""
         self.page.goto(url)
+        web_vitals.capture(self.page, "navigate", url)
         return self
 
+    @instrumented("click", wait_state="visible")
     def click(self, selector: str):
-        """요소 클릭"""
+        """요소 클릭 (화면이 전환되었으면 성능 지표 수집)"""
         self.page.click(selector)
+        web_vitals.capture(self.page, "click", selector)
         return self
 
+    @instrumented("fill", wait_state="visible")
     def fill(self, selector: str, text: str):
         """텍스트 입력"""
         self.page.fill(selector, text)
         return self
 
+    @instrumented("get_text", wait_state="attached")
     def get_text(self, selector: str) -> str:
         """요소의 텍스트 반환"""
         return self.page.text_content(selector) or ""
 
+    @instrumented("is_visible", wait_only=True)
     def is_visible(self, selector: str, timeout: int = None) -> bool:
-        """요소가 보이는지 확인"""
+        """요소가 보이는지 확인 (지연된 화면 전환이 완료되었으면 성능 지표 수집)"""
         try:
             self.page.wait_for_selector(
                 selector,
                 state="visible",
                 timeout=timeout or Config.DEFAULT_TIMEOUT
             )
+        except PlaywrightTimeoutError:
+            return False
+        web_vitals.capture(self.page, "wait", selector)
+        return True
+
+    @instrumented("is_hidden", wait_only=True)
+    def is_hidden(self, selector: str, timeout: int = None) -> bool:
+        """요소가 사라질 때까지 대기 (이미 없거나 숨겨져 있으면 즉시 True)"""
+        try:
+            self.page.wait_for_selector(
+                selector,
+                state="hidden",
+                timeout=timeout or Config.DEFAULT_TIMEOUT
+            )
             return True
-        except Exception:
+        except PlaywrightTimeoutError:
             return False
 
+    def is_present_now(self, selector: str) -> bool:
+        """요소가 현재 DOM에 있는지 확인 (대기하지 않음)"""
+        return self.page.locator(selector).count() > 0
+
+    def is_visible_now(self, selector: str) -> bool:
+        """요소가 현재 보이는지 확인 (대기하지 않음)"""
+        return self.page.locator(selector).first.is_visible()
+
+    @instrumented("wait_for_selector", wait_only=True)
     def wait_for_selector(self, selector: str, state: str = "visible"):
         """요소 대기"""
         self.page.wait_for_selector(selector, state=state)
@@ -52,6 +86,33 @@ class BasePage:
         """여러 요소 반환"""
         return self.page.locator(selector).all()
 
+    def read_all(self, *specs) -> list[list[str]]:
+        """여러 셀렉터의 텍스트/속성 값을 한 번의 evaluate로 읽어 반환
+
+        spec은 CSS 셀렉터(텍스트 반환) 또는 (CSS 셀렉터, 속성명) 튜플
+        """
+        return self.page.evaluate(self._BULK_READ_SCRIPT, self._bulk_read_args(specs))
+
+    def get_all_texts(self, selector: str) -> list[str]:
+        """셀렉터에 해당하는 모든 요소의 텍스트 반환"""
+        return self.read_all(selector)[0]
+
+    def get_all_attributes(self, selector: str, attribute: str) -> list[str]:
+        """셀렉터에 해당하는 모든 요소의 속성 값 반환"""
+        return self.read_all((selector, attribute))[0]
+
+    def read_records(self, container: str, fields: dict) -> list[dict]:
+        """컨테이너 요소마다 필드 값을 읽어 dict 목록으로 반환 (evaluate 1회)
+
+        fields 값은 컨테이너 기준 하위 셀렉터(텍스트 반환) 또는 (하위 셀렉터, 속성명) 튜플.
+        하위 셀렉터가 None이면 컨테이너 요소 자체를 읽는다.
+        """
+        return self.read_record_sets({"records": (container, fields)})["records"]
+
+    def read_record_sets(self, sets: dict) -> dict[str, list[dict]]:
+        """여러 컨테이너의 레코드를 한 번의 evaluate로 읽어 반환 ({키: (컨테이너, fields)})"""
+        return self.page.evaluate(self._RECORD_READ_SCRIPT, self._record_sets_args(sets))
+
     def get_element_count(self, selector: str) -> int:
         """요소 개수 반환"""
         return self.page.locator(selector).count()
@@ -77,13 +138,11 @@ class BasePage:
         return self.get_text(self.PAGE_TITLE)
 
     def get_cart_badge_count(self) -> int:
-        """장바구니 배지 숫자 반환"""
-        if self.is_visible(self.SHOPPING_CART_BADGE, timeout=2000):
-            text = self.get_text(self.SHOPPING_CART_BADGE)
-            return int(text) if text else 0
-        return 0
-
-    @staticmethod
-    def _item_name_to_id(item_name: str) -> str:
-        """상품 이름을 data-test 속성 ID 형식으로 변환"""
-        return item_name.lower().replace(" ", "-")
+        """장바구니 배지 숫자 반환
+
+        배지는 장바구니가 비어 있으면 렌더링되지 않으므로, 헤더(장바구니 링크)가
+        렌더링된 시점에 대기 없이 배지를 확인한다.
+        """
+        self.page.wait_for_selector(self.SHOPPING_CART_LINK, state="attached")
+        texts = self.get_all_texts(self.SHOPPING_CART_BADGE)
+        return int(texts[0]) if texts and texts[0] else 0
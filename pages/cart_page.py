@@ -1,25 +1,16 @@
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.locators import CartLocators
+from pages.records import CartItemRecord
 from utils.config import Config
 
 
-class CartPage(BasePage):
+class CartPage(BasePage, CartLocators):
     """장바구니 페이지 객체"""
 
-    # Selectors
-    CART_LIST = ".cart_list"
-    CART_ITEM = ".cart_item"
-    CART_ITEM_NAME = ".inventory_item_name"
-    CART_ITEM_PRICE = ".inventory_item_price"
-    CART_ITEM_QUANTITY = ".cart_quantity"
-    CART_ITEM_DESC = ".inventory_item_desc"
-    REMOVE_BUTTON = "button[data-test^='remove']"
-    CONTINUE_SHOPPING_BUTTON = "[data-test='continue-shopping']"
-    CHECKOUT_BUTTON = "[data-test='checkout']"
-
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = f"{Config.BASE_URL}/cart.html"
+        self.url = f"{Config.BASE_URL}{self.PATH}"
 
     def open(self):
         """장바구니 페이지 열기"""
@@ -36,18 +27,20 @@ class CartPage(BasePage):
 
     def get_item_names(self) -> list[str]:
         """장바구니 내 모든 아이템 이름 반환"""
-        elements = self.page.locator(self.CART_ITEM_NAME).all()
-        return [el.text_content() or "" for el in elements]
+        return self.get_all_texts(self.CART_ITEM_NAME)
 
     def get_item_prices(self) -> list[str]:
         """장바구니 내 모든 아이템 가격 반환"""
-        elements = self.page.locator(self.CART_ITEM_PRICE).all()
-        return [el.text_content() or "" for el in elements]
+        return self.get_all_texts(self.CART_ITEM_PRICE)
 
     def get_item_quantities(self) -> list[int]:
         """장바구니 내 모든 아이템 수량 반환"""
-        elements = self.page.locator(self.CART_ITEM_QUANTITY).all()
-        return [int(el.text_content() or "0") for el in elements]
+        return [int(text or "0") for text in self.get_all_texts(self.CART_ITEM_QUANTITY)]
+
+    def snapshot(self) -> list[CartItemRecord]:
+        """장바구니 아이템 상태를 한 번에 읽어 반환"""
+        rows = self.read_records(self.CART_ITEM, self.SNAPSHOT_FIELDS)
+        return [CartItemRecord.from_row(row) for row in rows]
 
     def remove_item_by_index(self, index: int = 0):
         """인덱스로 아이템 제거"""
@@ -59,7 +52,8 @@ class CartPage(BasePage):
     def remove_item_by_name(self, item_name: str):
         """이름으로 아이템 제거"""
         remove_selector = f"[data-test='remove-{self._item_name_to_id(item_name)}']"
-        if self.is_visible(remove_selector, timeout=2000):
+        self.page.wait_for_selector(self.CART_LIST, state="attached")
+        if self.is_visible_now(remove_selector):
             self.click(remove_selector)
         return self
 
@@ -79,7 +73,5 @@ class CartPage(BasePage):
 
     def get_item_description_by_index(self, index: int = 0) -> str:
         """인덱스로 아이템 설명 반환"""
-        elements = self.page.locator(self.CART_ITEM_DESC).all()
-        if index < len(elements):
-            return elements[index].text_content() or ""
-        return ""
+        descriptions = self.get_all_texts(self.CART_ITEM_DESC)
+        return descriptions[index] if index < len(descriptions) else ""
@@ -1,23 +1,17 @@
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.locators import CheckoutStepOneLocators, CheckoutStepTwoLocators, CheckoutCompleteLocators
+from pages.records import OrderSnapshot
+from utils.budgets import timed
 from utils.config import Config
 
 
-class CheckoutStepOnePage(BasePage):
+class CheckoutStepOnePage(BasePage, CheckoutStepOneLocators):
     """체크아웃 1단계 - 정보 입력 페이지"""
 
-    # Selectors
-    FIRST_NAME_INPUT = "[data-test='firstName']"
-    LAST_NAME_INPUT = "[data-test='lastName']"
-    POSTAL_CODE_INPUT = "[data-test='postalCode']"
-    CONTINUE_BUTTON = "[data-test='continue']"
-    CANCEL_BUTTON = "[data-test='cancel']"
-    ERROR_MESSAGE = "[data-test='error']"
-    ERROR_BUTTON = ".error-button"
-
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = f"{Config.BASE_URL}/checkout-step-one.html"
+        self.url = f"{Config.BASE_URL}{self.PATH}"
 
     def is_checkout_step_one_page(self) -> bool:
         """현재 페이지가 체크아웃 1단계인지 확인"""
@@ -69,26 +63,14 @@ class CheckoutStepOnePage(BasePage):
         return self
 
 
-class CheckoutStepTwoPage(BasePage):
+class CheckoutStepTwoPage(BasePage, CheckoutStepTwoLocators):
     """체크아웃 2단계 - 주문 확인 페이지"""
 
-    # Selectors
-    CART_LIST = ".cart_list"
-    CART_ITEM = ".cart_item"
-    CART_ITEM_NAME = ".inventory_item_name"
-    CART_ITEM_PRICE = ".inventory_item_price"
-    CART_ITEM_QUANTITY = ".cart_quantity"
-    SUMMARY_INFO = ".summary_info"
-    SUMMARY_SUBTOTAL = ".summary_subtotal_label"
-    SUMMARY_TAX = ".summary_tax_label"
-    SUMMARY_TOTAL = ".summary_total_label"
-    PAYMENT_INFO = ".summary_value_label"
-    FINISH_BUTTON = "[data-test='finish']"
-    CANCEL_BUTTON = "[data-test='cancel']"
+    LATENCY_BUDGETS = {"checkout_finish": 2000}
 
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = f"{Config.BASE_URL}/checkout-step-two.html"
+        self.url = f"{Config.BASE_URL}{self.PATH}"
 
     def is_checkout_step_two_page(self) -> bool:
         """현재 페이지가 체크아웃 2단계인지 확인"""
@@ -100,13 +82,15 @@ class CheckoutStepTwoPage(BasePage):
 
     def get_item_names(self) -> list[str]:
         """모든 아이템 이름 반환"""
-        elements = self.page.locator(self.CART_ITEM_NAME).all()
-        return [el.text_content() or "" for el in elements]
+        return self.get_all_texts(self.CART_ITEM_NAME)
 
     def get_item_prices(self) -> list[str]:
         """모든 아이템 가격 반환"""
-        elements = self.page.locator(self.CART_ITEM_PRICE).all()
-        return [el.text_content() or "" for el in elements]
+        return self.get_all_texts(self.CART_ITEM_PRICE)
+
+    def snapshot(self) -> OrderSnapshot:
+        """주문 아이템과 소계/세금/총액을 한 번에 읽어 반환"""
+        return OrderSnapshot.from_sets(self.read_record_sets(self.SNAPSHOT_SETS))
 
     def get_subtotal(self) -> str:
         """소계 반환"""
@@ -138,6 +122,7 @@ class CheckoutStepTwoPage(BasePage):
         total = self.get_total()
         return float(total.replace("$", "")) if total else 0.0
 
+    @timed("checkout_finish", settle="FINISH_RESULT")
     def click_finish(self):
         """완료 버튼 클릭"""
         self.click(self.FINISH_BUTTON)
@@ -149,19 +134,12 @@ class CheckoutStepTwoPage(BasePage):
         return self
 
 
-class CheckoutCompletePage(BasePage):
+class CheckoutCompletePage(BasePage, CheckoutCompleteLocators):
     """체크아웃 완료 페이지"""
 
-    # Selectors
-    COMPLETE_CONTAINER = ".checkout_complete_container"
-    COMPLETE_HEADER = ".complete-header"
-    COMPLETE_TEXT = ".complete-text"
-    PONY_EXPRESS_IMAGE = ".pony_express"
-    BACK_HOME_BUTTON = "[data-test='back-to-products']"
-
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = f"{Config.BASE_URL}/checkout-complete.html"
+        self.url = f"{Config.BASE_URL}{self.PATH}"
 
     def is_checkout_complete_page(self) -> bool:
         """현재 페이지가 체크아웃 완료 페이지인지 확인"""
@@ -1,42 +1,25 @@
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.locators import InventoryLocators
+from pages.records import ProductRecord
+from utils import web_vitals
+from utils.budgets import timed
 from utils.config import Config
 
 
-class InventoryPage(BasePage):
+class InventoryPage(BasePage, InventoryLocators):
     """인벤토리(제품 목록) 페이지 객체 (Playwright)"""
 
-    # Selectors
-    INVENTORY_LIST = ".inventory_list"
-    INVENTORY_ITEM = ".inventory_item"
-    INVENTORY_ITEM_NAME = ".inventory_item_name"
-    INVENTORY_ITEM_PRICE = ".inventory_item_price"
-    INVENTORY_ITEM_DESC = ".inventory_item_desc"
-    INVENTORY_ITEM_IMAGE = ".inventory_item_img"
-    ADD_TO_CART_BUTTON = "button[data-test^='add-to-cart']"
-    REMOVE_BUTTON = "button[data-test^='remove']"
-    SHOPPING_CART_LINK = ".shopping_cart_link"
-    BURGER_MENU_BUTTON = "#react-burger-menu-btn"
-    CLOSE_MENU_BUTTON = "#react-burger-cross-btn"
-    LOGOUT_LINK = "#logout_sidebar_link"
-    ALL_ITEMS_LINK = "#inventory_sidebar_link"
-    ABOUT_LINK = "#about_sidebar_link"
-    RESET_APP_LINK = "#reset_sidebar_link"
-    SORT_DROPDOWN = ".product_sort_container"
-    FOOTER = ".footer"
-    TWITTER_LINK = ".social_twitter a"
-    FACEBOOK_LINK = ".social_facebook a"
-    LINKEDIN_LINK = ".social_linkedin a"
-
-    # Sort options
-    SORT_AZ = "az"
-    SORT_ZA = "za"
-    SORT_LOHI = "lohi"
-    SORT_HILO = "hilo"
+    LATENCY_BUDGETS = {"sort": 500, "add_to_cart": 500}
 
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = f"{Config.BASE_URL}/inventory.html"
+        self.url = f"{Config.BASE_URL}{self.PATH}"
+
+    def open(self):
+        """인벤토리 페이지 열기"""
+        self.navigate(self.url)
+        return self
 
     def is_inventory_page(self) -> bool:
         """현재 페이지가 인벤토리 페이지인지 확인"""
@@ -48,14 +31,18 @@ class InventoryPage(BasePage):
 
     def get_item_names(self) -> list[str]:
         """모든 아이템 이름 목록 반환"""
-        elements = self.page.locator(self.INVENTORY_ITEM_NAME).all()
-        return [el.text_content() or "" for el in elements]
+        return self.get_all_texts(self.INVENTORY_ITEM_NAME)
 
     def get_item_prices(self) -> list[str]:
         """모든 아이템 가격 목록 반환"""
-        elements = self.page.locator(self.INVENTORY_ITEM_PRICE).all()
-        return [el.text_content() or "" for el in elements]
+        return self.get_all_texts(self.INVENTORY_ITEM_PRICE)
+
+    def snapshot(self) -> list[ProductRecord]:
+        """모든 상품의 화면 상태를 한 번에 읽어 반환"""
+        rows = self.read_records(self.INVENTORY_ITEM, self.SNAPSHOT_FIELDS)
+        return [ProductRecord.from_row(row) for row in rows]
 
+    @timed("add_to_cart")
     def add_item_to_cart_by_index(self, index: int = 0):
         """인덱스로 아이템을 장바구니에 추가"""
         buttons = self.page.locator(self.ADD_TO_CART_BUTTON).all()
@@ -102,6 +89,7 @@ class InventoryPage(BasePage):
         self.click(self.RESET_APP_LINK)
         return self
 
+    @timed("sort")
     def sort_by(self, sort_option: str):
         """정렬 옵션 선택 (az, za, lohi, hilo)"""
         self.page.select_option(self.SORT_DROPDOWN, sort_option)
@@ -135,6 +123,7 @@ class InventoryPage(BasePage):
     def click_product_by_name(self, product_name: str):
         """상품 이름으로 상품 상세 페이지 이동"""
         self.page.locator(self.INVENTORY_ITEM_NAME, has_text=product_name).click()
+        web_vitals.capture(self.page, "click", self.INVENTORY_ITEM_NAME)
         return self
 
     def click_product_by_index(self, index: int = 0):
@@ -142,6 +131,7 @@ class InventoryPage(BasePage):
         items = self.page.locator(self.INVENTORY_ITEM_NAME).all()
         if index < len(items):
             items[index].click()
+            web_vitals.capture(self.page, "click", self.INVENTORY_ITEM_NAME)
         return self
 
     def click_product_image_by_index(self, index: int = 0):
@@ -149,19 +139,23 @@ class InventoryPage(BasePage):
         images = self.page.locator(self.INVENTORY_ITEM_IMAGE).all()
         if index < len(images):
             images[index].click()
+            web_vitals.capture(self.page, "click", self.INVENTORY_ITEM_IMAGE)
         return self
 
+    @timed("add_to_cart")
     def add_item_to_cart_by_name(self, item_name: str):
         """이름으로 아이템을 장바구니에 추가"""
         add_button = f"[data-test='add-to-cart-{self._item_name_to_id(item_name)}']"
-        if self.is_visible(add_button, timeout=2000):
+        self.page.wait_for_selector(self.INVENTORY_LIST, state="attached")
+        if self.is_visible_now(add_button):
             self.click(add_button)
         return self
 
     def remove_item_from_cart_by_name(self, item_name: str):
         """이름으로 아이템을 장바구니에서 제거"""
         remove_button = f"[data-test='remove-{self._item_name_to_id(item_name)}']"
-        if self.is_visible(remove_button, timeout=2000):
+        self.page.wait_for_selector(self.INVENTORY_LIST, state="attached")
+        if self.is_visible_now(remove_button):
             self.click(remove_button)
         return self
 
@@ -187,8 +181,7 @@ class InventoryPage(BasePage):
 
     def get_item_descriptions(self) -> list[str]:
         """모든 아이템 설명 반환"""
-        elements = self.page.locator(self.INVENTORY_ITEM_DESC).all()
-        return [el.text_content() or "" for el in elements]
+        return self.get_all_texts(self.INVENTORY_ITEM_DESC)
 
     def is_footer_visible(self) -> bool:
         """푸터가 표시되는지 확인"""
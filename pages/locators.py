@@ -0,0 +1,205 @@
+"""페이지별 셀렉터와 페이지 객체 공통 정의
+
+동기 페이지 객체(pages/*.py)와 비동기 페이지 객체(pages/aio/*.py)가 같은 클래스를 상속해
+셀렉터, 경로, 읽기 스크립트가 서로 어긋나지 않도록 한다.
+"""
+
+
+class BaseLocators:
+    """모든 페이지 공통 셀렉터와 읽기 스크립트"""
+
+    PAGE_TITLE = ".title"
+    SHOPPING_CART_BADGE = ".shopping_cart_badge"
+    SHOPPING_CART_LINK = ".shopping_cart_link"
+
+    # 셀렉터별 [(selector, attribute)] 목록을 받아 요소들의 텍스트/속성 값을 한 번에 읽는 스크립트
+    _BULK_READ_SCRIPT = """
+    (specs) => specs.map(([selector, attribute]) =>
+        Array.from(document.querySelectorAll(selector), (el) =>
+            (attribute ? el.getAttribute(attribute) : el.textContent) ?? ""))
+    """
+
+    # 컨테이너 요소마다 필드별 (selector, attribute) 값을 읽어 레코드 목록으로 반환하는 스크립트
+    _RECORD_READ_SCRIPT = """
+    (sets) => Object.fromEntries(Object.entries(sets).map(([key, [container, fields]]) => [
+        key,
+        Array.from(document.querySelectorAll(container), (root) =>
+            Object.fromEntries(Object.entries(fields).map(([name, [selector, attribute]]) => {
+                const el = selector ? root.querySelector(selector) : root;
+                const value = el && (attribute ? el.getAttribute(attribute) : el.textContent);
+                return [name, value ?? ""];
+            }))),
+    ]))
+    """
+
+    @staticmethod
+    def _bulk_read_args(specs) -> list[list]:
+        """read_all의 spec 목록을 _BULK_READ_SCRIPT 인자로 변환"""
+        return [[spec, None] if isinstance(spec, str) else list(spec) for spec in specs]
+
+    @staticmethod
+    def _record_sets_args(sets: dict) -> dict:
+        """read_record_sets의 {키: (컨테이너, fields)}를 _RECORD_READ_SCRIPT 인자로 변환"""
+        return {
+            key: [container, {
+                name: [spec, None] if spec is None or isinstance(spec, str) else list(spec)
+                for name, spec in fields.items()
+            }]
+            for key, (container, fields) in sets.items()
+        }
+
+    @staticmethod
+    def _item_name_to_id(item_name: str) -> str:
+        """상품 이름을 data-test 속성 ID 형식으로 변환"""
+        return item_name.lower().replace(" ", "-")
+
+
+class InventoryLocators:
+    """인벤토리 페이지 셀렉터"""
+
+    PATH = "/inventory.html"
+    INVENTORY_LIST = ".inventory_list"
+    INVENTORY_ITEM = ".inventory_item"
+    INVENTORY_ITEM_NAME = ".inventory_item_name"
+    INVENTORY_ITEM_PRICE = ".inventory_item_price"
+    INVENTORY_ITEM_DESC = ".inventory_item_desc"
+    INVENTORY_ITEM_IMAGE = ".inventory_item_img"
+    ADD_TO_CART_BUTTON = "button[data-test^='add-to-cart']"
+    REMOVE_BUTTON = "button[data-test^='remove']"
+    SHOPPING_CART_LINK = ".shopping_cart_link"
+    BURGER_MENU_BUTTON = "#react-burger-menu-btn"
+    CLOSE_MENU_BUTTON = "#react-burger-cross-btn"
+    LOGOUT_LINK = "#logout_sidebar_link"
+    ALL_ITEMS_LINK = "#inventory_sidebar_link"
+    ABOUT_LINK = "#about_sidebar_link"
+    RESET_APP_LINK = "#reset_sidebar_link"
+    SORT_DROPDOWN = ".product_sort_container"
+    FOOTER = ".footer"
+    TWITTER_LINK = ".social_twitter a"
+    FACEBOOK_LINK = ".social_facebook a"
+    LINKEDIN_LINK = ".social_linkedin a"
+
+    # Sort options
+    SORT_AZ = "az"
+    SORT_ZA = "za"
+    SORT_LOHI = "lohi"
+    SORT_HILO = "hilo"
+
+    # snapshot()이 상품마다 읽는 필드
+    SNAPSHOT_FIELDS = {
+        "name": INVENTORY_ITEM_NAME,
+        "price": INVENTORY_ITEM_PRICE,
+        "description": INVENTORY_ITEM_DESC,
+        "image_src": (f"{INVENTORY_ITEM_IMAGE} img", "src"),
+        "button_text": "button",
+        "button_test_id": ("button", "data-test"),
+    }
+
+
+class LoginLocators:
+    """로그인 페이지 셀렉터"""
+
+    PATH = ""
+    USERNAME_INPUT = "#user-name"
+    PASSWORD_INPUT = "#password"
+    LOGIN_BUTTON = "#login-button"
+    ERROR_MESSAGE = "[data-test='error']"
+    ERROR_BUTTON = ".error-button"
+
+    # 로그인 결과 (성공: 인벤토리 목록, 실패: 에러 메시지)
+    LOGIN_RESULT = f"{InventoryLocators.INVENTORY_LIST}, {ERROR_MESSAGE}"
+
+
+class ProductDetailLocators:
+    """상품 상세 페이지 셀렉터"""
+
+    PATH = "/inventory-item.html"
+    INVENTORY_DETAILS = ".inventory_details"
+    PRODUCT_NAME = ".inventory_details_name"
+    PRODUCT_DESC = ".inventory_details_desc"
+    PRODUCT_PRICE = ".inventory_details_price"
+    PRODUCT_IMAGE = ".inventory_details_img"
+    ADD_TO_CART_BUTTON = "[data-test^='add-to-cart']"
+    REMOVE_BUTTON = "[data-test^='remove']"
+    BACK_BUTTON = "[data-test='back-to-products']"
+    SHOPPING_CART_LINK = ".shopping_cart_link"
+
+
+class CartLocators:
+    """장바구니 페이지 셀렉터"""
+
+    PATH = "/cart.html"
+    CART_LIST = ".cart_list"
+    CART_ITEM = ".cart_item"
+    CART_ITEM_NAME = ".inventory_item_name"
+    CART_ITEM_PRICE = ".inventory_item_price"
+    CART_ITEM_QUANTITY = ".cart_quantity"
+    CART_ITEM_DESC = ".inventory_item_desc"
+    REMOVE_BUTTON = "button[data-test^='remove']"
+    CONTINUE_SHOPPING_BUTTON = "[data-test='continue-shopping']"
+    CHECKOUT_BUTTON = "[data-test='checkout']"
+
+    # snapshot()이 장바구니 아이템마다 읽는 필드
+    SNAPSHOT_FIELDS = {
+        "name": CART_ITEM_NAME,
+        "price": CART_ITEM_PRICE,
+        "quantity": CART_ITEM_QUANTITY,
+        "description": CART_ITEM_DESC,
+        "button_test_id": ("button", "data-test"),
+    }
+
+
+class CheckoutStepOneLocators:
+    """체크아웃 1단계 셀렉터"""
+
+    PATH = "/checkout-step-one.html"
+    FIRST_NAME_INPUT = "[data-test='firstName']"
+    LAST_NAME_INPUT = "[data-test='lastName']"
+    POSTAL_CODE_INPUT = "[data-test='postalCode']"
+    CONTINUE_BUTTON = "[data-test='continue']"
+    CANCEL_BUTTON = "[data-test='cancel']"
+    ERROR_MESSAGE = "[data-test='error']"
+    ERROR_BUTTON = ".error-button"
+
+
+class CheckoutCompleteLocators:
+    """체크아웃 완료 페이지 셀렉터"""
+
+    PATH = "/checkout-complete.html"
+    COMPLETE_CONTAINER = ".checkout_complete_container"
+    COMPLETE_HEADER = ".complete-header"
+    COMPLETE_TEXT = ".complete-text"
+    PONY_EXPRESS_IMAGE = ".pony_express"
+    BACK_HOME_BUTTON = "[data-test='back-to-products']"
+
+
+class CheckoutStepTwoLocators:
+    """체크아웃 2단계 셀렉터"""
+
+    PATH = "/checkout-step-two.html"
+    CART_LIST = ".cart_list"
+    CART_ITEM = ".cart_item"
+    CART_ITEM_NAME = ".inventory_item_name"
+    CART_ITEM_PRICE = ".inventory_item_price"
+    CART_ITEM_QUANTITY = ".cart_quantity"
+    CART_ITEM_DESC = ".inventory_item_desc"
+    SUMMARY_INFO = ".summary_info"
+    SUMMARY_SUBTOTAL = ".summary_subtotal_label"
+    SUMMARY_TAX = ".summary_tax_label"
+    SUMMARY_TOTAL = ".summary_total_label"
+    PAYMENT_INFO = ".summary_value_label"
+    FINISH_BUTTON = "[data-test='finish']"
+    CANCEL_BUTTON = "[data-test='cancel']"
+
+    # 주문 완료 결과
+    FINISH_RESULT = CheckoutCompleteLocators.COMPLETE_CONTAINER
+
+    # snapshot()이 읽는 주문 아이템/합계 레코드
+    SNAPSHOT_SETS = {
+        "items": (CART_ITEM, CartLocators.SNAPSHOT_FIELDS),
+        "summary": (SUMMARY_INFO, {
+            "subtotal": SUMMARY_SUBTOTAL,
+            "tax": SUMMARY_TAX,
+            "total": SUMMARY_TOTAL,
+        }),
+    }
@@ -1,20 +1,17 @@
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.locators import LoginLocators
+from utils.budgets import timed
 from utils.config import Config
 
-class LoginPage(BasePage):
+class LoginPage(BasePage, LoginLocators):
     """로그인 페이지 객체 (Playwright)"""
 
-    # Selectors
-    USERNAME_INPUT = "#user-name"
-    PASSWORD_INPUT = "#password"
-    LOGIN_BUTTON = "#login-button"
-    ERROR_MESSAGE = "[data-test='error']"
-    ERROR_BUTTON = ".error-button"
+    LATENCY_BUDGETS = {"login": 2000}
 
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = Config.BASE_URL
+        self.url = f"{Config.BASE_URL}{self.PATH}"
 
     def open(self):
         """로그인 페이지 열기"""
@@ -36,6 +33,7 @@ class LoginPage(BasePage):
         self.click(self.LOGIN_BUTTON)
         return self
 
+    @timed("login", settle="LOGIN_RESULT")
     def login(self, username: str, password: str):
         """로그인 수행"""
         self.enter_username(username)
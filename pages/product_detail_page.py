@@ -1,25 +1,16 @@
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from pages.locators import ProductDetailLocators
+from utils.budgets import timed
 from utils.config import Config
 
 
-class ProductDetailPage(BasePage):
+class ProductDetailPage(BasePage, ProductDetailLocators):
     """상품 상세 페이지 객체"""
 
-    # Selectors
-    INVENTORY_DETAILS = ".inventory_details"
-    PRODUCT_NAME = ".inventory_details_name"
-    PRODUCT_DESC = ".inventory_details_desc"
-    PRODUCT_PRICE = ".inventory_details_price"
-    PRODUCT_IMAGE = ".inventory_details_img"
-    ADD_TO_CART_BUTTON = "[data-test^='add-to-cart']"
-    REMOVE_BUTTON = "[data-test^='remove']"
-    BACK_BUTTON = "[data-test='back-to-products']"
-    SHOPPING_CART_LINK = ".shopping_cart_link"
-
     def __init__(self, page: Page):
         super().__init__(page)
-        self.url = f"{Config.BASE_URL}/inventory-item.html"
+        self.url = f"{Config.BASE_URL}{self.PATH}"
 
     def is_product_detail_page(self) -> bool:
         """현재 페이지가 상품 상세 페이지인지 확인"""
@@ -51,6 +42,7 @@ class ProductDetailPage(BasePage):
         img = self.page.locator(self.PRODUCT_IMAGE)
         return img.get_attribute("src") or ""
 
+    @timed("add_to_cart")
     def add_to_cart(self):
         """장바구니에 추가"""
         self.click(self.ADD_TO_CART_BUTTON)
@@ -65,10 +57,18 @@ class ProductDetailPage(BasePage):
         """장바구니 추가 버튼이 표시되는지 확인"""
         return self.is_visible(self.ADD_TO_CART_BUTTON, timeout=2000)
 
+    def is_add_to_cart_hidden(self) -> bool:
+        """장바구니 추가 버튼이 없는지 확인 (이미 없으면 대기하지 않음)"""
+        return self.is_hidden(self.ADD_TO_CART_BUTTON, timeout=2000)
+
     def is_remove_visible(self) -> bool:
         """제거 버튼이 표시되는지 확인"""
         return self.is_visible(self.REMOVE_BUTTON, timeout=2000)
 
+    def is_remove_hidden(self) -> bool:
+        """제거 버튼이 없는지 확인 (이미 없으면 대기하지 않음)"""
+        return self.is_hidden(self.REMOVE_BUTTON, timeout=2000)
+
     def click_back_to_products(self):
         """제품 목록으로 돌아가기"""
         self.click(self.BACK_BUTTON)
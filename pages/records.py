@@ -0,0 +1,122 @@
+from decimal import Decimal
+
+
+def parse_price(text: str) -> Decimal:
+    """'$29.99', 'Item total: $29.99' 형식의 텍스트를 Decimal로 변환"""
+    _, _, amount = text.rpartition("$")
+    return Decimal(amount.strip() or "0")
+
+
+class ProductRecord:
+    """인벤토리 페이지의 상품 한 건"""
+
+    __slots__ = ("name", "price", "description", "image_src", "button_text", "button_test_id")
+
+    def __init__(self, name: str, price: Decimal, description: str,
+                 image_src: str, button_text: str, button_test_id: str):
+        self.name = name
+        self.price = price
+        self.description = description
+        self.image_src = image_src
+        self.button_text = button_text
+        self.button_test_id = button_test_id
+
+    @classmethod
+    def from_row(cls, row: dict) -> "ProductRecord":
+        """read_records 결과 dict를 레코드로 변환"""
+        return cls(
+            name=row["name"],
+            price=parse_price(row["price"]),
+            description=row["description"],
+            image_src=row["image_src"],
+            button_text=row["button_text"],
+            button_test_id=row["button_test_id"],
+        )
+
+    @property
+    def in_cart(self) -> bool:
+        """장바구니에 담긴 상품인지 (버튼이 Remove 상태인지)"""
+        return self.button_test_id.startswith("remove")
+
+    @property
+    def price_value(self) -> float:
+        return float(self.price)
+
+    def __eq__(self, other):
+        if not isinstance(other, ProductRecord):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self):
+        return f"ProductRecord(name={self.name!r}, price={self.price}, in_cart={self.in_cart})"
+
+
+class CartItemRecord:
+    """장바구니/주문 확인 페이지의 아이템 한 건"""
+
+    __slots__ = ("name", "price", "quantity", "description", "button_test_id")
+
+    def __init__(self, name: str, price: Decimal, quantity: int, description: str, button_test_id: str):
+        self.name = name
+        self.price = price
+        self.quantity = quantity
+        self.description = description
+        self.button_test_id = button_test_id
+
+    @classmethod
+    def from_row(cls, row: dict) -> "CartItemRecord":
+        """read_records 결과 dict를 레코드로 변환"""
+        return cls(
+            name=row["name"],
+            price=parse_price(row["price"]),
+            quantity=int(row["quantity"] or "0"),
+            description=row["description"],
+            button_test_id=row["button_test_id"],
+        )
+
+    @property
+    def price_value(self) -> float:
+        return float(self.price)
+
+    def __eq__(self, other):
+        if not isinstance(other, CartItemRecord):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self):
+        return f"CartItemRecord(name={self.name!r}, price={self.price}, quantity={self.quantity})"
+
+
+class OrderSnapshot:
+    """체크아웃 2단계(주문 확인) 페이지 상태"""
+
+    __slots__ = ("items", "subtotal", "tax", "total")
+
+    def __init__(self, items: list[CartItemRecord], subtotal: Decimal, tax: Decimal, total: Decimal):
+        self.items = items
+        self.subtotal = subtotal
+        self.tax = tax
+        self.total = total
+
+    @classmethod
+    def from_sets(cls, sets: dict) -> "OrderSnapshot":
+        """read_record_sets 결과({"items": [...], "summary": [...]})로 생성"""
+        summary = sets["summary"][0] if sets["summary"] else {"subtotal": "", "tax": "", "total": ""}
+        return cls(
+            items=[CartItemRecord.from_row(row) for row in sets["items"]],
+            subtotal=parse_price(summary["subtotal"]),
+            tax=parse_price(summary["tax"]),
+            total=parse_price(summary["total"]),
+        )
+
+    @property
+    def names(self) -> list[str]:
+        return [item.name for item in self.items]
+
+    @property
+    def item_total(self) -> Decimal:
+        """아이템 가격 x 수량 합계"""
+        return sum((item.price * item.quantity for item in self.items), Decimal("0"))
+
+    def __repr__(self):
+        return f"OrderSnapshot(items={len(self.items)}, subtotal={self.subtotal}, tax={self.tax}, total={self.total})"
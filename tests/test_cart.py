@@ -2,6 +2,7 @@ import pytest
 import allure
 from playwright.sync_api import Page
 
+from data.products import Products
 from data.users import Users
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
@@ -71,14 +72,13 @@ class TestCartWithItems:
         assert item_names[1] in cart_names
         assert item_names[2] in cart_names
 
-    def test_all_items_in_cart(self, logged_in_page, cart_page):
-        """모든 상품(6개)이 장바구니에 추가되는지 확인"""
-        for i in range(6):
-            logged_in_page.add_item_to_cart_by_index(0)
+    def test_all_items_in_cart(self, logged_in_page, cart_page, cart_seeder):
+        """모든 상품(6개)이 장바구니에 표시되는지 확인 (저장소에 직접 기록)"""
+        products = cart_seeder.seed(*Products.get_all_products())
+        cart_seeder.open(cart_page)
 
-        logged_in_page.click_shopping_cart()
-
-        assert cart_page.get_cart_item_count() == 6, "Cart should have 6 items"
+        assert cart_page.get_cart_item_count() == len(products), f"Cart should have {len(products)} items"
+        assert cart_page.get_item_names() == [p.name for p in products]
 
     def test_item_quantity_is_one(self, logged_in_page, cart_page):
         """각 아이템의 수량이 1인지 확인"""
@@ -192,18 +192,30 @@ class TestCartPriceDisplay:
 
     def test_prices_match_inventory_prices(self, logged_in_page, cart_page):
         """장바구니 가격이 인벤토리 가격과 일치하는지 확인"""
-        item_names = logged_in_page.get_item_names()
-        inventory_prices = logged_in_page.get_item_prices()
+        products = logged_in_page.snapshot()[:2]
 
         # 이름으로 추가하여 정확한 상품 선택
-        logged_in_page.add_item_to_cart_by_name(item_names[0])
-        logged_in_page.add_item_to_cart_by_name(item_names[1])
+        for product in products:
+            logged_in_page.add_item_to_cart_by_name(product.name)
         logged_in_page.click_shopping_cart()
 
-        cart_prices = cart_page.get_item_prices()
+        cart_prices = {item.name: item.price for item in cart_page.snapshot()}
+
+        assert cart_prices == {product.name: product.price for product in products}
+
+    def test_cart_snapshot_matches_inventory(self, logged_in_page, cart_page):
+        """장바구니 스냅샷의 이름/가격/설명이 인벤토리와 일치하는지 확인"""
+        products = logged_in_page.snapshot()[:3]
+        for product in products:
+            logged_in_page.add_item_to_cart_by_name(product.name)
+        logged_in_page.click_shopping_cart()
+
+        cart_items = cart_page.snapshot()
 
-        assert inventory_prices[0] in cart_prices
-        assert inventory_prices[1] in cart_prices
+        assert [(i.name, i.price, i.description) for i in cart_items] == \
+            [(p.name, p.price, p.description) for p in products]
+        assert all(item.quantity == 1 for item in cart_items)
+        assert all(item.button_test_id.startswith("remove") for item in cart_items)
 
     def test_all_prices_have_dollar_sign(self, logged_in_page, cart_page):
         """모든 가격에 $ 기호가 있는지 확인"""
@@ -2,9 +2,21 @@ import pytest
 import allure
 from playwright.sync_api import Page
 
+from data.products import Products
 from data.users import Users, User
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
+from pages.aio.login_page import LoginPage as AsyncLoginPage
+from pages.aio.inventory_page import InventoryPage as AsyncInventoryPage
+
+
+def _with_login_budget(users):
+    """사용자별 로그인 예산이 있으면 budget 마커를 붙인 parametrize 값 목록"""
+    return [
+        pytest.param(user, id=user.username,
+                     marks=pytest.mark.budget(login_ms=user.login_budget_ms) if user.login_budget_ms else ())
+        for user in users
+    ]
 
 
 @allure.feature("로그인")
@@ -12,7 +24,7 @@ from pages.inventory_page import InventoryPage
 class TestLoginValidUsers:
     """로그인 가능한 사용자들에 대한 테스트"""
 
-    @pytest.mark.parametrize("user", Users.get_valid_users(), ids=lambda u: u.username)
+    @pytest.mark.parametrize("user", _with_login_budget(Users.get_valid_users()))
     def test_valid_user_login(self, page: Page, user: User):
         """유효한 사용자가 로그인하면 인벤토리 페이지로 이동해야 함"""
         login_page = LoginPage(page)
@@ -26,6 +38,23 @@ class TestLoginValidUsers:
         assert inventory_page.get_inventory_count() > 0, \
             f"{user.username}: 제품이 표시되어야 합니다"
 
+    def test_valid_users_login_concurrently(self, async_runner, async_pages):
+        """유효한 사용자 전원이 각자의 세션에서 동시에 로그인할 수 있어야 함"""
+        async def login(user: User) -> int:
+            page = await async_pages.new_page()
+            login_page = await AsyncLoginPage(page).open()
+            await login_page.login(user.username, user.password)
+            inventory_page = AsyncInventoryPage(page)
+            if not await inventory_page.is_inventory_page():
+                return 0
+            return await inventory_page.get_inventory_count()
+
+        users = Users.get_valid_users()
+        counts = async_runner.gather(*(login(user) for user in users))
+
+        for user, count in zip(users, counts):
+            assert count > 0, f"{user.username}: 인벤토리 페이지에 제품이 표시되어야 합니다"
+
 
 @allure.feature("로그인")
 @allure.story("잠긴 사용자 로그인")
@@ -103,7 +132,7 @@ class TestLoginSpecificUsers:
         login_page.login(Users.STANDARD.username, Users.STANDARD.password)
 
         assert inventory_page.is_inventory_page()
-        assert inventory_page.get_inventory_count() == 6
+        assert inventory_page.get_inventory_count() == len(Products.ALL)
         assert inventory_page.get_page_title() == "Products"
 
     def test_locked_out_user_cannot_login(self, page: Page):
@@ -127,6 +156,8 @@ class TestLoginSpecificUsers:
 
         assert inventory_page.is_inventory_page()
 
+    @pytest.mark.known_flaky
+    @pytest.mark.budget(login_ms=Users.PERFORMANCE_GLITCH.login_budget_ms)
     def test_performance_glitch_user_login_success(self, page: Page):
         """성능 문제 사용자가 로그인할 수 있는지 확인 (느릴 수 있음)"""
         login_page = LoginPage(page)
@@ -140,6 +171,44 @@ class TestLoginSpecificUsers:
 
         assert inventory_page.is_inventory_page()
 
+    @pytest.mark.known_flaky
+    @pytest.mark.budget(login_ms=Users.PERFORMANCE_GLITCH.login_budget_ms)
+    @pytest.mark.web_vitals
+    def test_performance_glitch_user_login_metrics(self, page: Page, web_vitals_metrics):
+        """성능 문제 사용자 로그인 시 로그인 → 인벤토리 전환 지표가 수집되는지 확인"""
+        login_page = LoginPage(page)
+        inventory_page = InventoryPage(page)
+
+        login_page.open()
+        login_page.login(Users.PERFORMANCE_GLITCH.username, Users.PERFORMANCE_GLITCH.password)
+        assert inventory_page.is_inventory_page()
+
+        records = web_vitals_metrics.records
+        assert records[0]["type"] == "hard" and records[0]["ttfb"] is not None, \
+            f"로그인 페이지 로드 지표가 수집되어야 합니다: {records}"
+        transitions = [r for r in records if r["url"].endswith(InventoryPage.PATH)]
+        assert transitions and transitions[-1]["duration"] > 0, \
+            f"인벤토리 화면 전환 지표가 수집되어야 합니다: {records}"
+
+    @pytest.mark.known_flaky
+    @pytest.mark.budget(login_ms=Users.PERFORMANCE_GLITCH.login_budget_ms)
+    @pytest.mark.instrument_actions
+    def test_performance_glitch_user_login_actions(self, page: Page, action_trace):
+        """성능 문제 사용자 로그인 지연이 인벤토리 대기 시간으로 기록되는지 확인"""
+        login_page = LoginPage(page)
+        inventory_page = InventoryPage(page)
+
+        login_page.open()
+        login_page.login(Users.PERFORMANCE_GLITCH.username, Users.PERFORMANCE_GLITCH.password)
+        assert inventory_page.is_inventory_page()
+
+        actions = [(e.action, e.selector) for e in action_trace.events]
+        assert ("click", LoginPage.LOGIN_BUTTON) in actions, f"로그인 버튼 클릭이 기록되어야 합니다: {actions}"
+        waits = [e for e in action_trace.events if e.action == "is_visible" and e.selector == InventoryPage.INVENTORY_LIST]
+        assert waits and waits[-1].status == "ok" and waits[-1].act == 0, \
+            f"인벤토리 표시 대기가 대기 시간으로 기록되어야 합니다: {waits}"
+
+    @pytest.mark.known_flaky
     def test_error_user_login_success(self, page: Page):
         """에러 사용자가 로그인할 수 있는지 확인"""
         login_page = LoginPage(page)
@@ -88,6 +88,7 @@ class TestProductDetailContent:
 
         assert len(description) > 0, "Product description should not be empty"
 
+    @pytest.mark.allow_resources("image")
     def test_product_image_is_displayed(self, product_detail_with_info):
         """상품 이미지가 표시되는지 확인"""
         detail_page, _ = product_detail_with_info
@@ -113,7 +114,7 @@ class TestProductDetailCartOperations:
         logged_in_page.click_product_by_index(0)
 
         assert product_detail_page.is_add_to_cart_visible(), "'Add to cart' button should be visible"
-        assert not product_detail_page.is_remove_visible(), "'Remove' button should not be visible"
+        assert product_detail_page.is_remove_hidden(), "'Remove' button should not be visible"
 
     def test_add_to_cart_from_detail_page(self, logged_in_page, product_detail_page):
         """상품 상세 페이지에서 장바구니 추가"""
@@ -129,7 +130,7 @@ class TestProductDetailCartOperations:
         product_detail_page.add_to_cart()
 
         assert product_detail_page.is_remove_visible(), "'Remove' button should be visible after add"
-        assert not product_detail_page.is_add_to_cart_visible(), "'Add to cart' should not be visible"
+        assert product_detail_page.is_add_to_cart_hidden(), "'Add to cart' should not be visible"
 
     def test_remove_from_cart_on_detail_page(self, logged_in_page, product_detail_page):
         """상품 상세 페이지에서 장바구니 제거"""
@@ -168,6 +169,7 @@ class TestAllProductsDetail:
         "Test.allTheThings() T-Shirt (Red)"
     ]
 
+    @pytest.mark.allow_resources("image")
     @pytest.mark.parametrize("product_index", range(6))
     def test_each_product_has_valid_detail_page(self, logged_in_page, product_detail_page, product_index):
         """각 상품이 유효한 상세 페이지를 가지는지 확인"""
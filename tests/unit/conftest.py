@@ -0,0 +1,28 @@
+import pytest
+
+
+# 단위 테스트는 브라우저 없이 실행 - 최상위 conftest의 브라우저 autouse fixture를 빈 fixture로 대체
+
+@pytest.fixture
+def network_profile():
+    return None
+
+
+@pytest.fixture
+def har_replay():
+    return None
+
+
+@pytest.fixture
+def web_vitals_metrics():
+    return None
+
+
+@pytest.fixture
+def failure_trace():
+    return None
+
+
+@pytest.fixture
+def capture_screenshot():
+    return None
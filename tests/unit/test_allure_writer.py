@@ -0,0 +1,100 @@
+import hashlib
+import json
+from types import SimpleNamespace
+
+import allure_pytest.plugin
+import pytest
+from allure_commons import model2
+
+from utils import allure_writer
+from utils.allure_writer import AsyncAllureFileLogger
+
+SCREENSHOT = b"\x89PNG same screenshot"
+
+
+class FakeConfig:
+    def __init__(self, plugins=()):
+        self.pluginmanager = SimpleNamespace(has_plugin=lambda name: name in plugins)
+        self.warnings = []
+
+    def issue_config_time_warning(self, warning, stacklevel):
+        self.warnings.append(warning)
+
+
+@pytest.fixture
+def writer(tmp_path):
+    writer = AsyncAllureFileLogger(str(tmp_path), batch_size=10, flush_interval=0.01)
+    yield writer
+    writer.close()
+    allure_writer._writers.remove(writer)
+
+
+def stored_name(body: bytes, suffix: str) -> str:
+    return f"{hashlib.sha256(body).hexdigest()[:32]}-attachment{suffix}"
+
+
+class TestAsyncAllureFileLogger:
+    """백그라운드 Allure 결과 기록"""
+
+    def test_duplicate_attachment_stored_once(self, writer, tmp_path):
+        """같은 내용의 첨부는 한 파일로 저장하고 결과(중첩 step 포함)의 참조를 그 파일로 바꾸는지 확인"""
+        writer.report_attached_data(SCREENSHOT, "a1-attachment.png")
+        writer.report_attached_data(SCREENSHOT, "a2-attachment.png")
+        writer.report_attached_data("log", "a3-attachment.txt")
+        result = model2.TestResult(
+            uuid="r1", name="test_a",
+            attachments=[model2.Attachment(name="failure", source="a1-attachment.png", type="image/png")],
+            steps=[model2.TestStepResult(name="step", attachments=[
+                model2.Attachment(name="retry", source="a2-attachment.png", type="image/png"),
+                model2.Attachment(name="log", source="a3-attachment.txt", type="text/plain"),
+            ])],
+        )
+        writer.report_result(result)
+        writer.close()
+
+        png, txt = stored_name(SCREENSHOT, ".png"), stored_name(b"log", ".txt")
+        results = list(tmp_path.glob("*-result.json"))
+        assert len(results) == 1
+        assert sorted(path.name for path in tmp_path.glob("*-attachment.*")) == sorted([png, txt])
+        saved = json.loads(results[0].read_text())
+        assert saved["attachments"][0]["source"] == png
+        assert [a["source"] for a in saved["steps"][0]["attachments"]] == [png, txt]
+        assert (writer.deduplicated, writer.errors) == (1, [])
+
+    def test_flush_waits_for_queue(self, writer, tmp_path):
+        """flush 후에는 그때까지 받은 결과가 파일로 기록되어 있는지 확인"""
+        writer.report_result(model2.TestResult(uuid="r2", name="test_b"))
+
+        assert writer.flush(5)
+        assert len(list(tmp_path.glob("*-result.json"))) == 1
+
+    def test_write_error_does_not_stop_writer(self, writer, tmp_path):
+        """기록 실패는 errors에 남기고 다음 작업을 계속 기록하는지 확인"""
+        writer.report_attached_file(str(tmp_path / "missing.png"), "a4-attachment.png")
+        writer.report_result(model2.TestResult(uuid="r3", name="test_c"))
+        writer.flush(5)
+
+        assert len(writer.errors) == 1 and "FileNotFoundError" in writer.errors[0]
+        assert len(list(tmp_path.glob("*-result.json"))) == 1
+
+
+class TestInstall:
+    """allure-pytest 기록기 교체"""
+
+    def test_replaces_file_logger(self, monkeypatch):
+        """allure-pytest 설정 전이면 AllureFileLogger를 교체하는지 확인"""
+        monkeypatch.setattr(allure_pytest.plugin, "AllureFileLogger", None)
+        config = FakeConfig()
+
+        assert allure_writer.install(config)
+        assert allure_pytest.plugin.AllureFileLogger is AsyncAllureFileLogger
+        assert config.warnings == []
+
+    def test_warns_when_already_configured(self, monkeypatch):
+        """allure_listener가 이미 등록되어 있으면 교체하지 않고 경고하는지 확인"""
+        monkeypatch.setattr(allure_pytest.plugin, "AllureFileLogger", None)
+        config = FakeConfig(plugins=("allure_listener",))
+
+        assert not allure_writer.install(config)
+        assert allure_pytest.plugin.AllureFileLogger is None
+        assert "ALLURE_ASYNC_WRITER" in str(config.warnings[0])
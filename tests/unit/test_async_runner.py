@@ -0,0 +1,112 @@
+import asyncio
+import threading
+
+import pytest
+
+from pages.aio.base_page import BasePage
+from utils.async_runner import AsyncContextFactory, AsyncRunner
+from utils.config import Config
+
+
+class FakePage:
+    def __init__(self):
+        self.timeouts = {}
+
+    def set_default_timeout(self, timeout):
+        self.timeouts["default"] = timeout
+
+    def set_default_navigation_timeout(self, timeout):
+        self.timeouts["navigation"] = timeout
+
+
+class FakeContext:
+    def __init__(self, **args):
+        self.args = args
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **args):
+        self.contexts.append(FakeContext(**args))
+        return self.contexts[-1]
+
+
+@pytest.fixture
+def runner():
+    runner = AsyncRunner().start()
+    yield runner
+    runner.stop()
+
+
+class TestAsyncRunner:
+    """백그라운드 이벤트 루프"""
+
+    def test_run_on_background_thread(self, runner):
+        """코루틴이 메인 스레드가 아닌 runner 스레드에서 실행되는지 확인"""
+        async def current_thread():
+            return threading.current_thread().name
+
+        assert runner.run(current_thread()) == "async-runner"
+
+    def test_gather_keeps_order(self, runner):
+        """gather 결과가 완료 순서가 아닌 인자 순서인지 확인"""
+        async def delayed(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        assert runner.gather(delayed("a", 0.02), delayed("b", 0)) == ["a", "b"]
+
+    def test_exception_propagates(self, runner):
+        """코루틴의 예외가 호출한 쪽으로 전달되는지 확인"""
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            runner.run(fail())
+
+
+class TestAsyncContextFactory:
+    """테스트별 비동기 컨텍스트 생성"""
+
+    def test_new_page_per_context(self, runner):
+        """new_page마다 컨텍스트를 만들고 storage_state와 prepare_context를 적용하는지 확인"""
+        browser = FakeBrowser()
+        prepared = []
+
+        async def prepare_context(context):
+            prepared.append(context)
+
+        factory = AsyncContextFactory(browser, {"viewport": None}, prepare_context)
+        runner.gather(factory.new_page(), factory.new_page(storage_state="state.json"))
+
+        assert [context.args.get("storage_state") for context in browser.contexts] == [None, "state.json"]
+        assert prepared == browser.contexts
+
+    def test_close_all_contexts(self, runner):
+        """close가 생성한 컨텍스트를 모두 닫는지 확인"""
+        browser = FakeBrowser()
+        factory = AsyncContextFactory(browser, {})
+        runner.gather(factory.new_page(), factory.new_page())
+
+        runner.run(factory.close())
+
+        assert all(context.closed for context in browser.contexts)
+        assert factory.contexts == []
+
+
+def test_aio_base_page_sets_timeouts():
+    """비동기 BasePage도 동기 버전처럼 기본/탐색 타임아웃을 설정하는지 확인"""
+    page = FakePage()
+
+    BasePage(page)
+
+    assert page.timeouts == {"default": Config.DEFAULT_TIMEOUT, "navigation": Config.PAGE_LOAD_TIMEOUT}
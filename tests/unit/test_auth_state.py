@@ -0,0 +1,110 @@
+import json
+import os
+
+import pytest
+
+from data.users import Users
+from utils.auth_state import AuthStateCache
+from utils.config import Config
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **kwargs):
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """UI 로그인 대신 빈 storage_state를 저장하는 AuthStateCache"""
+    cache = AuthStateCache(FakeBrowser(), state_dir=str(tmp_path), max_age=600)
+    cache.logins = []
+
+    def login_and_save(user, path):
+        cache.logins.append((user.username, Config.BASE_URL))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"cookies": [], "origins": []}, f)
+
+    monkeypatch.setattr(cache, "_login_and_save", login_and_save)
+    return cache
+
+
+class TestAuthStateCache:
+    """사용자별 로그인 상태 캐시"""
+
+    def test_logs_in_once_per_user(self, cache):
+        """같은 사용자는 세션 동안 한 번만 로그인하는지 확인"""
+        first = cache.get(Users.STANDARD)
+        second = cache.get(Users.STANDARD)
+
+        assert first == second
+        assert cache.logins == [(Users.STANDARD.username, Config.BASE_URL)]
+
+    def test_reuses_fresh_file_from_previous_session(self, cache, tmp_path):
+        """만료되지 않은 파일이 있으면 새 세션에서도 로그인하지 않는지 확인"""
+        path = cache.get(Users.STANDARD)
+        next_session = AuthStateCache(FakeBrowser(), state_dir=str(tmp_path), max_age=600)
+
+        assert next_session.get(Users.STANDARD) == path
+
+    def test_expired_file_logs_in_again(self, cache):
+        """max_age보다 오래된 파일은 다시 로그인하는지 확인"""
+        path = cache.get(Users.STANDARD)
+        os.utime(path, (0, 0))
+        cache._checked.clear()
+
+        cache.get(Users.STANDARD)
+
+        assert len(cache.logins) == 2
+
+    def test_path_depends_on_target_origin(self, cache, monkeypatch):
+        """대상 출처가 바뀌면 다른 파일에 다시 로그인하는지 확인"""
+        monkeypatch.setattr(Config, "BASE_URL", "https://www.saucedemo.com")
+        remote = cache.get(Users.STANDARD)
+        monkeypatch.setattr(Config, "BASE_URL", "http://127.0.0.1:8000")
+        local = cache.get(Users.STANDARD)
+
+        assert remote != local
+        assert [url for _, url in cache.logins] == ["https://www.saucedemo.com", "http://127.0.0.1:8000"]
+
+    def test_same_origin_shares_path(self, cache, monkeypatch):
+        """경로만 다른 URL은 같은 출처로 보고 같은 파일을 사용하는지 확인"""
+        monkeypatch.setattr(Config, "BASE_URL", "https://www.saucedemo.com")
+        first = cache._state_path(Users.STANDARD)
+        monkeypatch.setattr(Config, "BASE_URL", "https://www.saucedemo.com/inventory.html")
+
+        assert cache._state_path(Users.STANDARD) == first
+
+    def test_invalidate_removes_file(self, cache):
+        """invalidate 후 파일이 삭제되고 다음 get에서 다시 로그인하는지 확인"""
+        path = cache.get(Users.STANDARD)
+        cache.invalidate(Users.STANDARD)
+
+        assert not os.path.exists(path)
+        cache.get(Users.STANDARD)
+        assert len(cache.logins) == 2
+
+
+def test_login_context_closed_when_prepare_fails(tmp_path):
+    """prepare_context가 실패해도 로그인용 컨텍스트를 닫는지 확인"""
+    browser = FakeBrowser()
+
+    def prepare_context(context):
+        raise RuntimeError("route setup failed")
+
+    cache = AuthStateCache(browser, state_dir=str(tmp_path), prepare_context=prepare_context)
+
+    with pytest.raises(RuntimeError):
+        cache.get(Users.STANDARD)
+    assert browser.contexts and all(context.closed for context in browser.contexts)
@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils import budgets
+from utils.budgets import LatencyRecorder, check, marker_budgets, parse_budgets, summarize, timed
+from utils.config import Config
+
+
+class FakeItem:
+    def __init__(self, *markers):
+        self.markers = [SimpleNamespace(kwargs=kwargs) for kwargs in markers]
+
+    def iter_markers(self, name):
+        # pytest와 같이 가장 가까운 마커(함수)부터 반환
+        return iter(self.markers)
+
+
+class FakePageObject:
+    RESULT = ".result"
+
+    def __init__(self):
+        self.page = SimpleNamespace(wait_for_selector=self._wait)
+        self.waited = []
+
+    def _wait(self, selector, state, timeout):
+        self.waited.append(selector)
+
+    @timed("submit", settle="RESULT")
+    def submit(self):
+        return self
+
+
+class TestSummarize:
+    """워밍업 제외 통계"""
+
+    @pytest.mark.parametrize("stat, expected", [("median", 3), ("p95", 5), ("max", 5)])
+    def test_stats(self, stat, expected):
+        """median/p95/max를 계산하는지 확인"""
+        assert summarize([5, 1, 3, 2, 4], stat) == expected
+
+    def test_warmup_excluded(self):
+        """앞의 warmup개 샘플을 제외하는지 확인"""
+        assert summarize([100, 1, 2], "max", warmup=1) == 2
+        assert summarize([100], "max", warmup=1) is None
+
+
+class TestCheck:
+    """예산 판정"""
+
+    def test_reports_exceeded_actions(self):
+        """예산을 넘은 액션만 설명과 함께 반환하는지 확인"""
+        violations = check({"login": [900, 700], "sort": [100]}, {"login": 800, "sort": 200}, "max", 0)
+
+        assert violations == ["login: max=900ms > budget 800ms (samples=2, warmup=0)"]
+
+    def test_too_few_samples_not_judged(self):
+        """워밍업 제외 샘플이 min_samples보다 적으면 판정하지 않는지 확인"""
+        assert check({"login": [900, 900]}, {"login": 800}, "max", warmup=1, min_samples=2) == []
+        assert check({}, {"login": 800}, "max", 0) == []
+
+    def test_unknown_stat(self):
+        """지원하지 않는 통계는 ValueError인지 확인"""
+        with pytest.raises(ValueError, match="mean"):
+            check({}, {}, "mean", 0)
+
+
+class TestBudgetSources:
+    """예산 선언"""
+
+    def test_parse_budgets(self):
+        """'action=ms' 목록을 파싱하고 빈 항목은 무시하는지 확인"""
+        assert parse_budgets(" login=800, ,sort=200.5,") == {"login": 800.0, "sort": 200.5}
+
+    def test_marker_budgets_closest_wins(self):
+        """가까운 마커의 값이 먼 마커(클래스/모듈)의 값보다 우선하는지 확인"""
+        item = FakeItem({"login_ms": 500, "stat": "p95"}, {"login_ms": 800, "sort_ms": 200, "warmup": 1})
+
+        assert marker_budgets(item) == ({"login": 500.0, "sort": 200.0}, "p95", 1)
+
+    def test_env_overrides_page_objects(self, monkeypatch):
+        """LATENCY_BUDGETS 환경변수 값이 페이지 객체 예산보다 우선하는지 확인"""
+        monkeypatch.setattr(Config, "LATENCY_BUDGETS", "login=1")
+
+        assert budgets.page_object_budgets()["login"] == 1.0
+
+
+class TestTimed:
+    """액션 측정 데코레이터"""
+
+    def test_not_measured_without_recorder(self):
+        """recorder가 없으면 측정/대기 없이 실행만 하는지 확인"""
+        page_object = FakePageObject()
+        budgets.set_active(None)  # LatencyBudgets 플러그인이 이 테스트에도 recorder를 지정하므로 해제
+
+        assert page_object.submit() is page_object
+        assert page_object.waited == []
+
+    def test_records_after_settle(self):
+        """recorder가 있으면 settle 요소를 기다린 뒤 소요 시간을 기록하는지 확인"""
+        page_object = FakePageObject()
+        recorder = LatencyRecorder()
+        budgets.set_active(recorder)
+        try:
+            page_object.submit()
+        finally:
+            budgets.set_active(None)
+
+        assert page_object.waited == [".result"]
+        assert len(recorder.samples["submit"]) == 1
@@ -0,0 +1,67 @@
+from pages.base_page import BasePage
+
+
+class FakePage:
+    """evaluate 호출을 기록하고 정해진 결과를 반환하는 페이지"""
+
+    def __init__(self, result):
+        self.result = result
+        self.evaluations = []
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+    def evaluate(self, script, arg):
+        self.evaluations.append((script, arg))
+        return self.result
+
+
+class TestBulkReadArgs:
+    """read_all/read_record_sets 인자 변환"""
+
+    def test_selector_and_attribute_specs(self):
+        """CSS 셀렉터는 텍스트, (셀렉터, 속성) 튜플은 속성 읽기로 변환되는지 확인"""
+        args = BasePage._bulk_read_args([".name", (".img", "src")])
+
+        assert args == [[".name", None], [".img", "src"]]
+
+    def test_record_fields(self):
+        """레코드 필드는 하위 셀렉터/속성/컨테이너 자체(None)로 변환되는지 확인"""
+        args = BasePage._record_sets_args({
+            "items": (".item", {"name": ".name", "id": (".btn", "data-test"), "self": None}),
+        })
+
+        assert args == {"items": [".item", {"name": [".name", None], "id": [".btn", "data-test"], "self": [None, None]}]}
+
+
+class TestBulkRead:
+    """여러 요소를 evaluate 1회로 읽기"""
+
+    def test_read_all_single_evaluate(self):
+        """여러 셀렉터를 한 번의 evaluate로 읽는지 확인"""
+        page = FakePage([["a", "b"], ["1", "2"]])
+
+        result = BasePage(page).read_all(".name", (".price", "data-value"))
+
+        assert result == [["a", "b"], ["1", "2"]]
+        assert len(page.evaluations) == 1
+        assert page.evaluations[0][1] == [[".name", None], [".price", "data-value"]]
+
+    def test_get_all_texts(self):
+        """get_all_texts/get_all_attributes는 첫 번째 결과 목록을 반환하는지 확인"""
+        page = FakePage([["x", "y"]])
+        base = BasePage(page)
+
+        assert base.get_all_texts(".name") == ["x", "y"]
+        assert base.get_all_attributes(".img", "src") == ["x", "y"]
+        assert page.evaluations[1][1] == [[".img", "src"]]
+
+    def test_read_records(self):
+        """read_records는 records 키의 레코드 목록을 반환하는지 확인"""
+        page = FakePage({"records": [{"name": "a"}]})
+
+        assert BasePage(page).read_records(".item", {"name": ".name"}) == [{"name": "a"}]
+        assert list(page.evaluations[0][1]) == ["records"]
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from data.products import Products
+from utils.cart_seeder import CART_STORAGE_KEY, CartSeedError, CartSeeder
+from utils.config import Config
+from utils.storage_state import BLANK_PATH
+
+BASE_URL = "https://www.saucedemo.com"
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    def route(self, url, handler):
+        self.routes.append(url)
+
+    def unroute(self, url, handler):
+        self.routes.remove(url)
+
+
+class FakePage:
+    def __init__(self, url="about:blank"):
+        self.url = url
+        self.context = FakeContext()
+        self.visited = []
+        self.writes = []  # (쓰기 시점 URL, key, value)
+
+    def goto(self, url):
+        self.visited.append(url)
+        self.url = url
+
+    def evaluate(self, script, args):
+        self.writes.append((self.url, *args))
+
+
+class FakeInventoryPage:
+    def __init__(self, badge_count):
+        self.badge_count = badge_count
+        self.opened = False
+
+    def open(self):
+        self.opened = True
+
+    def get_cart_badge_count(self):
+        return self.badge_count
+
+
+@pytest.fixture(autouse=True)
+def target_origin(monkeypatch):
+    monkeypatch.setattr(Config, "BASE_URL", BASE_URL)
+
+
+class TestCartSeeder:
+    """저장소 장바구니 기록"""
+
+    def test_seed_writes_product_ids(self):
+        """상품 ID 목록을 JSON으로 기록하고 이름도 Product로 변환하는지 확인"""
+        page = FakePage(f"{BASE_URL}/inventory.html")
+
+        products = CartSeeder(page).seed(Products.BACKPACK, "Sauce Labs Onesie")
+
+        assert products == [Products.BACKPACK, Products.ONESIE]
+        assert page.writes == [(page.url, CART_STORAGE_KEY, json.dumps([4, 2]))]
+        assert page.visited == []
+
+    def test_clear_removes_key(self):
+        """clear와 빈 seed는 키를 삭제(None)하는지 확인"""
+        page = FakePage(f"{BASE_URL}/inventory.html")
+        seeder = CartSeeder(page)
+        seeder.seed()
+        seeder.clear()
+
+        assert [value for _, _, value in page.writes] == [None, None]
+
+    def test_other_origin_uses_blank_document(self):
+        """현재 페이지가 사이트 출처가 아니면 라우팅된 빈 문서에서 기록하고 라우팅을 해제하는지 확인"""
+        page = FakePage()
+
+        CartSeeder(page).seed(Products.BACKPACK)
+
+        assert page.writes == [(BASE_URL + BLANK_PATH, CART_STORAGE_KEY, "[4]")]
+        assert page.context.routes == []
+
+
+class TestOpen:
+    """기록한 장바구니로 페이지 열기"""
+
+    def test_badge_matches(self):
+        """배지 수가 기록한 상품 수와 같으면 페이지 객체를 반환하는지 확인"""
+        seeder = CartSeeder(FakePage(f"{BASE_URL}/"))
+        seeder.seed(Products.BACKPACK, Products.ONESIE)
+        inventory = FakeInventoryPage(badge_count=2)
+
+        assert seeder.open(inventory) is inventory and inventory.opened
+
+    def test_badge_mismatch(self):
+        """배지 수가 다르면 CartSeedError인지 확인"""
+        seeder = CartSeeder(FakePage(f"{BASE_URL}/"))
+        seeder.seed(Products.BACKPACK)
+
+        with pytest.raises(CartSeedError, match=r"\(0\).*\(1\)"):
+            seeder.open(FakeInventoryPage(badge_count=0))
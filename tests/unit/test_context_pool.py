@@ -0,0 +1,176 @@
+import pytest
+
+from utils.context_pool import ContextLeakError, ContextPool
+from utils.storage_state import BLANK_PATH, origin_of
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+        self.heap = 0
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    def goto(self, url):
+        self.url = url
+
+    def evaluate(self, script, arg=None):
+        if "usedJSHeapSize" in script:
+            return self.heap
+        if "localStorage.clear" in script:
+            self.context.local_storage.pop(origin_of(self.url), None)
+            return 0
+        return None
+
+    def close(self):
+        self.closed = True
+        self.context.pages.remove(self)
+
+    def unroute_all(self, behavior=None):
+        pass
+
+
+class FakeContext:
+    def __init__(self, **args):
+        self.args = args
+        self.pages = []
+        self.cookies = []
+        self.local_storage = {}
+        self.closed = False
+
+    def new_page(self):
+        self.pages.append(FakePage(self))
+        return self.pages[-1]
+
+    def on(self, event, handler):
+        pass
+
+    def storage_state(self):
+        return {"cookies": list(self.cookies),
+                "origins": [{"origin": o, "localStorage": items} for o, items in self.local_storage.items()]}
+
+    def close(self):
+        self.closed = True
+
+    def route(self, url, handler):
+        pass
+
+    def unroute(self, url, handler):
+        pass
+
+    def unroute_all(self, behavior=None):
+        pass
+
+    def clear_cookies(self):
+        self.cookies = []
+
+    def clear_permissions(self):
+        pass
+
+    def set_extra_http_headers(self, headers):
+        pass
+
+    def set_offline(self, offline):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **args):
+        self.contexts.append(FakeContext(**args))
+        return self.contexts[-1]
+
+
+@pytest.fixture
+def pool():
+    return ContextPool(FakeBrowser(), max_uses=3, max_memory_mb=1)
+
+
+class TestContextPool:
+    """컨텍스트 대여/반납"""
+
+    def test_reuses_released_context(self, pool):
+        """반납한 컨텍스트를 같은 옵션의 다음 대여에서 재사용하는지 확인"""
+        first = pool.acquire({"viewport": {"width": 100}})
+        pool.release(first)
+        second = pool.acquire({"viewport": {"width": 100}})
+
+        assert second is first
+        assert (pool.created, pool.reused) == (1, 1)
+
+    def test_different_options_get_new_context(self, pool):
+        """옵션이 다르면 다른 컨텍스트를 생성하는지 확인 (storage_state는 키에서 제외)"""
+        first = pool.acquire({"viewport": {"width": 100}})
+        pool.release(first)
+        other = pool.acquire({"viewport": {"width": 200}})
+        pool.release(other)
+        same = pool.acquire({"viewport": {"width": 100}, "storage_state": {"cookies": [], "origins": []}})
+
+        assert other is not first and same is first
+        assert "storage_state" not in pool.browser.contexts[0].args
+
+    def test_reset_clears_state(self, pool):
+        """반납 시 쿠키/저장소/추가 페이지를 초기화하고 about:blank로 이동하는지 확인"""
+        pooled = pool.acquire({})
+        pooled.context.cookies.append({"name": "session-username"})
+        pooled.context.local_storage["https://www.saucedemo.com"] = [{"name": "cart-contents"}]
+        pooled.context.new_page()
+        pooled.page.url = "https://www.saucedemo.com/inventory.html"
+
+        pool.release(pooled)
+
+        state = pooled.context.storage_state()
+        assert state == {"cookies": [], "origins": []}
+        assert pooled.context.pages == [pooled.page] and pooled.page.url == "about:blank"
+
+    def test_recycled_after_max_uses(self, pool):
+        """max_uses회 사용한 컨텍스트는 닫고 새로 만드는지 확인"""
+        for _ in range(3):
+            pooled = pool.acquire({})
+            pool.release(pooled)
+
+        assert pooled.context.closed
+        assert pool.acquire({}).context is not pooled.context
+
+    def test_recycled_when_heap_too_large(self, pool):
+        """JS 힙이 max_memory_mb를 넘으면 닫는지 확인"""
+        pooled = pool.acquire({})
+        pooled.page.heap = 2 * 1024 * 1024
+
+        pool.release(pooled)
+
+        assert pooled.context.closed
+
+    def test_leak_detected(self, pool, monkeypatch):
+        """초기화 후 상태가 남으면 ContextLeakError를 발생시키고 컨텍스트를 닫는지 확인"""
+        pooled = pool.acquire({})
+        monkeypatch.setattr(pooled.context, "clear_cookies", lambda: None)
+        pooled.context.cookies.append({"name": "session-username"})
+
+        with pytest.raises(ContextLeakError, match="session-username"):
+            pool.release(pooled)
+        assert pooled.context.closed
+
+    def test_close(self, pool):
+        """close는 대기 중인 컨텍스트를 모두 닫는지 확인"""
+        pooled = pool.acquire({})
+        pool.release(pooled)
+
+        pool.close()
+
+        assert pooled.context.closed
+
+
+def test_origin_of():
+    """URL의 출처만 반환하고 http/https가 아니면 빈 문자열인지 확인"""
+    assert origin_of("https://www.saucedemo.com/inventory.html?x=1") == "https://www.saucedemo.com"
+    assert origin_of("http://127.0.0.1:8000" + BLANK_PATH) == "http://127.0.0.1:8000"
+    assert origin_of("about:blank") == ""
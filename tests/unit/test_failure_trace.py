@@ -0,0 +1,97 @@
+import os
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+from utils.config import Config
+from utils.failure_trace import FailureTracer, trace_path_for
+
+
+class FakeTracing:
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    def start(self, **options):
+        self.calls.append(("start", options))
+
+    def start_chunk(self, title):
+        self.calls.append(("start_chunk", title))
+
+    def stop_chunk(self, path=None):
+        if self.closed:
+            raise PlaywrightError("Target page, context or browser has been closed")
+        self.calls.append(("stop_chunk", path))
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+@pytest.fixture
+def tracer():
+    return FailureTracer(snapshots=True, screenshots=False, sources=False)
+
+
+def test_trace_path_for(monkeypatch):
+    """nodeid를 파일 이름으로 바꾸고 재시도는 attempt 접미사를 붙이는지 확인"""
+    monkeypatch.setattr(Config, "TRACE_DIR", "/reports/traces")
+
+    assert trace_path_for("tests/test_cart.py::TestCart::test_add[chromium]") == \
+        "/reports/traces/tests_test_cart.py_TestCart_test_add_chromium.zip"
+    assert trace_path_for("t.py::test_a", attempt=2) == "/reports/traces/t.py_test_a.attempt2.zip"
+
+
+class TestFailureTracer:
+    """실패한 테스트만 trace 저장"""
+
+    def test_start_once_per_context(self, tracer):
+        """재사용되는 컨텍스트에서는 tracing.start를 한 번만 호출하고 테스트마다 chunk를 나누는지 확인"""
+        context = FakeContext()
+        for title in ("test_a", "test_b"):
+            tracer.begin(context, title)
+            tracer.end(context)
+
+        assert [name for name, _ in context.tracing.calls] == \
+            ["start", "start_chunk", "stop_chunk", "start_chunk", "stop_chunk"]
+        assert context.tracing.calls[0][1] == {"snapshots": True, "screenshots": False, "sources": False}
+
+    def test_passed_discarded(self, tracer):
+        """path 없이 끝내면 파일을 쓰지 않고 버린 것으로 세는지 확인"""
+        context = FakeContext()
+        tracer.begin(context, "test_a")
+        tracer.end(context)
+
+        assert context.tracing.calls[-1] == ("stop_chunk", None)
+        assert (tracer.saved, tracer.discarded) == (0, 1)
+
+    def test_failed_saved(self, tracer, tmp_path):
+        """path를 주면 저장 디렉터리를 만들고 저장한 것으로 세는지 확인"""
+        context = FakeContext()
+        path = str(tmp_path / "traces" / "t.zip")
+        tracer.begin(context, "test_a")
+        tracer.end(context, path)
+
+        assert os.path.isdir(tmp_path / "traces")
+        assert context.tracing.calls[-1] == ("stop_chunk", path)
+        assert tracer.saved == 1
+
+    def test_end_without_begin_ignored(self, tracer):
+        """기록을 시작하지 않은 컨텍스트는 무시하는지 확인"""
+        context = FakeContext()
+        tracer.end(context, "unused.zip")
+
+        assert context.tracing.calls == []
+
+    def test_closed_context_restarts(self, tracer):
+        """닫힌 컨텍스트는 기록을 잊고 같은 객체로 다시 시작하면 start부터 호출하는지 확인"""
+        context = FakeContext()
+        tracer.begin(context, "test_a")
+        context.tracing.closed = True
+        tracer.end(context)
+        context.tracing.closed = False
+        tracer.begin(context, "test_b")
+
+        assert [name for name, _ in context.tracing.calls] == ["start", "start_chunk", "start", "start_chunk"]
+        assert (tracer.saved, tracer.discarded) == (0, 0)
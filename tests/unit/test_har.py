@@ -0,0 +1,98 @@
+import base64
+import json
+
+import pytest
+
+from utils.config import Config
+from utils.har import HarIndex, har_path_for
+
+
+def _entry(url, status=200, text="ok", method="GET", post_data=None, encoding=None, headers=None):
+    request = {"method": method, "url": url}
+    if post_data is not None:
+        request["postData"] = {"text": post_data}
+    content = {"text": text}
+    if encoding:
+        content["encoding"] = encoding
+    return {"request": request, "response": {"status": status, "headers": headers or [], "content": content}}
+
+
+def _write_har(path, *entries):
+    path.write_text(json.dumps({"log": {"entries": list(entries)}}))
+
+
+class FakeRequest:
+    def __init__(self, url, method="GET", post_data=None):
+        self.url = url
+        self.method = method
+        self.post_data = post_data
+
+
+class FakeRoute:
+    def __init__(self, url, **kwargs):
+        self.request = FakeRequest(url, **kwargs)
+        self.result = None
+
+    def fulfill(self, status, headers, body):
+        self.result = ("fulfill", status, headers, body)
+
+    def fallback(self):
+        self.result = ("fallback",)
+
+    def abort(self, error_code):
+        self.result = ("abort", error_code)
+
+
+def test_har_path_for(monkeypatch):
+    """nodeid의 특수 문자를 _로 바꾼 파일 이름을 사용하는지 확인"""
+    monkeypatch.setattr(Config, "HAR_DIR", "/har")
+
+    assert har_path_for("tests/test_login.py::TestLogin::test_ok[standard]") == \
+        "/har/tests_test_login.py_TestLogin_test_ok_standard.har"
+
+
+class TestHarIndex:
+    """HAR 응답 인덱스"""
+
+    def test_load_dir(self, tmp_path):
+        """디렉터리의 .har 파일을 모두 읽고 나중 파일의 응답이 우선하는지 확인"""
+        _write_har(tmp_path / "a.har", _entry("https://x/a", text="first"), _entry("https://x/b"))
+        _write_har(tmp_path / "b.har", _entry("https://x/a", text="second"))
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        index = HarIndex.load_dir(str(tmp_path))
+
+        assert len(index) == 2
+        assert index.lookup("GET", "https://x/a")["content"]["text"] == "second"
+
+    def test_lookup_key(self, tmp_path):
+        """method(대소문자 무시), fragment 제외 URL, POST 본문으로 조회하는지 확인"""
+        _write_har(tmp_path / "a.har", _entry("https://x/login", method="POST", post_data="u=1"))
+        index = HarIndex.load_dir(str(tmp_path))
+
+        assert index.lookup("post", "https://x/login#top", "u=1") is not None
+        assert index.lookup("POST", "https://x/login", "u=2") is None
+        assert index.lookup("GET", "https://x/login") is None
+
+    def test_fulfill_decodes_body(self, tmp_path):
+        """base64 본문을 디코딩하고 전송 관련 헤더는 제외해 응답하는지 확인"""
+        headers = [{"name": "Content-Type", "value": "image/png"}, {"name": "Content-Encoding", "value": "gzip"}]
+        _write_har(tmp_path / "a.har", _entry("https://x/a.png", text=base64.b64encode(b"\x89PNG").decode(),
+                                              encoding="base64", headers=headers))
+        route = FakeRoute("https://x/a.png")
+
+        HarIndex.load_dir(str(tmp_path))._handle(route)
+
+        assert route.result == ("fulfill", 200, {"Content-Type": "image/png"}, b"\x89PNG")
+
+    @pytest.mark.parametrize("not_found, expected", [
+        ("abort", ("abort", "internetdisconnected")),
+        ("fallback", ("fallback",)),
+    ])
+    def test_not_found(self, not_found, expected):
+        """녹화본에 없는 요청은 HAR_NOT_FOUND에 따라 차단하거나 실제 네트워크로 보내는지 확인"""
+        route = FakeRoute("https://x/missing")
+
+        HarIndex(not_found)._handle(route)
+
+        assert route.result == expected
@@ -0,0 +1,155 @@
+import pytest
+
+from utils import impact
+from utils.impact import affected, changed_keys, full_run_reason, parse_diff
+
+DIFF = """\
+diff --git a/pages/cart_page.py b/pages/cart_page.py
+index 1111111..2222222 100644
+--- a/pages/cart_page.py
++++ b/pages/cart_page.py
+@@ -10,0 +11,2 @@ class CartPage(BasePage):
++    def remove_all(self):
++        pass
+@@ -20 +22 @@ class CartPage(BasePage):
+-        return 1
++        return 2
+@@ -30,2 +31,0 @@ class CartPage(BasePage):
+-    X = 1
+-    Y = 2
+diff --git a/data/old.py b/data/old.py
+deleted file mode 100644
+--- a/data/old.py
++++ /dev/null
+@@ -1,3 +0,0 @@
+-A = 1
+diff --git a/docs/logo.png b/docs/logo.png
+Binary files a/docs/logo.png and b/docs/logo.png differ
+"""
+
+SOURCE = '''\
+import os
+
+TIMEOUT = 10
+
+
+class CartPage:
+    ITEM = ".cart_item"
+
+    @property
+    def count(self):
+        return 1
+
+    def remove(self, name):
+        def click():
+            return name
+        return click()
+'''
+
+CART = "pages/cart_page.py"
+CHECKOUT = "pages/checkout_page.py"
+TESTS = {
+    "tests/test_cart.py::test_remove": {
+        "methods": [f"{CART}::CartPage.remove"], "classes": [f"{CART}::CartPage"],
+        "fixtures": ["conftest.py::cart_page"], "data": ["data/products.py::Products"],
+    },
+    "tests/test_checkout.py::test_finish": {
+        "methods": [f"{CHECKOUT}::CheckoutStepTwoPage.click_finish"], "classes": [f"{CHECKOUT}::CheckoutStepTwoPage"],
+        "fixtures": ["conftest.py::checkout_page"], "data": [],
+    },
+}
+NODEIDS = list(TESTS) + ["tests/test_new.py::test_new"]
+
+
+def test_parse_diff():
+    """추가/변경/삭제 hunk의 줄 번호를 모으고 삭제/바이너리 파일은 None으로 표시하는지 확인"""
+    assert parse_diff(DIFF) == {
+        CART: {11, 12, 22, 31, 32},  # 삭제만 있는 hunk(+31,0)는 삭제 위치 앞뒤 줄
+        "data/old.py": None,
+        "docs/logo.png": None,
+    }
+
+
+class TestChangedKeys:
+    """변경된 줄 → 의존성 키"""
+
+    @pytest.fixture(autouse=True)
+    def source(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(impact, "ROOT", str(tmp_path))
+        (tmp_path / "pages").mkdir()
+        (tmp_path / CART).write_text(SOURCE)
+
+    @pytest.mark.parametrize("line, key", [
+        (3, CART),                                   # 모듈 수준 코드
+        (7, f"{CART}::CartPage.ITEM"),               # 클래스 속성
+        (9, f"{CART}::CartPage.count"),              # 데코레이터 줄은 함수에 포함
+        (15, f"{CART}::CartPage.remove.<locals>.click"),
+        (16, f"{CART}::CartPage.remove"),
+    ])
+    def test_innermost_span(self, line, key):
+        """변경된 줄을 감싸는 가장 안쪽 함수/클래스/속성의 키를 반환하는지 확인"""
+        assert changed_keys(CART, {line}) == {key}
+
+    def test_whole_file(self, tmp_path):
+        """파일 전체 변경, .py가 아닌 파일, 없는 파일은 파일 경로를 키로 하는지 확인"""
+        assert changed_keys(CART, None) == {CART}
+        assert changed_keys("pages/readme.txt", {1}) == {"pages/readme.txt"}
+        assert changed_keys("pages/missing.py", {1}) == {"pages/missing.py"}
+
+
+class TestFullRunReason:
+    """전체 실행 판단"""
+
+    def test_selective(self):
+        """기록된 파일의 변경과 테스트 파일 변경은 선택 실행인지 확인"""
+        changes = {CART: [f"{CART}::CartPage.remove"], "tests/test_cart.py": ["tests/test_cart.py"],
+                   "conftest.py": ["conftest.py::cart_page"]}
+
+        assert full_run_reason(changes, TESTS) is None
+
+    @pytest.mark.parametrize("changes, reason", [
+        ({"utils/config.py": ["utils/config.py::Config"]}, "utils/config.py 변경"),
+        ({"pages/about_page.py": ["pages/about_page.py::AboutPage"]}, "(의존성 기록 없음)"),
+        ({"conftest.py": ["conftest.py::pytest_configure"]}, "fixture가 아닌 conftest 코드"),
+    ])
+    def test_full_run(self, changes, reason):
+        """분석 범위 밖, 기록 없는 파일, fixture가 아닌 conftest 코드 변경은 전체 실행인지 확인"""
+        assert reason in full_run_reason(changes, TESTS)
+
+
+class TestAffected:
+    """영향 받는 테스트 선택"""
+
+    def test_recorded_method(self):
+        """기록된 메서드가 바뀌면 그 메서드를 실행한 테스트만 선택하는지 확인 (기록 없는 테스트는 항상 선택)"""
+        changes = {CART: [f"{CART}::CartPage.remove"]}
+
+        assert affected(NODEIDS, changes, TESTS) == {"tests/test_cart.py::test_remove", "tests/test_new.py::test_new"}
+
+    def test_unrecorded_member_uses_class(self):
+        """어떤 테스트도 기록하지 않은 메서드/속성은 클래스를 사용한 테스트를 선택하는지 확인"""
+        changes = {CHECKOUT: [f"{CHECKOUT}::CheckoutStepTwoPage.TOTAL_LABEL"]}
+
+        assert "tests/test_checkout.py::test_finish" in affected(NODEIDS, changes, TESTS)
+
+    def test_module_level_change(self):
+        """파일 경로 키(모듈 수준 변경)는 그 파일의 무엇이든 사용한 테스트를 선택하는지 확인"""
+        assert "tests/test_cart.py::test_remove" in affected(NODEIDS, {CART: [CART]}, TESTS)
+
+    def test_data_change_selects_by_file(self):
+        """data/ 변경은 같은 파일의 클래스를 참조한 테스트를 선택하는지 확인"""
+        changes = {"data/products.py": ["data/products.py::_sort_orders"]}
+
+        assert affected(list(TESTS), changes, TESTS) == {"tests/test_cart.py::test_remove"}
+
+    def test_changed_test_file(self):
+        """변경된 테스트 파일의 테스트를 선택하는지 확인"""
+        changes = {"tests/test_checkout.py": ["tests/test_checkout.py"]}
+
+        assert affected(list(TESTS), changes, TESTS) == {"tests/test_checkout.py::test_finish"}
+
+    def test_unrelated_fixture_change(self):
+        """다른 테스트의 fixture 변경은 선택하지 않는지 확인"""
+        changes = {"conftest.py": ["conftest.py::checkout_page"]}
+
+        assert affected(list(TESTS), changes, TESTS) == {"tests/test_checkout.py::test_finish"}
@@ -0,0 +1,139 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from utils import instrumentation
+from utils.config import Config
+from utils.instrumentation import ActionEvent, ActionTracer, instrumented, parse_exports
+
+
+class FakePageObject:
+    def __init__(self):
+        self.waited = []
+        self.page = SimpleNamespace(wait_for_selector=lambda selector, state: self.waited.append((selector, state)))
+
+    @instrumented("click", wait_state="visible")
+    def click(self, selector):
+        return self
+
+    @instrumented("is_visible", wait_only=True)
+    def is_visible(self, selector):
+        return selector == "#shown"
+
+    @instrumented("fill")
+    def fill(self, selector, text):
+        raise RuntimeError("detached")
+
+
+@pytest.fixture
+def tracer():
+    tracer = ActionTracer(capacity=10)
+    instrumentation.set_active(tracer)
+    yield tracer
+    instrumentation.set_active(None)
+
+
+def event(action="click", start=1.0, wait=2.0, act=3.0, status="ok"):
+    return ActionEvent(action, "#btn", start, wait, act, status)
+
+
+class TestActionTracer:
+    """액션 기록 링 버퍼"""
+
+    def test_ring_buffer_drops_oldest(self):
+        """capacity를 넘으면 오래된 기록을 버리고 dropped를 세는지 확인"""
+        tracer = ActionTracer(capacity=2)
+        for start in (1.0, 2.0, 3.0):
+            tracer.record(event(start=start))
+
+        assert [e.start for e in tracer.events] == [2.0, 3.0]
+        assert tracer.dropped == 1
+
+    def test_listeners_receive_events(self):
+        """등록한 listener가 액션마다 호출되는지 확인"""
+        tracer = ActionTracer(capacity=2)
+        received = []
+        tracer.add_listener(received.append)
+        tracer.record(event())
+
+        assert received == [event()]
+
+    def test_chrome_trace_phases(self):
+        """액션 구간 아래에 0보다 긴 wait/act 구간만 us 단위로 추가하는지 확인"""
+        tracer = ActionTracer(capacity=2)
+        tracer.record(event(start=1.0, wait=2.0, act=3.0))
+        tracer.record(event(action="is_visible", start=10.0, wait=4.0, act=0.0))
+
+        spans = [(e["name"], e["ts"], e["dur"]) for e in tracer.to_chrome_trace("t::a")["traceEvents"] if e["ph"] == "X"]
+
+        assert spans == [("click", 1000.0, 5000.0), ("wait", 1000.0, 2000.0), ("act", 3000.0, 3000.0),
+                         ("is_visible", 10000.0, 4000.0), ("wait", 10000.0, 4000.0)]
+
+    def test_append_jsonl(self, tmp_path):
+        """액션당 한 줄씩 nodeid와 함께 추가하는지 확인"""
+        tracer = ActionTracer(capacity=2)
+        tracer.record(event())
+        path = str(tmp_path / "actions.jsonl")
+        instrumentation.append_jsonl(path, "t::a", tracer)
+
+        record = json.loads(open(path, encoding="utf-8").read())
+        assert record["nodeid"] == "t::a" and record["duration_ms"] == 5.0
+
+
+class TestInstrumented:
+    """BasePage 액션 계측 데코레이터"""
+
+    def test_not_recorded_without_tracer(self):
+        """tracer가 없으면 대기 없이 원래 메서드만 실행하는지 확인"""
+        page_object = FakePageObject()
+        instrumentation.set_active(None)
+
+        page_object.click("#btn")
+
+        assert page_object.waited == []
+
+    def test_single_span_by_default(self, tracer, monkeypatch):
+        """INSTRUMENT_SPLIT_WAIT가 꺼져 있으면 별도 대기 없이 전체를 실행 시간으로 기록하는지 확인"""
+        monkeypatch.setattr(Config, "INSTRUMENT_SPLIT_WAIT", False)
+        page_object = FakePageObject()
+        page_object.click("#btn")
+
+        assert page_object.waited == []
+        assert tracer.events[0].wait == 0 and tracer.events[0].selector == "#btn"
+
+    def test_split_wait(self, tracer, monkeypatch):
+        """INSTRUMENT_SPLIT_WAIT면 액션 전에 wait_state까지 대기하는지 확인"""
+        monkeypatch.setattr(Config, "INSTRUMENT_SPLIT_WAIT", True)
+        page_object = FakePageObject()
+        page_object.click("#btn")
+
+        assert page_object.waited == [("#btn", "visible")]
+
+    def test_wait_only_status(self, tracer):
+        """wait_only 액션은 전체를 대기 시간으로, False 반환은 timeout으로 기록하는지 확인"""
+        page_object = FakePageObject()
+        page_object.is_visible("#shown")
+        page_object.is_visible("#missing")
+
+        assert [(e.status, e.act) for e in tracer.events] == [("ok", 0), ("timeout", 0)]
+
+    def test_exception_recorded_and_raised(self, tracer):
+        """예외는 클래스 이름을 상태로 기록하고 다시 발생시키는지 확인"""
+        with pytest.raises(RuntimeError):
+            FakePageObject().fill("#name", "x")
+
+        assert tracer.events[0].status == "RuntimeError"
+
+
+class TestParseExports:
+    """내보내기 형식 파싱"""
+
+    def test_parse(self):
+        """쉼표 목록을 파싱하고 빈 항목은 무시하는지 확인"""
+        assert parse_exports(" jsonl, ,trace") == ["jsonl", "trace"]
+
+    def test_unknown(self):
+        """지원하지 않는 형식은 ValueError인지 확인"""
+        with pytest.raises(ValueError, match="csv"):
+            parse_exports("jsonl,csv")
@@ -0,0 +1,123 @@
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+from data.users import Users
+from utils import journey_state
+from utils.journey_state import Journey, JourneySnapshot, JourneySnapshotCache
+
+JOURNEY = Journey("cart_with_backpack", steps=lambda inventory: None, verify=lambda page: True)
+
+
+class FakeAuthStateCache:
+    def __init__(self):
+        self.invalidated = []
+
+    def get(self, user):
+        return f"{user.username}.json"
+
+    def invalidate(self, user):
+        self.invalidated.append(user.username)
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **args):
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """스냅샷 생성/복원과 재실행을 기록으로 대체한 JourneySnapshotCache"""
+    cache = JourneySnapshotCache(FakeBrowser(), FakeAuthStateCache())
+    cache.builds = 0
+    cache.restore_ok = True
+
+    def build(journey, user):
+        cache.builds += 1
+        return JourneySnapshot({"cookies": [], "origins": []}, "http://app/cart.html", data="snapshot")
+
+    monkeypatch.setattr(cache, "_build", build)
+    monkeypatch.setattr(cache, "_restore", lambda context, page, journey, snapshot: cache.restore_ok)
+    monkeypatch.setattr(journey_state, "replay", lambda page, journey, user: "replayed")
+    return cache
+
+
+class TestJourneySnapshotCache:
+    """여정 스냅샷 생성/복원"""
+
+    def test_built_once_and_restored(self, cache):
+        """스냅샷은 한 번만 만들고 테스트마다 복원하는지 확인"""
+        results = [cache.enter(None, None, JOURNEY, Users.STANDARD) for _ in range(3)]
+
+        assert results == ["snapshot"] * 3
+        assert (cache.builds, cache.restored, cache.replayed) == (1, 3, 0)
+
+    def test_never_restored_snapshot_disabled(self, cache):
+        """만든 직후부터 복원에 실패하면 다시 만들지 않고 재실행으로 진행하는지 확인"""
+        cache.restore_ok = False
+        results = [cache.enter(None, None, JOURNEY, Users.STANDARD) for _ in range(2)]
+
+        assert results == ["replayed"] * 2
+        assert cache.builds == 1
+        assert cache.auth_state_cache.invalidated == []
+
+    def test_expired_snapshot_rebuilt(self, cache):
+        """복원에 성공했던 스냅샷이 실패하면 로그인 상태를 버리고 다음 테스트에서 다시 만드는지 확인"""
+        cache.enter(None, None, JOURNEY, Users.STANDARD)
+        cache.restore_ok = False
+        assert cache.enter(None, None, JOURNEY, Users.STANDARD) == "replayed"
+        cache.restore_ok = True
+
+        assert cache.enter(None, None, JOURNEY, Users.STANDARD) == "snapshot"
+        assert cache.builds == 2
+        assert cache.auth_state_cache.invalidated == [Users.STANDARD.username]
+
+    def test_build_failure_falls_back_to_replay(self, cache, monkeypatch):
+        """스냅샷 생성에 실패하면 이후 테스트는 재실행으로 진행하는지 확인"""
+        def fail(journey, user):
+            cache.builds += 1
+            raise PlaywrightError("net::ERR_CONNECTION_REFUSED")
+
+        monkeypatch.setattr(cache, "_build", fail)
+        results = [cache.enter(None, None, JOURNEY, Users.STANDARD) for _ in range(2)]
+
+        assert results == ["replayed"] * 2
+        assert cache.builds == 1
+
+    def test_disabled(self, cache):
+        """enabled=False면 스냅샷 없이 매번 재실행하는지 확인"""
+        cache.enabled = False
+
+        assert cache.enter(None, None, JOURNEY, Users.STANDARD) == "replayed"
+        assert cache.builds == 0
+
+    def test_snapshots_per_user(self, cache):
+        """사용자마다 별도 스냅샷을 만드는지 확인"""
+        cache.enter(None, None, JOURNEY, Users.STANDARD)
+        cache.enter(None, None, JOURNEY, Users.PERFORMANCE_GLITCH)
+
+        assert cache.builds == 2
+
+
+def test_build_closes_context_when_prepare_fails():
+    """prepare_context가 실패해도 스냅샷용 컨텍스트를 닫는지 확인"""
+    browser = FakeBrowser()
+
+    def prepare_context(context):
+        raise PlaywrightError("route setup failed")
+
+    cache = JourneySnapshotCache(browser, prepare_context=prepare_context)
+
+    assert cache.get(JOURNEY, Users.STANDARD) is None
+    assert browser.contexts and all(context.closed for context in browser.contexts)
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from data.products import Products
+from utils.load_test import STEPS, LoadRecorder, format_report, journey_products, percentile
+
+
+class TestPercentile:
+    """nearest-rank 백분위수"""
+
+    @pytest.mark.parametrize("p, expected", [(50, 5), (95, 10), (99, 10), (10, 1)])
+    def test_nearest_rank(self, p, expected):
+        """정렬된 값에서 ceil(p/100*n)번째 값을 반환하는지 확인"""
+        assert percentile(list(range(1, 11)), p) == expected
+
+    def test_empty(self):
+        """값이 없으면 0인지 확인"""
+        assert percentile([], 95) == 0.0
+
+
+class TestLoadRecorder:
+    """단계별 지연 시간 집계"""
+
+    def test_summary(self):
+        """단계별 count/백분위수/max, 실패 수, 처리량을 집계하는지 확인"""
+        recorder = LoadRecorder()
+        for value in (30.0, 10.0, 20.0):
+            recorder.record("login", value)
+        recorder.record_error("cart")
+        recorder.journeys = 3
+        recorder.started, recorder.finished = 0.0, 60.0
+
+        summary = recorder.summary()
+
+        assert summary["steps"]["login"] == {"count": 3, "p50": 20.0, "p95": 30.0, "p99": 30.0, "max": 30.0}
+        assert summary["steps"]["finish"]["count"] == 0
+        assert summary["errors"] == {"cart": 1}
+        assert summary["throughput_per_min"] == 3.0
+
+    def test_report_lists_every_step(self):
+        """보고서에 모든 단계가 한 줄씩 출력되는지 확인"""
+        recorder = LoadRecorder()
+        recorder.finished = time.perf_counter()
+
+        lines = format_report(recorder.summary()).splitlines()
+
+        assert [line.split()[0] for line in lines[2:]] == list(STEPS)
+
+
+class TestJourneyProducts:
+    """여정에서 담을 상품"""
+
+    def test_takes_first_items_in_display_order(self):
+        """인벤토리 표시 순서의 앞에서부터 items개를 반환하는지 확인"""
+        assert journey_products(2) == (Products.BACKPACK, Products.BIKE_LIGHT)
+        assert journey_products(len(Products.ALL)) == Products.ALL
+
+    @pytest.mark.parametrize("items", [0, len(Products.ALL) + 1])
+    def test_out_of_range(self, items):
+        """0개이거나 카탈로그보다 많으면 ValueError인지 확인"""
+        with pytest.raises(ValueError, match="items"):
+            journey_products(items)
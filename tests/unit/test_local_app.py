@@ -0,0 +1,84 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from data.products import Products
+from data.users import Users
+from local_app.server import PLACEHOLDER_PNG, SESSION_COOKIE, LocalApp, build_app_data
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = LocalApp(port=0, latency_ms=0, glitch_ms=0).start()
+    yield app
+    app.stop()
+
+
+def _get(app, path, cookie=None):
+    request = urllib.request.Request(app.url + path, headers={"Cookie": cookie} if cookie else {})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.status, response.headers["Content-Type"], response.read()
+
+
+class TestLocalAppServer:
+    """로컬 대체 서버 응답"""
+
+    @pytest.mark.parametrize("path", ["/", "/inventory.html", "/checkout-step-two.html?x=1"])
+    def test_pages_serve_shell(self, app, path):
+        """모든 화면 경로가 SPA 셸을 반환하는지 확인"""
+        status, content_type, body = _get(app, path)
+
+        assert status == 200 and content_type.startswith("text/html")
+        assert body == app.static_file("shell.html")
+
+    def test_config_script(self, app):
+        """config.js가 상품/사용자 데이터를 전달하는지 확인"""
+        _, content_type, body = _get(app, "/config.js")
+        data = json.loads(body.decode("utf-8").removeprefix("window.APP_DATA = ").rstrip(";\n"))
+
+        assert content_type.startswith("application/javascript")
+        assert [p["name"] for p in data["products"]] == [p.name for p in Products.get_all_products()]
+        assert data["users"][Users.LOCKED_OUT.username]["can_login"] is False
+
+    def test_media_placeholder(self, app):
+        """상품 이미지 요청에 1x1 PNG를 반환하는지 확인"""
+        assert _get(app, "/static/media/anything.jpg")[2] == PLACEHOLDER_PNG
+
+    def test_unknown_path(self, app):
+        """알 수 없는 경로는 404를 반환하는지 확인"""
+        with pytest.raises(urllib.error.HTTPError) as error:
+            _get(app, "/nope")
+        assert error.value.code == 404
+
+
+class TestLatency:
+    """지연 주입"""
+
+    def test_delay_for(self):
+        """모든 요청에 latency_ms, performance_glitch_user 화면 요청에만 glitch_ms가 추가되는지 확인"""
+        app = LocalApp(latency_ms=50, glitch_ms=3000)
+        glitch = Users.PERFORMANCE_GLITCH.username
+
+        assert app.delay_for("/inventory.html", glitch) == 3.05
+        assert app.delay_for("/app.js", glitch) == 0.05
+        assert app.delay_for("/inventory.html", Users.STANDARD.username) == 0.05
+
+    def test_session_cookie_selects_user(self, app, monkeypatch):
+        """세션 쿠키의 사용자 이름으로 지연을 정하는지 확인"""
+        seen = []
+        monkeypatch.setattr(app, "delay_for", lambda path, username: seen.append(username) or 0)
+
+        _get(app, "/inventory.html", cookie=f"{SESSION_COOKIE}={Users.PERFORMANCE_GLITCH.username}")
+
+        assert seen == [Users.PERFORMANCE_GLITCH.username]
+
+
+def test_build_app_data():
+    """클라이언트 데이터에 세율과 glitch 지연이 포함되는지 확인"""
+    data = build_app_data(1234)
+
+    assert data["taxRate"] == float(Products.TAX_RATE)
+    assert data["glitchDelayMs"] == 1234
+    assert data["password"] == Users.PASSWORD
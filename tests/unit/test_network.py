@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils.config import Config
+from utils.network import TRANSPARENT_PNG, NetworkProfile, parse_categories
+
+BASE_URL = "https://www.saucedemo.com"
+
+
+class FakeNode:
+    def __init__(self, **markers):
+        self.markers = markers
+
+    def iter_markers(self, name):
+        return [SimpleNamespace(args=args) for args in self.markers.get(name, [])]
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = FakeRequest(url, resource_type)
+        self.result = None
+
+    def fallback(self):
+        self.result = ("fallback",)
+
+    def fulfill(self, status, content_type, body):
+        self.result = ("fulfill", content_type, body)
+
+    def abort(self, error_code):
+        self.result = ("abort", error_code)
+
+
+class TestParseCategories:
+    """차단 카테고리 파싱"""
+
+    def test_parse(self):
+        """쉼표 구분 문자열을 집합으로 변환하고 빈 항목은 무시하는지 확인"""
+        assert parse_categories(" image, font ,,") == {"image", "font"}
+        assert parse_categories("") == set()
+
+    def test_unknown_category(self):
+        """알 수 없는 카테고리는 ValueError가 발생하는지 확인"""
+        with pytest.raises(ValueError, match="video"):
+            parse_categories("image,video")
+
+
+class TestNetworkProfile:
+    """요청 분류와 처리"""
+
+    def test_markers_adjust_default(self, monkeypatch):
+        """block_resources/allow_resources 마커가 기본 차단 목록에 반영되는지 확인"""
+        monkeypatch.setattr(Config, "BLOCK_RESOURCES", "image,font")
+        node = FakeNode(block_resources=[("stylesheet",)], allow_resources=[("image",)])
+
+        assert NetworkProfile.for_test(node).blocked == {"font", "stylesheet"}
+
+    @pytest.mark.parametrize("url, resource_type, expected", [
+        ("https://www.saucedemo.com/static/media/bike.jpg", "image", "image"),
+        ("https://www.saucedemo.com/inventory.html", "document", None),
+        ("https://www.saucedemo.com/static/js/main.js", "script", None),
+        ("https://submit.backtrace.io/sauce/events", "xhr", "analytics"),
+        ("https://www.google-analytics.com/collect", "xhr", "analytics"),
+        ("https://cdn.example.com/lib.js", "script", "third_party"),
+        ("data:image/png;base64,AAAA", "image", "image"),
+    ])
+    def test_category_of(self, url, resource_type, expected):
+        """분석 호스트, resource_type, 외부 출처 순으로 분류하는지 확인"""
+        profile = NetworkProfile({"image", "analytics", "third_party"}, base_url=BASE_URL)
+
+        assert profile.category_of(url, resource_type) == expected
+
+    def test_analytics_host_suffix_only(self):
+        """분석 호스트는 서브도메인까지만 일치시키고 비슷한 이름은 제외하는지 확인"""
+        profile = NetworkProfile({"analytics"}, base_url=BASE_URL)
+
+        assert profile.category_of("https://notbacktrace.io/x", "xhr") is None
+
+    def test_handle(self):
+        """이미지는 1x1 PNG로 대체, 나머지 차단 대상은 중단, 그 외는 통과하는지 확인"""
+        profile = NetworkProfile({"image", "font"}, base_url=BASE_URL)
+        image, font, page = (FakeRoute(f"{BASE_URL}/a", kind) for kind in ("image", "font", "document"))
+
+        for route in (image, font, page):
+            profile._handle(route)
+
+        assert image.result == ("fulfill", "image/png", TRANSPARENT_PNG)
+        assert font.result == ("abort", "blockedbyclient")
+        assert page.result == ("fallback",)
+
+    def test_disabled_profile_installs_nothing(self):
+        """차단 대상이 없으면 라우팅을 등록하지 않는지 확인"""
+        class Context:
+            routes = []
+
+            def route(self, pattern, handler):
+                self.routes.append(pattern)
+
+        context = Context()
+        NetworkProfile(set(), base_url=BASE_URL).install(context)
+
+        assert context.routes == []
@@ -0,0 +1,40 @@
+import pytest
+
+from utils import parallel
+from utils.config import Config
+
+
+class TestResolveWorkerCount:
+    """--workers 값 변환"""
+
+    @pytest.mark.parametrize("value, expected", [("1", 1), ("4", 4), ("0", 1), ("-2", 1)])
+    def test_number(self, value, expected):
+        """숫자는 그대로 사용하고 1보다 작으면 1로 변환하는지 확인"""
+        assert parallel.resolve_worker_count(value) == expected
+
+    @pytest.mark.parametrize("value", ["abc", "", "2.5"])
+    def test_invalid_value_is_usage_error(self, value):
+        """숫자나 auto가 아니면 옵션 이름이 담긴 UsageError가 발생하는지 확인"""
+        with pytest.raises(pytest.UsageError, match="--workers"):
+            parallel.resolve_worker_count(value)
+
+    def test_auto_limited_by_shared_memory(self, monkeypatch):
+        """auto는 CPU 수와 /dev/shm 크기 중 작은 쪽에 맞추는지 확인"""
+        monkeypatch.setattr(parallel.os, "cpu_count", lambda: 8)
+        monkeypatch.setattr(parallel, "_shm_size_mb", lambda: 3 * Config.SHM_PER_WORKER_MB)
+
+        assert parallel.resolve_worker_count("auto") == 3
+
+    def test_auto_without_shared_memory_info(self, monkeypatch):
+        """/dev/shm 크기를 알 수 없으면 CPU 수를 사용하는지 확인"""
+        monkeypatch.setattr(parallel.os, "cpu_count", lambda: 6)
+        monkeypatch.setattr(parallel, "_shm_size_mb", lambda: None)
+
+        assert parallel.resolve_worker_count("auto") == 6
+
+    def test_auto_small_shared_memory(self, monkeypatch):
+        """/dev/shm이 워커 하나 분량보다 작아도 최소 1을 반환하는지 확인"""
+        monkeypatch.setattr(parallel.os, "cpu_count", lambda: 8)
+        monkeypatch.setattr(parallel, "_shm_size_mb", lambda: 64)
+
+        assert parallel.resolve_worker_count("auto") == 1
@@ -0,0 +1,77 @@
+from decimal import Decimal
+from itertools import combinations
+
+import pytest
+
+from data.products import SORT_ORDERS, Products
+
+
+class TestCatalog:
+    """상품 카탈로그"""
+
+    def test_ids_and_slugs_unique(self):
+        """상품 ID와 slug가 겹치지 않는지 확인"""
+        assert len({p.id for p in Products.ALL}) == len({p.slug for p in Products.ALL}) == len(Products.ALL)
+
+    def test_slug(self):
+        """slug가 data-test 속성 형식(소문자, 공백은 -)인지 확인"""
+        assert Products.RED_T_SHIRT.slug == "test.allthethings()-t-shirt-(red)"
+
+    def test_immutable(self):
+        """상품 데이터를 변경할 수 없는지 확인"""
+        with pytest.raises(AttributeError):
+            Products.BACKPACK.price = Decimal("0")
+
+    def test_lookup(self):
+        """이름/ID로 조회하고 없는 상품은 KeyError인지 확인"""
+        assert Products.get_by_name("Sauce Labs Onesie") is Products.ONESIE
+        assert Products.get_by_id(4) is Products.BACKPACK
+        with pytest.raises(KeyError, match="Unknown product"):
+            Products.get_by_name("Sauce Labs Umbrella")
+
+
+class TestSortOrders:
+    """정렬 옵션별 기대 순서"""
+
+    def test_every_order_is_permutation(self):
+        """모든 정렬 옵션이 전체 상품의 순열인지 확인"""
+        assert set(Products.SORTED) == set(SORT_ORDERS)
+        for products in Products.SORTED.values():
+            assert sorted(products, key=lambda p: p.id) == sorted(Products.ALL, key=lambda p: p.id)
+
+    def test_default_order_is_name_asc(self):
+        """인벤토리 기본 표시 순서가 이름 오름차순인지 확인"""
+        assert Products.SORTED["az"] == Products.ALL
+        assert Products.SORTED_NAMES["za"] == tuple(reversed(Products.SORTED_NAMES["az"]))
+
+    def test_equal_prices_keep_name_order(self):
+        """가격이 같은 상품은 가격 정렬에서도 이름순인지 확인"""
+        for order in ("lohi", "hilo"):
+            names = Products.SORTED_NAMES[order]
+            assert names.index(Products.BOLT_T_SHIRT.name) < names.index(Products.RED_T_SHIRT.name)
+
+    def test_prices_monotonic(self):
+        """가격 정렬 결과가 단조 증가/감소인지 확인"""
+        assert list(Products.SORTED_PRICES["lohi"]) == sorted(Products.SORTED_PRICES["lohi"])
+        assert list(Products.SORTED_PRICES["hilo"]) == sorted(Products.SORTED_PRICES["hilo"], reverse=True)
+
+
+class TestTotals:
+    """주문 합계"""
+
+    def test_single_product(self):
+        """8% 세금을 센트 단위 반올림으로 계산하는지 확인"""
+        assert Products.totals(Products.BACKPACK) == (Decimal("29.99"), Decimal("2.40"), Decimal("32.39"))
+
+    def test_all_subsets_match_direct_calculation(self):
+        """미리 계산한 모든 조합의 합계가 직접 계산한 값과 같은지 확인"""
+        for size in range(len(Products.ALL) + 1):
+            for products in combinations(Products.ALL, size):
+                subtotal = sum((p.price for p in products), Decimal("0"))
+                tax = (subtotal * Products.TAX_RATE).quantize(Decimal("0.01"), rounding="ROUND_HALF_UP")
+                assert Products.totals(*products) == (subtotal, tax, subtotal + tax)
+
+    def test_names_and_duplicates(self):
+        """상품 이름을 받을 수 있고 같은 상품은 한 번만 계산하는지 확인"""
+        assert Products.totals("Sauce Labs Onesie", Products.ONESIE) == Products.totals(Products.ONESIE)
+        assert Products.totals() == (Decimal("0"), Decimal("0.00"), Decimal("0.00"))
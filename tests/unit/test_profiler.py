@@ -0,0 +1,83 @@
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from utils import profiler
+from utils.profiler import _FrameStack, format_report, inclusive_times, to_folded
+
+STACKS = {
+    "tests/test_login.py;test_a;setup;fixture:page": 1.0,
+    "tests/test_login.py;test_a;call": 0.5,
+    "tests/test_login.py;test_a;call;page:LoginPage.login": 2.0,
+    "tests/test_login.py;test_a;call;page:LoginPage.login;page:BasePage.click": 0.5,
+    "tests/test_cart.py;test_b;teardown;fixture:capture_screenshot;allure:attach_data": 1.0,
+}
+
+
+class TestFrameStack:
+    """프레임 경로별 self time"""
+
+    def test_self_time_per_path(self, monkeypatch):
+        """중첩 프레임의 시간은 가장 안쪽 경로에만 누적되는지 확인"""
+        now = iter([0.0, 1.0, 3.0, 4.0, 6.0])
+        monkeypatch.setattr(profiler, "time", SimpleNamespace(perf_counter=lambda: next(now)))
+        stack = _FrameStack()
+        stack.push("a")
+        stack.push("b")
+        stack.pop("b")
+        stack.pop("a")
+
+        assert stack.self_time == {("a",): 2.0 + 2.0, ("a", "b"): 1.0}
+        assert stack.calls == Counter({"a": 1, "b": 1})
+
+    def test_pop_removes_frames_above(self):
+        """pop은 해당 프레임 위에 남은 프레임까지 내리는지 확인"""
+        stack = _FrameStack()
+        for name in ("a", "b", "c"):
+            stack.push(name)
+        stack.pop("b")
+
+        assert stack.frames == ["a"]
+
+
+def test_inclusive_times_counts_frame_once_per_path():
+    """같은 경로에 중복된 프레임은 한 번만 합산하는지 확인"""
+    totals = inclusive_times({"a;b;a": 1.0, "a;c": 2.0})
+
+    assert totals == {"a": 3.0, "b": 1.0, "c": 2.0}
+
+
+def test_to_folded():
+    """경로 순서대로 마이크로초 값을 출력하고 0초 경로는 제외하는지 확인"""
+    assert to_folded({"b;c": 0.25, "a": 0.000001, "z": 0.0}) == "a 1\nb;c 250000\n"
+
+
+class TestFormatReport:
+    """프로파일 보고서"""
+
+    @pytest.fixture
+    def sections(self):
+        calls = Counter({"fixture:page": 1, "page:LoginPage.login": 1, "page:BasePage.click": 3})
+        report = format_report(STACKS, calls, wall=4.0, top=10)
+        return {lines[0].split()[0]: lines[1:] for lines in (s.splitlines() for s in report.split("\n\n"))}
+
+    def test_header(self):
+        """벽시계 시간과 측정된 시간 합계를 출력하는지 확인"""
+        report = format_report(STACKS, Counter(), wall=4.0, top=10)
+
+        assert report.splitlines()[0] == "wall 4.00s, profiled 5.00s (test time summed across workers)"
+
+    def test_phases(self, sections):
+        """setup/call/teardown별 시간을 큰 순서로 출력하는지 확인"""
+        assert [line.split()[0] for line in sections["phase"]][:3] == ["call", "setup", "teardown"]
+
+    def test_page_methods_inclusive_with_calls(self, sections):
+        """페이지 객체 메서드는 하위 호출을 포함한 시간과 호출 수를 출력하는지 확인"""
+        login = next(line for line in sections["page"] if "LoginPage.login" in line).split()
+
+        assert login == ["LoginPage.login", "2.50", "50.0", "1"]
+
+    def test_allure_io(self, sections):
+        """Allure 첨부 쓰기 시간이 별도 섹션에 표시되는지 확인"""
+        assert sections["allure"][0].split()[:2] == ["attach_data", "1.00"]
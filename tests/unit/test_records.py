@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+import pytest
+
+from pages.records import CartItemRecord, OrderSnapshot, ProductRecord, parse_price
+
+PRODUCT_ROW = {
+    "name": "Sauce Labs Backpack", "price": "$29.99", "description": "carry.allTheThings()",
+    "image_src": "/static/media/backpack.jpg", "button_text": "Add to cart",
+    "button_test_id": "add-to-cart-sauce-labs-backpack",
+}
+
+
+class TestParsePrice:
+    """가격 텍스트 변환"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("$29.99", Decimal("29.99")),
+        ("Item total: $39.98", Decimal("39.98")),
+        ("Tax: $3.20", Decimal("3.20")),
+        ("", Decimal("0")),
+    ])
+    def test_parse(self, text, expected):
+        """'$' 뒤의 금액을 Decimal로 변환하는지 확인 (빈 값은 0)"""
+        assert parse_price(text) == expected
+
+
+class TestProductRecord:
+    """인벤토리 상품 레코드"""
+
+    def test_from_row(self):
+        """read_records 결과를 레코드로 변환하는지 확인"""
+        record = ProductRecord.from_row(PRODUCT_ROW)
+
+        assert record.name == "Sauce Labs Backpack"
+        assert record.price == Decimal("29.99") and record.price_value == 29.99
+        assert not record.in_cart
+
+    def test_in_cart_from_remove_button(self):
+        """버튼이 Remove 상태면 장바구니에 담긴 상품으로 판단하는지 확인"""
+        record = ProductRecord.from_row({**PRODUCT_ROW, "button_test_id": "remove-sauce-labs-backpack"})
+
+        assert record.in_cart
+
+    def test_equality(self):
+        """모든 필드가 같으면 같은 레코드인지 확인"""
+        assert ProductRecord.from_row(PRODUCT_ROW) == ProductRecord.from_row(dict(PRODUCT_ROW))
+        assert ProductRecord.from_row(PRODUCT_ROW) != ProductRecord.from_row({**PRODUCT_ROW, "price": "$1.00"})
+
+
+class TestOrderSnapshot:
+    """주문 확인 페이지 상태"""
+
+    def _item(self, name, price, quantity):
+        return {"name": name, "price": price, "quantity": quantity, "description": "", "button_test_id": ""}
+
+    def test_from_sets(self):
+        """아이템과 요약 금액을 변환하고 아이템 합계를 계산하는지 확인"""
+        snapshot = OrderSnapshot.from_sets({
+            "items": [self._item("A", "$10.00", "2"), self._item("B", "$5.50", "1")],
+            "summary": [{"subtotal": "Item total: $25.50", "tax": "Tax: $2.04", "total": "Total: $27.54"}],
+        })
+
+        assert snapshot.names == ["A", "B"]
+        assert snapshot.item_total == Decimal("25.50") == snapshot.subtotal
+        assert snapshot.subtotal + snapshot.tax == snapshot.total
+
+    def test_empty_summary(self):
+        """요약 영역이 없으면 금액을 0으로 처리하는지 확인"""
+        snapshot = OrderSnapshot.from_sets({"items": [], "summary": []})
+
+        assert (snapshot.subtotal, snapshot.tax, snapshot.total) == (0, 0, 0)
+        assert snapshot.item_total == 0
+
+    def test_blank_quantity(self):
+        """수량 텍스트가 비어 있으면 0으로 처리하는지 확인"""
+        assert CartItemRecord.from_row(self._item("A", "$1.00", "")).quantity == 0
@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from utils.report_budget import enforce, parse_order
+
+ORDER = "passed,skipped"
+KB = 1000
+
+
+@pytest.fixture
+def results(tmp_path):
+    """Allure 결과 디렉터리에 결과/컨테이너 JSON과 첨부 파일을 만드는 도우미"""
+    class Results:
+        dir = tmp_path
+
+        def attachment(self, name, size=KB):
+            (tmp_path / name).write_bytes(b"x" * size)
+            return {"name": name, "source": name, "type": "image/png"}
+
+        def result(self, uuid, status, stop, attachments=(), steps=()):
+            doc = {"uuid": uuid, "status": status, "stop": stop, "attachments": list(attachments), "steps": list(steps)}
+            self.write(f"{uuid}-result.json", doc)
+
+        def container(self, uuid, children, befores):
+            self.write(f"{uuid}-container.json", {"uuid": uuid, "children": children, "befores": befores})
+
+        def write(self, name, doc):
+            (tmp_path / name).write_text(json.dumps(doc))
+
+        def load(self, name):
+            return json.loads((tmp_path / name).read_text())
+
+        def files(self):
+            return sorted(path.name for path in tmp_path.glob("*-attachment*"))
+
+        def size(self):
+            return sum(path.stat().st_size for path in tmp_path.iterdir())
+
+    return Results()
+
+
+def test_parse_order():
+    """앞쪽 상태가 먼저 삭제되는 순위로 변환하고 빈 항목은 무시하는지 확인"""
+    assert parse_order(" passed, ,skipped,") == {"passed": 0, "skipped": 1}
+
+
+class TestEnforce:
+    """결과 디렉터리 크기 예산 적용"""
+
+    def test_under_budget_untouched(self, results):
+        """예산 이하면 아무것도 삭제하지 않는지 확인"""
+        results.result("r1", "passed", 1, [results.attachment("a-attachment.png")])
+
+        eviction = enforce(str(results.dir), results.size(), ORDER)
+
+        assert eviction.evicted == 0 and results.files() == ["a-attachment.png"]
+
+    def test_status_then_oldest_first(self, results):
+        """상태 순위(passed → skipped) 다음 오래된 순으로 필요한 만큼만 삭제하는지 확인"""
+        results.result("r1", "skipped", 1, [results.attachment("skipped-attachment.png")])
+        results.result("r2", "passed", 20, [results.attachment("new-attachment.png")])
+        results.result("r3", "passed", 10, [results.attachment("old-attachment.png")])
+
+        eviction = enforce(str(results.dir), results.size() - 1500, ORDER)
+
+        assert eviction.evicted == 2
+        assert results.files() == ["skipped-attachment.png"]
+        assert eviction.after <= eviction.budget
+
+    def test_protected_status_kept(self, results):
+        """order에 없는 상태(failed)의 첨부 파일은 예산을 넘어도 삭제하지 않는지 확인"""
+        results.result("r1", "failed", 1, [results.attachment("failed-attachment.png")])
+
+        eviction = enforce(str(results.dir), 0, ORDER)
+
+        assert eviction.evicted == 0 and eviction.after > eviction.budget
+        assert results.files() == ["failed-attachment.png"]
+
+    def test_shared_attachment_follows_most_protected(self, results):
+        """통과/실패 테스트가 같이 참조하는 중복 제거 첨부 파일은 실패 테스트 기준으로 보호하는지 확인"""
+        shared = results.attachment("shared-attachment.png")
+        results.result("r1", "passed", 1, [shared, results.attachment("passed-attachment.png")])
+        results.result("r2", "failed", 2, [shared])
+
+        enforce(str(results.dir), 0, ORDER)
+
+        assert results.files() == ["shared-attachment.png"]
+        assert results.load("r2-result.json")["attachments"] == [shared]
+        assert results.load("r1-result.json")["attachments"] == [shared]
+
+    def test_orphans_first(self, results):
+        """어떤 결과도 참조하지 않는 첨부 파일을 가장 먼저 삭제하는지 확인"""
+        results.attachment("orphan-attachment.png")
+        results.result("r1", "passed", 1, [results.attachment("passed-attachment.png")])
+
+        enforce(str(results.dir), results.size() - 500, ORDER)
+
+        assert results.files() == ["passed-attachment.png"]
+
+    def test_nested_references_stripped(self, results):
+        """step과 컨테이너 befores 안의 삭제된 첨부 파일 참조도 제거하는지 확인"""
+        step_attachment = results.attachment("step-attachment.png")
+        before_attachment = results.attachment("before-attachment.png")
+        results.result("r1", "passed", 1, steps=[{"name": "click", "steps": [
+            {"name": "inner", "attachments": [step_attachment]},
+        ]}])
+        results.container("c1", ["r1"], [{"name": "page", "attachments": [before_attachment]}])
+
+        eviction = enforce(str(results.dir), 0, ORDER)
+
+        assert eviction.evicted == 2 and results.files() == []
+        assert results.load("r1-result.json")["steps"][0]["steps"][0]["attachments"] == []
+        assert results.load("c1-container.json")["befores"][0]["attachments"] == []
+
+    def test_container_follows_children(self, results):
+        """컨테이너의 첨부 파일은 자식 테스트의 상태로 판단하는지 확인"""
+        results.result("r1", "failed", 1)
+        results.container("c1", ["r1"], [{"name": "page", "attachments": [results.attachment("before-attachment.png")]}])
+
+        enforce(str(results.dir), 0, ORDER)
+
+        assert results.files() == ["before-attachment.png"]
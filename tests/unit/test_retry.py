@@ -0,0 +1,161 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from utils.retry import FLAKY, FlakyHistory, is_timing_failure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 별도 pytest 실행에서 RetryPolicy만 등록 (최상위 conftest의 브라우저 fixture 없이)
+CONFTEST = """
+from utils.retry import RetryPolicy
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "known_flaky: 알려진 불안정 테스트")
+    config.pluginmanager.register(RetryPolicy(config), "retry_policy")
+"""
+
+# 첫 시도만 실패하는 테스트들 (시도 횟수는 파일로 기록)
+TESTS = """
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils.budgets import BudgetExceeded
+
+def first_attempt(name):
+    with open(name + ".count", "a") as f:
+        f.write("x")
+    with open(name + ".count") as f:
+        return len(f.read()) == 1
+
+@pytest.mark.known_flaky
+def test_marked():
+    assert not first_attempt("marked")
+
+def test_timeout():
+    if first_attempt("timeout"):
+        raise PlaywrightTimeoutError("Timeout 30000ms exceeded")
+
+def test_assertion():
+    assert not first_attempt("assertion")
+
+@pytest.mark.known_flaky
+def test_budget():
+    if first_attempt("budget"):
+        raise BudgetExceeded("login: max=900ms > budget 800ms")
+"""
+
+
+@pytest.fixture
+def run(pytester, monkeypatch, tmp_path):
+    """RetryPolicy를 등록한 별도 pytest 프로세스 실행 (기록은 tmp_path/reports)"""
+    monkeypatch.setenv("PYTHONPATH", ROOT)
+    monkeypatch.setenv("REPORTS_DIR", str(tmp_path / "reports"))
+    monkeypatch.setenv("RETRY_MAX", "1")
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_sample=TESTS)
+
+    def run(*args):
+        return pytester.runpytest_subprocess(*args)
+    return run
+
+
+def history(tmp_path) -> dict:
+    with open(tmp_path / "reports" / "flaky_history.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestRetryPolicy:
+    """실패한 테스트 재시도"""
+
+    def test_retries_marked_and_timeout_only(self, run):
+        """known_flaky 마커와 대기 시간 초과 실패만 재시도하고 assertion/예산 초과는 재시도하지 않는지 확인"""
+        result = run("-rA")
+
+        outcomes = result.parseoutcomes()
+        assert (outcomes["passed"], outcomes["failed"], outcomes["rerun"]) == (2, 2, 2)
+        result.stdout.fnmatch_lines([
+            "*test_sample.py::test_marked: passed on retry",
+            "*test_sample.py::test_timeout: passed on retry",
+        ])
+        assert "test_assertion: " not in result.stdout.str()
+
+    def test_history_recorded(self, run, tmp_path):
+        """재시도 후 통과는 flaky, 재시도하지 않은 실패는 failed로 기록하는지 확인"""
+        run()
+
+        assert history(tmp_path) == {
+            "test_sample.py::test_assertion": ["failed"],
+            "test_sample.py::test_budget": ["failed"],
+            "test_sample.py::test_marked": [FLAKY],
+            "test_sample.py::test_timeout": [FLAKY],
+        }
+
+    def test_retry_disabled(self, run, monkeypatch):
+        """RETRY_MAX=0이면 재시도하지 않는지 확인"""
+        monkeypatch.setenv("RETRY_MAX", "0")
+
+        run().assert_outcomes(passed=0, failed=4)
+
+    def test_allure_result_per_attempt(self, run, tmp_path):
+        """Allure에는 시도마다 같은 historyId의 결과가 기록되는지 확인"""
+        allure_dir = tmp_path / "allure-results"
+        run(f"--alluredir={allure_dir}", "-k", "marked")
+
+        results = [json.loads(path.read_text()) for path in allure_dir.glob("*-result.json")]
+        assert sorted(result["status"] for result in results) == ["failed", "passed"]
+        assert len({result["historyId"] for result in results}) == 1
+
+
+class TestFlakyHistory:
+    """테스트별 최근 실행 결과 기록"""
+
+    def test_save_appends_and_trims(self, tmp_path):
+        """이번 결과를 과거 기록 뒤에 붙이고 최근 size개만 남기는지 확인"""
+        path = str(tmp_path / "flaky_history.json")
+        for outcome in ("passed", "failed", "passed"):
+            history = FlakyHistory(path, size=2)
+            history.record("t::a", outcome)
+            history.save()
+
+        assert FlakyHistory(path).history == {"t::a": ["failed", "passed"]}
+
+    @pytest.mark.parametrize("outcomes, expected", [
+        (["passed", "passed", "failed"], False),   # 한 번 바뀜
+        (["passed", "failed", "passed"], True),    # 두 번 바뀜
+        (["passed", FLAKY], True),                 # 재시도 후 통과 기록
+        ([], False),
+    ])
+    def test_is_flaky(self, tmp_path, outcomes, expected):
+        """재시도 후 통과 기록이 있거나 통과/실패가 두 번 이상 바뀌면 불안정한 테스트인지 확인"""
+        history = FlakyHistory(str(tmp_path / "flaky_history.json"))
+        history.history = {"t::a": outcomes}
+
+        assert history.is_flaky("t::a") is expected
+
+
+class TestIsTimingFailure:
+    """대기 시간 초과 실패 판정"""
+
+    def test_timeout_error(self):
+        """Playwright TimeoutError는 대기 시간 초과로 판정하는지 확인"""
+        assert is_timing_failure(SimpleNamespace(value=PlaywrightTimeoutError("Timeout")))
+
+    def test_caused_by_timeout(self):
+        """TimeoutError로 인해 발생한 다른 예외도 대기 시간 초과로 판정하는지 확인"""
+        try:
+            try:
+                raise PlaywrightTimeoutError("Timeout")
+            except PlaywrightTimeoutError as e:
+                raise AssertionError("inventory not shown") from e
+        except AssertionError as e:
+            error = e
+
+        assert is_timing_failure(SimpleNamespace(value=error))
+
+    def test_assertion_and_none(self):
+        """일반 assertion 실패와 예외 정보가 없는 경우는 제외하는지 확인"""
+        assert not is_timing_failure(SimpleNamespace(value=AssertionError()))
+        assert not is_timing_failure(None)
@@ -0,0 +1,76 @@
+import pytest
+
+from utils import screenshot
+from utils.config import Config
+
+
+class FakePage:
+    def __init__(self):
+        self.calls = []
+
+    def screenshot(self, **options):
+        self.calls.append(options)
+        return b"image"
+
+
+@pytest.fixture
+def attachments(monkeypatch):
+    attached = []
+    monkeypatch.setattr(screenshot.allure, "attach", lambda body, name, attachment_type: attached.append(name))
+    return attached
+
+
+class TestShouldCapture:
+    """SCREENSHOT_POLICY별 캡처 여부"""
+
+    @pytest.mark.parametrize("policy, failed, retried, expected", [
+        ("always", False, False, True),
+        ("on-failure", False, False, False),
+        ("on-failure", True, False, True),
+        ("on-failure", False, True, False),
+        ("on-failure-or-retry", False, True, True),
+        ("on-failure-or-retry", False, False, False),
+        ("never", True, True, False),
+    ])
+    def test_policy(self, policy, failed, retried, expected):
+        """정책과 실패/재시도 여부에 따라 캡처 여부가 정해지는지 확인"""
+        assert screenshot.should_capture(policy, failed, retried) is expected
+
+    def test_unknown_policy(self):
+        """알 수 없는 정책은 ValueError가 발생하는지 확인"""
+        with pytest.raises(ValueError, match="SCREENSHOT_POLICY"):
+            screenshot.should_capture("sometimes", True, False)
+
+
+class TestAttachScreenshot:
+    """스크린샷 캡처 옵션"""
+
+    def test_failed_captures_full_page(self, monkeypatch, attachments):
+        """실패 시 전체 페이지를 캡처하는지 확인"""
+        monkeypatch.setattr(Config, "SCREENSHOT_FORMAT", "png")
+        page = FakePage()
+
+        screenshot.attach_screenshot(page, failed=True)
+
+        assert page.calls == [{"full_page": True, "type": "png"}]
+        assert attachments == ["screenshot_failed"]
+
+    def test_jpeg_uses_quality(self, monkeypatch, attachments):
+        """jpeg는 SCREENSHOT_QUALITY로 뷰포트만 캡처하는지 확인"""
+        monkeypatch.setattr(Config, "SCREENSHOT_FORMAT", "jpeg")
+        monkeypatch.setattr(Config, "SCREENSHOT_QUALITY", 60)
+        page = FakePage()
+
+        screenshot.attach_screenshot(page, failed=False)
+
+        assert page.calls == [{"full_page": False, "type": "jpeg", "quality": 60}]
+        assert attachments == ["screenshot_passed"]
+
+    def test_unknown_format(self, monkeypatch, attachments):
+        """지원하지 않는 형식은 캡처 전에 ValueError가 발생하는지 확인"""
+        monkeypatch.setattr(Config, "SCREENSHOT_FORMAT", "gif")
+        page = FakePage()
+
+        with pytest.raises(ValueError, match="SCREENSHOT_FORMAT"):
+            screenshot.attach_screenshot(page, failed=True)
+        assert page.calls == []
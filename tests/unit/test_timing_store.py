@@ -0,0 +1,139 @@
+import json
+
+import pytest
+
+from utils.timing_store import DurationScheduler, TimingStore, estimate_durations, predict_makespan
+
+
+class FakeConfig:
+    def __init__(self, schedule: str, numprocesses: int = None):
+        self.options = {"schedule": schedule, "numprocesses": numprocesses}
+
+    def getoption(self, name, default=None):
+        return self.options.get(name, default)
+
+
+class FakeTerminal:
+    def __init__(self):
+        self.lines = []
+
+    def write_sep(self, sep, title):
+        self.lines.append(title)
+
+    def write_line(self, line, **markup):
+        self.lines.append(line)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TimingStore(str(tmp_path / "test_durations.json"))
+
+
+class TestTimingStore:
+    """테스트별 소요 시간 기록"""
+
+    def test_first_run_saved_as_is(self, store):
+        """기록이 없던 테스트는 이번 실행 값을 그대로 저장하는지 확인"""
+        store.record("t::a", "setup", 1.0)
+        store.record("t::a", "call", 2.0)
+        store.save()
+
+        saved = json.load(open(store.path))
+        assert saved["t::a"] == {"runs": 1, "setup": 1.0, "call": 2.0, "teardown": 0.0}
+
+    def test_smoothed_with_previous_run(self, store):
+        """이전 기록과 지수 이동 평균으로 합쳐지는지 확인"""
+        store.record("t::a", "call", 2.0)
+        store.save()
+        next_run = TimingStore(store.path)
+        next_run.record("t::a", "call", 4.0)
+        next_run.save()
+
+        saved = json.load(open(store.path))
+        assert saved["t::a"]["call"] == 3.0
+        assert saved["t::a"]["runs"] == 2
+
+    def test_unrun_tests_keep_history(self, store):
+        """이번에 실행하지 않은 테스트의 기록이 유지되는지 확인"""
+        store.record("t::a", "call", 1.0)
+        store.save()
+        next_run = TimingStore(store.path)
+        next_run.record("t::b", "call", 1.0)
+        next_run.save()
+
+        assert set(json.load(open(store.path))) == {"t::a", "t::b"}
+
+    def test_expected_sums_phases(self, store):
+        """예상 소요 시간은 단계별 시간의 합인지 확인"""
+        store.history = {"t::a": {"setup": 0.5, "call": 1.5, "teardown": 0.25}}
+
+        assert store.expected("t::a") == 2.25
+        assert store.expected("t::b") is None
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        """깨진 기록 파일은 빈 기록으로 처리하는지 확인"""
+        path = tmp_path / "test_durations.json"
+        path.write_text("{not json")
+
+        assert TimingStore(str(path)).history == {}
+
+
+class TestEstimates:
+    """예상 소요 시간과 makespan"""
+
+    def test_unknown_tests_use_median(self, store):
+        """기록 없는 테스트는 기록된 테스트의 중앙값으로 가정하는지 확인"""
+        store.history = {"a": {"call": 1.0}, "b": {"call": 3.0}, "c": {"call": 5.0}}
+
+        assert estimate_durations(["a", "c", "new"], store) == {"a": 1.0, "c": 5.0, "new": 3.0}
+
+    def test_no_history_defaults_to_one_second(self, store):
+        """기록이 전혀 없으면 테스트마다 1초로 가정하는지 확인"""
+        assert estimate_durations(["a", "b"], store) == {"a": 1.0, "b": 1.0}
+
+    @pytest.mark.parametrize("durations, workers, expected", [
+        ([5, 4, 3, 3, 3], 2, 10),  # LPT 배정: [5, 3] / [4, 3, 3]
+        ([10, 1, 1], 2, 10),       # 가장 긴 테스트가 하한
+        ([1, 2, 3], 1, 6),         # 워커 1개는 합계
+        ([1, 2], 0, 3),            # 워커 0은 1로 처리
+    ])
+    def test_predict_makespan(self, durations, workers, expected):
+        """긴 작업 우선 배정의 최대 워커 부하를 반환하는지 확인"""
+        assert predict_makespan(durations, workers) == expected
+
+
+class TestMakespanSummary:
+    """터미널 요약의 makespan 섹션"""
+
+    def _summary(self, store, schedule):
+        scheduler = DurationScheduler.__new__(DurationScheduler)
+        scheduler.config = FakeConfig(schedule)
+        scheduler.store = store
+        scheduler.is_worker = False
+        scheduler.started_at, scheduler.finished_at = 0.0, 2.0
+        terminal = FakeTerminal()
+        scheduler.pytest_terminal_summary(terminal)
+        return terminal.lines
+
+    def test_printed_for_duration_schedule_with_history(self, store):
+        """--schedule duration이고 기록이 있으면 예측/실제 시간을 출력하는지 확인"""
+        store.history = {"t::a": {"call": 1.5}}
+        store.record("t::a", "call", 2.0)
+
+        lines = self._summary(store, "duration")
+
+        assert lines[0] == "makespan"
+        assert "predicted=1.5s actual=2.0s" in lines[1] and "history=1" in lines[1]
+
+    def test_skipped_for_order_schedule(self, store):
+        """--schedule order면 출력하지 않는지 확인"""
+        store.history = {"t::a": {"call": 1.5}}
+        store.record("t::a", "call", 2.0)
+
+        assert self._summary(store, "order") == []
+
+    def test_skipped_without_history(self, store):
+        """기록이 없으면 예측값이 의미 없으므로 출력하지 않는지 확인"""
+        store.record("t::a", "call", 2.0)
+
+        assert self._summary(store, "duration") == []
@@ -0,0 +1,91 @@
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.base_page import BasePage
+from pages.product_detail_page import ProductDetailPage
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    def count(self):
+        return int(self.selector in self.page.present)
+
+    def is_visible(self):
+        return self.selector in self.page.present
+
+
+class FakePage:
+    """present에 있는 셀렉터만 존재하고, 상태 대기는 즉시 성공/시간 초과하는 페이지"""
+
+    def __init__(self, present=()):
+        self.present = set(present)
+        self.waits = []
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    def wait_for_selector(self, selector, state="visible", timeout=None):
+        self.waits.append((selector, state, timeout))
+        if (state == "visible") != (selector in self.present):
+            raise PlaywrightTimeoutError(f"{selector} {state}")
+
+
+class TestVisibilityChecks:
+    """대기하는 확인과 대기하지 않는 확인"""
+
+    def test_is_visible_false_on_timeout(self):
+        """표시되지 않으면 예외 대신 False를 반환하는지 확인"""
+        page = FakePage()
+
+        assert BasePage(page).is_visible("#missing", timeout=100) is False
+        assert page.waits == [("#missing", "visible", 100)]
+
+    def test_is_hidden(self):
+        """없는 요소는 True, 사라지지 않는 요소는 False를 반환하는지 확인"""
+        page = FakePage(present={"#shown"})
+        base = BasePage(page)
+
+        assert base.is_hidden("#missing") is True
+        assert base.is_hidden("#shown", timeout=100) is False
+
+    def test_now_checks_do_not_wait(self):
+        """is_present_now/is_visible_now는 상태 대기를 하지 않는지 확인"""
+        page = FakePage(present={"#shown"})
+        base = BasePage(page)
+
+        assert base.is_present_now("#shown") and not base.is_present_now("#missing")
+        assert base.is_visible_now("#shown") and not base.is_visible_now("#missing")
+        assert page.waits == []
+
+
+class TestProductDetailButtons:
+    """상품 상세 버튼 확인"""
+
+    def test_positive_checks_wait_for_visible(self):
+        """표시 확인은 버튼이 보일 때까지 대기하는지 확인"""
+        page = FakePage(present={ProductDetailPage.REMOVE_BUTTON})
+        detail = ProductDetailPage(page)
+
+        assert detail.is_remove_visible()
+        assert page.waits[-1][:2] == (ProductDetailPage.REMOVE_BUTTON, "visible")
+
+    def test_absence_checks_wait_for_hidden(self):
+        """없음 확인은 hidden 상태 대기를 사용하는지 확인"""
+        page = FakePage(present={ProductDetailPage.REMOVE_BUTTON})
+        detail = ProductDetailPage(page)
+
+        assert detail.is_add_to_cart_hidden()
+        assert not detail.is_remove_hidden()
+        assert [state for _, state, _ in page.waits] == ["hidden", "hidden"]
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+from utils import web_vitals
+from utils.web_vitals import WebVitalsCollector
+
+
+class FakePage:
+    def __init__(self, url="about:blank"):
+        self.url = url
+        self.evaluations = 0
+        self.error = None
+
+    def evaluate(self, script):
+        self.evaluations += 1
+        if self.error:
+            raise self.error
+        return {"url": self.url, "type": "hard" if self.evaluations == 1 else "soft"}
+
+
+class FakeContext:
+    def __init__(self):
+        self.scripts = []
+
+    def add_init_script(self, script):
+        self.scripts.append(script)
+
+
+@pytest.fixture
+def collector():
+    return WebVitalsCollector()
+
+
+class TestWebVitalsCollector:
+    """화면 전환별 지표 수집"""
+
+    def test_captures_on_url_change(self, collector):
+        """URL이 바뀔 때마다 지표와 trigger/target을 기록하는지 확인"""
+        page = FakePage("http://app/")
+        collector.capture(page, "navigate", "http://app/")
+        page.url = "http://app/inventory.html"
+        collector.capture(page, "click", "#login-button")
+
+        assert [(r["type"], r["trigger"], r["target"]) for r in collector.records] == [
+            ("hard", "navigate", "http://app/"), ("soft", "click", "#login-button"),
+        ]
+
+    def test_same_url_skips_evaluate(self, collector):
+        """URL이 그대로인 액션은 브라우저 호출 없이 건너뛰는지 확인"""
+        page = FakePage("http://app/inventory.html")
+        collector.capture(page, "navigate", page.url)
+        collector.capture(page, "click", ".btn_inventory")
+        collector.capture(page, "click", ".btn_inventory")
+
+        assert page.evaluations == 1
+        assert len(collector.records) == 1
+
+    def test_pages_tracked_separately(self, collector):
+        """페이지마다 마지막 URL을 따로 기억하는지 확인"""
+        first, second = FakePage("http://app/"), FakePage("http://app/")
+        collector.capture(first, "navigate", "http://app/")
+        collector.capture(second, "navigate", "http://app/")
+
+        assert (first.evaluations, second.evaluations) == (1, 1)
+
+    def test_closed_page_ignored(self, collector):
+        """evaluate 실패는 기록하지 않고 다음 수집에서 다시 시도하는지 확인"""
+        page = FakePage("http://app/")
+        page.error = PlaywrightError("Target closed")
+        collector.capture(page, "navigate", page.url)
+        page.error = None
+        collector.capture(page, "navigate", page.url)
+
+        assert page.evaluations == 2
+        assert len(collector.records) == 1
+
+    def test_module_capture_uses_active_collector(self, collector):
+        """set_active로 지정한 수집기에만 기록하는지 확인"""
+        page = FakePage("http://app/")
+        web_vitals.capture(page, "navigate", page.url)
+        web_vitals.set_active(collector)
+        try:
+            web_vitals.capture(page, "navigate", page.url)
+        finally:
+            web_vitals.set_active(None)
+
+        assert page.evaluations == 1
+
+
+def test_install_once_per_context():
+    """재사용되는 컨텍스트에 관찰 스크립트를 한 번만 등록하는지 확인"""
+    context = FakeContext()
+    web_vitals.install(context)
+    web_vitals.install(context)
+
+    assert context.scripts == [web_vitals.INIT_SCRIPT]
+
+
+def test_append_results(tmp_path):
+    """테스트별 지표를 JSONL 한 줄씩 추가하는지 확인"""
+    path = str(tmp_path / "metrics" / "web_vitals.jsonl")
+    web_vitals.append_results(path, "t::a", [{"url": "http://app/"}])
+    web_vitals.append_results(path, "t::b", [])
+
+    lines = [json.loads(line) for line in open(path, encoding="utf-8")]
+    assert lines == [{"nodeid": "t::a", "records": [{"url": "http://app/"}]}, {"nodeid": "t::b", "records": []}]
@@ -0,0 +1,167 @@
+import atexit
+import hashlib
+import os
+import queue
+import sys
+import threading
+import time
+
+import allure_pytest.plugin
+import pytest
+from allure_commons import hookimpl
+from allure_commons.logger import AllureFileLogger
+
+from utils.config import Config
+
+_STOP = object()
+
+# 결과 객체에서 첨부 파일을 가질 수 있는 속성 (TestResult, TestStepResult, TestResultContainer, TestBeforeResult/AfterResult)
+_NESTED_ATTRS = ("steps", "befores", "afters")
+
+
+class AsyncAllureFileLogger(AllureFileLogger):
+    """Allure 결과/첨부 파일을 백그라운드 스레드에서 모아서 기록하는 AllureFileLogger
+
+    - 테스트 스레드는 작업을 큐에 넣기만 하고 파일 쓰기를 기다리지 않는다
+    - 첨부 파일은 내용 해시로 이름을 정해 같은 내용(동일한 스크린샷 등)은 한 번만 저장한다
+    - 세션 종료(pytest_unconfigure)나 비정상 종료(atexit) 시 남은 작업을 모두 기록한다
+    """
+
+    def __init__(self, report_dir, clean=False, batch_size: int = None, flush_interval: float = None):
+        super().__init__(report_dir, clean)
+        self.batch_size = batch_size or Config.ALLURE_WRITER_BATCH_SIZE
+        self.flush_interval = Config.ALLURE_WRITER_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._sources: dict[str, str] = {}  # 원래 첨부 파일 이름 -> 내용 해시 파일 이름
+        self.written = 0
+        self.deduplicated = 0
+        self.errors: list[str] = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="allure-writer", daemon=True)
+        self._thread.start()
+        _writers.append(self)
+
+    # 테스트 스레드에서 호출되는 hook (큐에 넣기만 함)
+
+    def _report_item(self, item):
+        self._queue.put((self._write_item, item))
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        self._queue.put((self._write_attachment_file, source, file_name))
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        self._queue.put((self._write_attachment, body.encode("utf-8") if isinstance(body, str) else body, file_name))
+
+    # 백그라운드 스레드
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            for task in batch:
+                if task is _STOP:
+                    return
+                if isinstance(task, threading.Event):
+                    task.set()
+                    continue
+                write, *args = task
+                try:
+                    write(*args)
+                except Exception as exc:  # 기록 실패가 다른 결과 기록을 막지 않도록 계속 진행
+                    self.errors.append(f"{write.__name__}: {exc!r}")
+
+    def _write_item(self, item):
+        self._rewrite_sources(item)
+        super()._report_item(item)
+        self.written += 1
+
+    def _write_attachment_file(self, source, file_name):
+        with open(source, "rb") as f:
+            self._write_attachment(f.read(), file_name)
+
+    def _write_attachment(self, body: bytes, file_name: str):
+        _, _, suffix = file_name.partition("-attachment")
+        stored = f"{hashlib.sha256(body).hexdigest()[:32]}-attachment{suffix}"
+        self._sources[file_name] = stored
+        destination = self._report_dir / stored
+        if destination.exists():  # 같은 내용이 이미 저장됨 (다른 테스트나 다른 워커)
+            self.deduplicated += 1
+            return
+        tmp_path = destination.with_name(f"{stored}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, destination)
+        self.written += 1
+
+    def _rewrite_sources(self, item):
+        """결과의 첨부 파일 참조를 내용 해시 파일 이름으로 변경 (첨부 작업이 결과보다 먼저 큐에 들어옴)"""
+        for attachment in getattr(item, "attachments", None) or []:
+            attachment.source = self._sources.pop(attachment.source, attachment.source)
+        for attr in _NESTED_ATTRS:
+            for child in getattr(item, attr, None) or []:
+                self._rewrite_sources(child)
+
+    # 종료
+
+    def flush(self, timeout: float = None) -> bool:
+        """지금까지 큐에 들어온 작업을 모두 기록할 때까지 대기"""
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 60):
+        """남은 작업을 기록하고 백그라운드 스레드 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            sys.stderr.write(f"allure-writer: {self._queue.qsize()}개 작업을 {timeout}초 안에 기록하지 못했습니다\n")
+        for error in self.errors:
+            sys.stderr.write(f"allure-writer: 기록 실패 {error}\n")
+
+
+_writers: list[AsyncAllureFileLogger] = []
+
+
+def install(config) -> bool:
+    """allure-pytest가 결과 기록에 AsyncAllureFileLogger를 사용하도록 설정
+
+    allure-pytest의 pytest_configure보다 먼저 호출해야 한다 (conftest의 pytest_configure가 먼저 실행됨).
+    이미 설정된 경우(allure_listener 등록됨)에는 기본 AllureFileLogger가 사용되므로 경고하고 False를 반환한다.
+    """
+    if config.pluginmanager.has_plugin("allure_listener"):
+        config.issue_config_time_warning(pytest.PytestConfigWarning(
+            "allure-pytest가 이미 설정되어 ALLURE_ASYNC_WRITER를 적용하지 못했습니다 (기본 AllureFileLogger로 기록)"
+        ), stacklevel=2)
+        return False
+    allure_pytest.plugin.AllureFileLogger = AsyncAllureFileLogger
+    return True
+
+
+def flush_all(timeout: float = 60):
+    """생성된 모든 writer가 지금까지 받은 작업을 기록할 때까지 대기"""
+    for writer in _writers:
+        writer.flush(timeout)
+
+
+def close_all():
+    """생성된 모든 writer의 남은 작업 기록"""
+    while _writers:
+        _writers.pop().close()
+
+
+atexit.register(close_all)
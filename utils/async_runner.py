@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+from playwright.async_api import Browser, BrowserContext, async_playwright
+
+
+class AsyncRunner:
+    """백그라운드 스레드의 이벤트 루프에서 코루틴을 실행
+
+    pytest-playwright의 동기 API는 메인 스레드의 이벤트 루프를 사용하므로, 비동기 페이지 객체는
+    별도 스레드의 루프에서 실행하고 동기 테스트 코드에서는 run()/gather()로 결과를 기다린다.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-runner", daemon=True)
+
+    def start(self) -> "AsyncRunner":
+        self._thread.start()
+        return self
+
+    def run(self, coro, timeout: float = None):
+        """코루틴을 실행하고 결과 반환"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def gather(self, *coros, timeout: float = None) -> list:
+        """여러 코루틴을 동시에 실행하고 결과를 순서대로 반환"""
+        async def _gather():
+            return await asyncio.gather(*coros)
+        return self.run(_gather(), timeout)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class AsyncBrowserSession:
+    """AsyncRunner 루프에서 동작하는 비동기 Playwright 브라우저"""
+
+    def __init__(self, runner: AsyncRunner, browser_name: str, launch_args: dict):
+        self.runner = runner
+        self.browser_name = browser_name
+        self.launch_args = launch_args
+        self._playwright = None
+        self.browser: Browser = None
+
+    def start(self) -> "AsyncBrowserSession":
+        async def _start():
+            self._playwright = await async_playwright().start()
+            self.browser = await getattr(self._playwright, self.browser_name).launch(**self.launch_args)
+        self.runner.run(_start())
+        return self
+
+    def stop(self):
+        async def _stop():
+            await self.browser.close()
+            await self._playwright.stop()
+        self.runner.run(_stop())
+
+
+class AsyncContextFactory:
+    """테스트 하나에서 사용하는 비동기 컨텍스트/페이지 생성기 (종료 시 일괄 정리)"""
+
+    def __init__(self, browser: Browser, context_args: dict, prepare_context=None):
+        self.browser = browser
+        self.context_args = context_args
+        self.prepare_context = prepare_context  # 컨텍스트 생성 직후 await (라우팅 설정 등)
+        self.contexts: list[BrowserContext] = []
+
+    async def new_page(self, storage_state=None):
+        """새 컨텍스트의 페이지 반환 (사용자마다 분리된 세션)"""
+        args = dict(self.context_args)
+        if storage_state:
+            args["storage_state"] = storage_state
+        context = await self.browser.new_context(**args)
+        self.contexts.append(context)
+        if self.prepare_context:
+            await self.prepare_context(context)
+        return await context.new_page()
+
+    async def close(self):
+        await asyncio.gather(*(context.close() for context in self.contexts), return_exceptions=True)
+        self.contexts.clear()
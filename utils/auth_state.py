@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+import time
+
+from playwright.sync_api import Browser
+
+from data.users import User
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+from utils.config import Config
+from utils.storage_state import origin_of
+
+
+class AuthStateCache:
+    """사용자별 로그인 storage_state(쿠키 + localStorage) 캐시
+
+    세션 동안 사용자당 한 번만 UI 로그인을 수행하고, 결과를 디스크에 저장해
+    각 테스트의 새 컨텍스트가 로그인된 상태로 시작할 수 있게 한다.
+    """
+
+    def __init__(self, browser: Browser, state_dir: str = None, max_age: int = None, prepare_context=None):
+        self.browser = browser
+        self.prepare_context = prepare_context  # 로그인용 컨텍스트 생성 직후 호출 (라우팅 설정 등)
+        self.state_dir = state_dir or Config.AUTH_STATE_DIR
+        self.max_age = Config.AUTH_STATE_MAX_AGE if max_age is None else max_age
+        self._checked: set[str] = set()  # 이번 세션에서 확인(또는 생성)한 파일 경로
+
+    def get(self, user: User) -> str:
+        """사용자의 storage_state 파일 경로 반환 (없거나 만료되면 로그인 후 생성)"""
+        path = self._state_path(user)
+        if path not in self._checked:
+            if not self._is_fresh(path):
+                self._login_and_save(user, path)
+            self._checked.add(path)
+        return path
+
+    def invalidate(self, user: User):
+        """캐시된 로그인 상태 폐기 (다음 get 호출 시 다시 로그인)"""
+        path = self._state_path(user)
+        self._checked.discard(path)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _state_path(self, user: User) -> str:
+        """대상 출처별 파일 경로 (TEST_URL/--local-app으로 대상이 바뀌면 다른 캐시 사용)"""
+        origin = hashlib.sha256(origin_of(Config.BASE_URL).encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.state_dir, f"{user.username}.{origin}.json")
+
+    def _is_fresh(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        return time.time() - os.path.getmtime(path) < self.max_age
+
+    def _login_and_save(self, user: User, path: str):
+        context = self.browser.new_context()
+        try:
+            if self.prepare_context:
+                self.prepare_context(context)
+            page = context.new_page()
+            login = LoginPage(page)
+            login.open()
+            login.login(user.username, user.password)
+            if not InventoryPage(page).is_inventory_page():
+                raise RuntimeError(f"{user.username}: 로그인에 실패하여 storage_state를 저장할 수 없습니다")
+            _write_json_atomic(path, context.storage_state())
+        finally:
+            context.close()
+
+
+def _write_json_atomic(path: str, data: dict):
+    """병렬 워커가 같은 파일을 덮어써도 깨지지 않도록 임시 파일을 거쳐 저장"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
@@ -0,0 +1,193 @@
+import functools
+import math
+import statistics
+import time
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from utils.config import Config
+
+STATS = ("median", "p95", "max")
+
+_active = None
+
+
+class BudgetExceeded(AssertionError):
+    """액션 지연 시간이 예산을 넘은 경우"""
+
+
+class LatencyRecorder:
+    """테스트 하나에서 측정한 액션별 지연 시간 (ms)"""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = {}
+
+    def record(self, action: str, elapsed_ms: float):
+        self.samples.setdefault(action, []).append(elapsed_ms)
+
+
+def set_active(recorder: LatencyRecorder = None):
+    """페이지 객체 액션이 측정값을 기록할 recorder 지정 (None이면 측정 안 함)"""
+    global _active
+    _active = recorder
+
+
+def timed(action: str, settle: str = None):
+    """페이지 객체 액션의 지연 시간 측정 데코레이터
+
+    settle은 액션 결과가 화면에 나타났음을 나타내는 셀렉터의 클래스 속성 이름으로,
+    측정 중일 때만 해당 요소가 DOM에 붙을 때까지(최대 PAGE_LOAD_TIMEOUT) 기다린 시점을 종료로 본다.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            recorder = _active
+            if recorder is None:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            result = method(self, *args, **kwargs)
+            if settle:
+                try:
+                    self.page.wait_for_selector(getattr(self, settle), state="attached",
+                                                timeout=Config.PAGE_LOAD_TIMEOUT)
+                except PlaywrightTimeoutError:
+                    pass  # 타임아웃까지의 시간이 그대로 기록되어 예산 초과로 판정됨
+            recorder.record(action, (time.perf_counter() - start) * 1000)
+            return result
+        return wrapper
+    return decorator
+
+
+def summarize(samples: list[float], stat: str, warmup: int = 0):
+    """워밍업 샘플을 제외한 통계값 (남은 샘플이 없으면 None)"""
+    values = sorted(samples[warmup:])
+    if not values:
+        return None
+    if stat == "median":
+        return statistics.median(values)
+    if stat == "p95":
+        return values[max(1, math.ceil(0.95 * len(values))) - 1]
+    return values[-1]
+
+
+def parse_budgets(value: str) -> dict[str, float]:
+    """'login=800,sort=200' 형식의 예산 문자열 파싱"""
+    budgets = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        action, _, limit = item.partition("=")
+        budgets[action.strip()] = float(limit)
+    return budgets
+
+
+def page_object_budgets() -> dict[str, float]:
+    """페이지 객체 클래스의 LATENCY_BUDGETS를 합친 세션 예산 (LATENCY_BUDGETS 환경변수가 우선)"""
+    from pages.base_page import BasePage
+
+    budgets = {}
+    pending = [BasePage]
+    while pending:
+        cls = pending.pop()
+        budgets.update(cls.__dict__.get("LATENCY_BUDGETS", {}))
+        pending.extend(cls.__subclasses__())
+    budgets.update(parse_budgets(Config.LATENCY_BUDGETS))
+    return budgets
+
+
+def marker_budgets(item) -> tuple[dict[str, float], str, int]:
+    """budget 마커의 (액션별 예산, 통계, 워밍업 수) - 예: @pytest.mark.budget(login_ms=800, stat="p95")"""
+    budgets, stat, warmup = {}, "max", 0
+    for marker in reversed(list(item.iter_markers("budget"))):
+        for key, value in marker.kwargs.items():
+            if key == "stat":
+                stat = value
+            elif key == "warmup":
+                warmup = value
+            elif key.endswith("_ms"):
+                budgets[key[:-3]] = float(value)
+    return budgets, stat, warmup
+
+
+def check(samples: dict[str, list[float]], budgets: dict[str, float], stat: str, warmup: int,
+          min_samples: int = 1) -> list[str]:
+    """예산 초과 항목 설명 목록 반환 (샘플이 min_samples보다 적은 액션은 판정하지 않음)"""
+    if stat not in STATS:
+        raise ValueError(f"지원하지 않는 통계: {stat} (사용 가능: {', '.join(STATS)})")
+    violations = []
+    for action, limit in sorted(budgets.items()):
+        values = samples.get(action, [])
+        if len(values) - warmup < min_samples:
+            continue
+        measured = summarize(values, stat, warmup)
+        if measured > limit:
+            violations.append(
+                f"{action}: {stat}={measured:.0f}ms > budget {limit:.0f}ms "
+                f"(samples={len(values) - warmup}, warmup={warmup})"
+            )
+    return violations
+
+
+class LatencyBudgets:
+    """액션 지연 시간 예산 플러그인
+
+    - 테스트 예산: budget 마커로 선언, 테스트 본문 실행 후 판정해 초과 시 테스트 실패
+    - 세션 예산: 페이지 객체의 LATENCY_BUDGETS, 전체 세션 샘플(워밍업 제외)의 BUDGET_STAT으로 판정해
+      초과 시 세션을 실패 처리. 테스트가 마커로 자체 예산을 선언한 액션의 샘플은 세션 판정에서 제외한다.
+    xdist 사용 시 워커의 샘플을 컨트롤러에서 합쳐 판정한다.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+        self.samples: dict[str, list[float]] = {}
+        self.violations: list[str] = []
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item):
+        recorder = LatencyRecorder()
+        set_active(recorder)
+        try:
+            result = yield
+        finally:
+            set_active(None)
+            budgets, stat, warmup = marker_budgets(item)
+            for action, values in recorder.samples.items():
+                if action not in budgets:
+                    self.samples.setdefault(action, []).extend(values)
+            item.latency_samples = recorder.samples
+
+        violations = check(recorder.samples, budgets, stat, warmup)
+        if violations:
+            raise BudgetExceeded("지연 시간 예산 초과:\n" + "\n".join(violations))
+        return result
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        for action, values in node.workeroutput.get("latency_samples", {}).items():
+            self.samples.setdefault(action, []).extend(values)
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker:
+            self.config.workeroutput["latency_samples"] = self.samples
+            return
+        self.violations = check(self.samples, page_object_budgets(), Config.BUDGET_STAT,
+                                Config.BUDGET_WARMUP, Config.BUDGET_MIN_SAMPLES)
+        if self.violations and Config.BUDGET_ENFORCE and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.samples:
+            return
+        terminalreporter.write_sep("-", "latency budgets")
+        budgets = page_object_budgets()
+        for action, values in sorted(self.samples.items()):
+            median = summarize(values, "median", Config.BUDGET_WARMUP)
+            p95 = summarize(values, "p95", Config.BUDGET_WARMUP)
+            if median is None:
+                continue
+            limit = f" budget={budgets[action]:.0f}ms" if action in budgets else ""
+            terminalreporter.write_line(
+                f"{action}: n={len(values)} median={median:.0f}ms p95={p95:.0f}ms{limit}"
+            )
+        for violation in self.violations:
+            terminalreporter.write_line(f"BUDGET EXCEEDED {violation}", red=True)
@@ -0,0 +1,61 @@
+import json
+
+from playwright.sync_api import Page
+
+from data.products import Product, Products
+from pages.base_page import BasePage
+from utils.config import Config
+from utils.storage_state import origin_of, with_origin_page
+
+# 사이트가 장바구니 상품 ID 목록(JSON 배열)을 저장하는 localStorage 키
+CART_STORAGE_KEY = "cart-contents"
+
+_WRITE_CART_SCRIPT = """
+([key, value]) => value === null ? localStorage.removeItem(key) : localStorage.setItem(key, value)
+"""
+
+
+class CartSeedError(AssertionError):
+    """저장소에 기록한 장바구니가 화면에 반영되지 않은 경우"""
+
+
+class CartSeeder:
+    """UI를 거치지 않고 장바구니 내용을 브라우저 저장소(localStorage)에 직접 기록
+
+    사이트는 페이지를 로드할 때 저장소의 장바구니를 읽으므로, 기록 후 이동(open)한 페이지부터 반영된다.
+    현재 페이지가 사이트 출처가 아니면 출처의 빈 문서(라우팅 응답)에서 기록한다.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.products: list[Product] = []
+
+    def seed(self, *products) -> list[Product]:
+        """장바구니를 products(Product 또는 상품 이름)로 교체하고 기록한 상품 목록 반환"""
+        self.products = [Products.get_by_name(p) if isinstance(p, str) else p for p in products]
+        value = json.dumps([product.id for product in self.products]) if self.products else None
+        self._write(value)
+        return self.products
+
+    def clear(self):
+        """장바구니 비우기"""
+        self.products = []
+        self._write(None)
+
+    def open(self, page_object: BasePage) -> BasePage:
+        """기록한 장바구니로 page_object를 열고 배지 수가 기록한 상품 수와 같은지 확인"""
+        page_object.open()
+        count = page_object.get_cart_badge_count()
+        if count != len(self.products):
+            raise CartSeedError(
+                f"장바구니 배지 수({count})가 저장소에 기록한 상품 수({len(self.products)})와 다릅니다"
+            )
+        return page_object
+
+    def _write(self, value):
+        origin = origin_of(Config.BASE_URL)
+        args = [CART_STORAGE_KEY, value]
+        if origin_of(self.page.url) == origin:
+            self.page.evaluate(_WRITE_CART_SCRIPT, args)
+        else:
+            with_origin_page(self.page.context, self.page, origin, lambda p: p.evaluate(_WRITE_CART_SCRIPT, args))
@@ -11,6 +11,94 @@ class Config:
     # 리포트 설정
     REPORTS_DIR = os.getenv("REPORTS_DIR", "/reports")
     SCREENSHOT_ON_FAILURE = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
+    # always, on-failure, on-failure-or-retry, never
+    SCREENSHOT_POLICY = os.getenv("SCREENSHOT_POLICY", "on-failure" if SCREENSHOT_ON_FAILURE else "never")
+    SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "png")  # png, jpeg
+    SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "80"))  # jpeg 품질 (0-100)
+    # 실패한 테스트의 Playwright trace 저장 (utils/failure_trace.py, 통과한 테스트의 trace는 버림)
+    TRACE_ON_FAILURE = os.getenv("TRACE_ON_FAILURE", "true").lower() == "true"
+    TRACE_DIR = os.getenv("TRACE_DIR", os.path.join(REPORTS_DIR, "traces"))
+    TRACE_SNAPSHOTS = os.getenv("TRACE_SNAPSHOTS", "true").lower() == "true"  # 액션별 DOM 스냅샷
+    TRACE_SCREENSHOTS = os.getenv("TRACE_SCREENSHOTS", "true").lower() == "true"  # 스크린캐스트 (타임라인 화면)
+    TRACE_SOURCES = os.getenv("TRACE_SOURCES", "false").lower() == "true"  # 테스트 소스 코드 포함
+    # Allure 결과를 백그라운드 스레드에서 모아서 기록 (첨부 파일은 내용 해시로 중복 제거)
+    ALLURE_ASYNC_WRITER = os.getenv("ALLURE_ASYNC_WRITER", "true").lower() == "true"
+    ALLURE_WRITER_BATCH_SIZE = int(os.getenv("ALLURE_WRITER_BATCH_SIZE", "50"))  # 한 번에 기록할 최대 작업 수
+    ALLURE_WRITER_FLUSH_INTERVAL = float(os.getenv("ALLURE_WRITER_FLUSH_INTERVAL", "0.5"))  # 작업을 모으는 최대 시간 (초)
+    # Allure 결과 디렉터리 크기 예산 (utils/report_budget.py, 0이면 정리 안 함)
+    REPORT_SIZE_BUDGET_MB = int(os.getenv("REPORT_SIZE_BUDGET_MB", "200"))
+    # 예산 초과 시 첨부 파일 삭제 순서 (앞쪽 상태부터, 같은 상태는 오래된 순 / 목록에 없는 상태는 보존)
+    REPORT_EVICTION_ORDER = os.getenv("REPORT_EVICTION_ORDER", "passed,skipped,unknown,broken,failed")
+
+    # 로그인 상태(storage_state) 캐시 설정
+    AUTH_CACHE = os.getenv("AUTH_CACHE", "true").lower() == "true"
+    AUTH_STATE_DIR = os.getenv("AUTH_STATE_DIR", os.path.join(REPORTS_DIR, ".auth"))
+    AUTH_STATE_MAX_AGE = int(os.getenv("AUTH_STATE_MAX_AGE", "600"))  # 초
+
+    # 여정 상태 스냅샷 설정 (false면 테스트마다 여정 단계를 처음부터 실행)
+    JOURNEY_SNAPSHOTS = os.getenv("JOURNEY_SNAPSHOTS", "true").lower() == "true"
+
+    # 재시도 설정 (utils/retry.py, 알려진 불안정 테스트와 대기 시간 초과 실패만 재시도)
+    RETRY_MAX = int(os.getenv("RETRY_MAX", "1"))  # 테스트당 최대 재시도 수 (0이면 재시도 안 함)
+    RETRY_SESSION_LIMIT = int(os.getenv("RETRY_SESSION_LIMIT", "10"))  # 프로세스(워커)당 최대 재시도 수
+    RETRY_HISTORY_SIZE = int(os.getenv("RETRY_HISTORY_SIZE", "20"))  # 테스트별로 보관할 최근 결과 수
+
+    # 병렬 실행 설정 (pytest-xdist)
+    WORKERS = os.getenv("WORKERS", "1")  # 숫자 또는 auto
+    SCHEDULE = os.getenv("SCHEDULE", "order")  # order: TEST_ORDER, duration: 과거 소요 시간 기준 LPT
+    SHM_PER_WORKER_MB = int(os.getenv("SHM_PER_WORKER_MB", "512"))  # 워커(브라우저)당 /dev/shm 필요량
+
+    # 네트워크 차단 설정 (image, font, media, stylesheet, analytics, third_party / 빈 값이면 차단 안 함)
+    BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "image,font,media,analytics,third_party")
+
+    # HAR 녹화/재생 설정
+    HAR_DIR = os.getenv("HAR_DIR", os.path.join(REPORTS_DIR, "har"))
+    HAR_NOT_FOUND = os.getenv("HAR_NOT_FOUND", "abort")  # 녹화본에 없는 요청: abort(차단) 또는 fallback(실제 네트워크)
+
+    # 성능 지표 수집 (Navigation Timing, paint, LCP, CLS, long task)
+    WEB_VITALS = os.getenv("WEB_VITALS", "false").lower() == "true"  # false면 web_vitals 마커가 있는 테스트만 수집
+    WEB_VITALS_FILE = os.getenv("WEB_VITALS_FILE", os.path.join(REPORTS_DIR, "web_vitals.jsonl"))
+
+    # BasePage 액션 계측 설정 (utils/instrumentation.py)
+    INSTRUMENT_ACTIONS = os.getenv("INSTRUMENT_ACTIONS", "false").lower() == "true"
+    # click/fill/get_text 전에 요소 대기를 따로 수행해 대기/실행 시간을 나눔 (액션마다 드라이버 호출 1회 추가)
+    INSTRUMENT_SPLIT_WAIT = os.getenv("INSTRUMENT_SPLIT_WAIT", "false").lower() == "true"
+    INSTRUMENT_BUFFER_SIZE = int(os.getenv("INSTRUMENT_BUFFER_SIZE", "10000"))  # 테스트당 보관할 최근 액션 수
+    INSTRUMENT_EXPORTS = os.getenv("INSTRUMENT_EXPORTS", "jsonl")  # jsonl, allure, trace (쉼표로 여러 개)
+    INSTRUMENT_FILE = os.getenv("INSTRUMENT_FILE", os.path.join(REPORTS_DIR, "actions.jsonl"))
+    INSTRUMENT_TRACE_DIR = os.getenv("INSTRUMENT_TRACE_DIR", os.path.join(REPORTS_DIR, "action_traces"))
+
+    # 스위트 프로파일링 설정 (--profile-suite, utils/profiler.py)
+    PROFILE_SUITE = os.getenv("PROFILE_SUITE", "false").lower() == "true"
+    PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(REPORTS_DIR, "profile"))
+    PROFILE_TOP = int(os.getenv("PROFILE_TOP", "15"))  # 보고서 항목별로 출력할 상위 개수
+
+    # 테스트 영향 분석 설정 (--changed-since, utils/impact.py)
+    IMPACT_MAP = os.getenv("IMPACT_MAP", "false").lower() == "true"  # 테스트별 의존성 기록 (INSTRUMENT_ACTIONS 필요)
+    IMPACT_MAP_FILE = os.getenv("IMPACT_MAP_FILE", os.path.join(REPORTS_DIR, "impact_map.json"))
+    CHANGED_SINCE = os.getenv("CHANGED_SINCE", "")  # --changed-since 기본값 (git ref)
+    IMPACT_DIFF_FILE = os.getenv("IMPACT_DIFF_FILE", "")  # git 대신 읽을 diff 파일 (git 저장소가 없는 컨테이너 실행용)
+    IMPACT_FULL_RUN_EVERY = int(os.getenv("IMPACT_FULL_RUN_EVERY", "10"))  # 선택 실행 N번마다 전체 실행 (0이면 안 함)
+    IMPACT_IGNORE = os.getenv("IMPACT_IGNORE", "*.md,docs/*,.gitignore,reset.sh,run_test.sh,run_example.sh")
+
+    # 지연 시간 예산 설정 (utils/budgets.py)
+    LATENCY_BUDGETS = os.getenv("LATENCY_BUDGETS", "")  # 페이지 객체 기본 예산 덮어쓰기 (예: login=800,sort=200)
+    BUDGET_STAT = os.getenv("BUDGET_STAT", "p95")  # median, p95, max
+    BUDGET_WARMUP = int(os.getenv("BUDGET_WARMUP", "1"))  # 세션 판정에서 제외할 액션별 첫 샘플 수
+    BUDGET_MIN_SAMPLES = int(os.getenv("BUDGET_MIN_SAMPLES", "5"))  # 샘플이 이보다 적으면 세션 판정 생략
+    # true면 세션 예산 초과 시 실패 처리 (네트워크 영향이 적은 --local-app 실행용, 기본은 리포트만)
+    BUDGET_ENFORCE = os.getenv("BUDGET_ENFORCE", "false").lower() == "true"
+
+    # 브라우저 컨텍스트 풀 설정 (테스트 간 컨텍스트/페이지 재사용)
+    CONTEXT_POOL = os.getenv("CONTEXT_POOL", "false").lower() == "true"
+    CONTEXT_POOL_MAX_USES = int(os.getenv("CONTEXT_POOL_MAX_USES", "50"))  # 이 횟수만큼 사용한 컨텍스트는 새로 생성
+    CONTEXT_POOL_MAX_MEMORY_MB = int(os.getenv("CONTEXT_POOL_MAX_MEMORY_MB", "256"))  # JS 힙이 넘으면 새로 생성
+
+    # 로컬 대체 서버 설정 (local_app/server.py)
+    LOCAL_APP = os.getenv("LOCAL_APP", "false").lower() == "true"  # true면 BASE_URL 대신 로컬 서버 대상으로 실행
+    LOCAL_APP_PORT = int(os.getenv("LOCAL_APP_PORT", "0"))  # 0이면 빈 포트 자동 할당
+    LOCAL_APP_LATENCY_MS = int(os.getenv("LOCAL_APP_LATENCY_MS", "0"))  # 모든 요청에 추가할 지연
+    LOCAL_APP_GLITCH_MS = int(os.getenv("LOCAL_APP_GLITCH_MS", "3000"))  # performance_glitch_user 화면 지연
 
     # 테스트 대상 URL
     BASE_URL = os.getenv("TEST_URL", "https://www.saucedemo.com")
@@ -0,0 +1,136 @@
+import json
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from utils.config import Config
+from utils.storage_state import apply_storage_state, clear_origin_storage, origin_of
+
+# 크로미움에서만 제공되는 JS 힙 사용량 (다른 브라우저는 null)
+_HEAP_SCRIPT = "() => performance.memory ? performance.memory.usedJSHeapSize : null"
+
+
+class ContextLeakError(RuntimeError):
+    """초기화 후에도 이전 테스트의 상태가 남아 있는 경우"""
+
+
+class PooledContext:
+    """풀에서 대여한 컨텍스트와 기본 페이지"""
+
+    def __init__(self, context: BrowserContext, key: str):
+        self.context = context
+        self.page = context.new_page()
+        self.key = key
+        self.uses = 0
+        self.origins: set[str] = set()  # 초기화 시 저장소를 비울 출처
+        context.on("page", self._track)
+        self._track(self.page)
+
+    def _track(self, page: Page):
+        page.on("framenavigated", lambda frame: self.origins.add(origin_of(frame.url)))
+
+
+class ContextPool:
+    """테스트 간에 재사용하는 브라우저 컨텍스트 풀
+
+    반납된 컨텍스트는 쿠키/저장소/권한/라우팅을 초기화하고 about:blank로 이동한 뒤,
+    초기화 결과를 검증해 이전 테스트의 상태가 남아 있으면 ContextLeakError를 발생시킨다.
+    max_uses회 사용했거나 JS 힙이 max_memory_mb를 넘은 컨텍스트는 닫고 새로 만든다.
+
+    init script(add_init_script)와 이벤트 리스너는 제거할 수 없으므로 풀 컨텍스트에서는 사용하지 않는다.
+    """
+
+    def __init__(self, browser: Browser, max_uses: int = None, max_memory_mb: int = None):
+        self.browser = browser
+        self.max_uses = Config.CONTEXT_POOL_MAX_USES if max_uses is None else max_uses
+        self.max_memory_mb = Config.CONTEXT_POOL_MAX_MEMORY_MB if max_memory_mb is None else max_memory_mb
+        self._idle: dict[str, list[PooledContext]] = {}
+        self._leased: dict[BrowserContext, PooledContext] = {}
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, context_args: dict) -> PooledContext:
+        """컨텍스트 옵션이 같은 대기 컨텍스트를 대여 (없으면 생성, storage_state는 생성 후 적용)"""
+        args = dict(context_args)
+        storage_state = args.pop("storage_state", None)
+        key = json.dumps(args, sort_keys=True, default=str)
+
+        idle = self._idle.get(key)
+        if idle:
+            pooled = idle.pop()
+            self.reused += 1
+        else:
+            pooled = PooledContext(self.browser.new_context(**args), key)
+            self.created += 1
+
+        pooled.uses += 1
+        self._leased[pooled.context] = pooled
+        if storage_state:
+            apply_storage_state(pooled.context, pooled.page, storage_state)
+            pooled.page.goto("about:blank")
+        return pooled
+
+    def release(self, pooled: PooledContext):
+        """컨텍스트 반납 (초기화 + 검증 후 대기열에 추가, 재활용 조건이면 닫음)"""
+        self._leased.pop(pooled.context, None)
+        if self._should_recycle(pooled):
+            pooled.context.close()
+            return
+        try:
+            self._reset(pooled)
+            self._verify(pooled)
+        except Exception:
+            pooled.context.close()
+            raise
+        self._idle.setdefault(pooled.key, []).append(pooled)
+
+    def leased(self, context: BrowserContext) -> PooledContext:
+        """대여 중인 컨텍스트의 PooledContext 반환"""
+        return self._leased[context]
+
+    def close(self):
+        """대기 중인 모든 컨텍스트 종료"""
+        for idle in self._idle.values():
+            for pooled in idle:
+                pooled.context.close()
+        self._idle.clear()
+
+    def _should_recycle(self, pooled: PooledContext) -> bool:
+        if pooled.uses >= self.max_uses or pooled.page.is_closed():
+            return True
+        heap = pooled.page.evaluate(_HEAP_SCRIPT)
+        return heap is not None and heap > self.max_memory_mb * 1024 * 1024
+
+    def _reset(self, pooled: PooledContext):
+        context, page = pooled.context, pooled.page
+        for extra in context.pages:
+            if extra != page:
+                extra.close()
+        page.unroute_all(behavior="ignoreErrors")
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_cookies()
+        context.clear_permissions()
+        context.set_extra_http_headers({})
+        context.set_offline(False)
+
+        origins = pooled.origins | {entry["origin"] for entry in context.storage_state()["origins"]}
+        for origin in sorted(filter(None, origins)):
+            remaining = clear_origin_storage(context, page, origin)
+            if remaining:
+                raise ContextLeakError(f"{origin}: 초기화 후에도 저장소 항목 {remaining}개가 남아 있습니다")
+        page.goto("about:blank")
+        pooled.origins.clear()
+
+    @staticmethod
+    def _verify(pooled: PooledContext):
+        """초기화 결과 검증 - 쿠키, localStorage, 추가 페이지, 현재 URL"""
+        state = pooled.context.storage_state()
+        leaks = []
+        if state["cookies"]:
+            leaks.append(f"쿠키 {[c['name'] for c in state['cookies']]}")
+        leaks += [f"{o['origin']} localStorage" for o in state["origins"] if o.get("localStorage")]
+        if len(pooled.context.pages) != 1:
+            leaks.append(f"페이지 {len(pooled.context.pages)}개")
+        if pooled.page.url != "about:blank":
+            leaks.append(f"URL {pooled.page.url}")
+        if leaks:
+            raise ContextLeakError(f"컨텍스트 초기화 후 상태가 남아 있습니다: {', '.join(leaks)}")
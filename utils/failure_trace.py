@@ -0,0 +1,62 @@
+import os
+import re
+import weakref
+
+import allure
+from playwright.sync_api import BrowserContext, Error as PlaywrightError
+
+from utils.config import Config
+
+
+def trace_path_for(nodeid: str, attempt: int = 1) -> str:
+    """테스트 nodeid(와 재시도 횟수)로 trace zip 경로 생성"""
+    name = re.sub(r"[^\w.-]+", "_", nodeid).strip("_")
+    suffix = f".attempt{attempt}" if attempt > 1 else ""
+    return os.path.join(Config.TRACE_DIR, f"{name}{suffix}.zip")
+
+
+class FailureTracer:
+    """실패한 테스트만 Playwright trace를 저장
+
+    컨텍스트마다 tracing.start는 한 번만 호출하고(컨텍스트 풀에서 재사용되는 컨텍스트 포함),
+    테스트마다 start_chunk/stop_chunk로 구간을 나눈다. 통과한 테스트는 path 없이 stop_chunk를 호출해
+    파일을 쓰지 않고 버린다.
+    """
+
+    def __init__(self, snapshots: bool = None, screenshots: bool = None, sources: bool = None):
+        self.options = {
+            "snapshots": Config.TRACE_SNAPSHOTS if snapshots is None else snapshots,
+            "screenshots": Config.TRACE_SCREENSHOTS if screenshots is None else screenshots,
+            "sources": Config.TRACE_SOURCES if sources is None else sources,
+        }
+        self._started: weakref.WeakSet = weakref.WeakSet()
+        self.saved = 0
+        self.discarded = 0
+
+    def begin(self, context: BrowserContext, title: str):
+        """context에서 테스트 구간(chunk) 기록 시작"""
+        if context not in self._started:
+            context.tracing.start(**self.options)
+            self._started.add(context)
+        context.tracing.start_chunk(title=title)
+
+    def end(self, context: BrowserContext, path: str = None):
+        """구간 기록 종료 - path가 있으면 zip으로 저장, 없으면 버림"""
+        if context not in self._started:
+            return
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            context.tracing.stop_chunk(path=path)
+        except PlaywrightError:
+            self._started.discard(context)  # 닫힌 컨텍스트 (테스트가 직접 닫은 경우 등)
+            return
+        if path:
+            self.saved += 1
+        else:
+            self.discarded += 1
+
+
+def attach_trace(path: str):
+    """저장한 trace zip을 Allure에 첨부 (npx playwright show-trace 또는 trace.playwright.dev에서 열기)"""
+    allure.attach.file(path, name="playwright_trace", extension="zip")
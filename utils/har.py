@@ -0,0 +1,84 @@
+import base64
+import glob
+import json
+import os
+import re
+
+from playwright.sync_api import BrowserContext, Route
+
+from utils.config import Config
+
+# fulfill 시 본문은 이미 디코딩된 상태이므로 전송 관련 헤더는 제외
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def har_path_for(nodeid: str) -> str:
+    """테스트 nodeid로 HAR 녹화 파일 경로 생성"""
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+    return os.path.join(Config.HAR_DIR, f"{name}.har")
+
+
+class HarIndex:
+    """HAR 아카이브 응답 인덱스
+
+    (method, url, post_data) 키로 응답을 dict에 보관해 아카이브 크기와 무관하게
+    요청당 O(1)로 조회한다. 본문 디코딩은 실제로 응답할 때 수행한다.
+    """
+
+    def __init__(self, not_found: str = None):
+        self.not_found = not_found or Config.HAR_NOT_FOUND
+        self._responses: dict[tuple, dict] = {}
+
+    @classmethod
+    def load_dir(cls, har_dir: str = None, not_found: str = None) -> "HarIndex":
+        """디렉터리의 모든 .har 파일을 읽어 인덱스 생성"""
+        index = cls(not_found)
+        for path in sorted(glob.glob(os.path.join(har_dir or Config.HAR_DIR, "*.har"))):
+            index.add_file(path)
+        return index
+
+    def add_file(self, path: str):
+        """HAR 파일의 응답을 인덱스에 추가 (같은 요청은 나중에 읽은 응답으로 덮어씀)"""
+        with open(path, encoding="utf-8") as f:
+            har = json.load(f)
+        for entry in har["log"]["entries"]:
+            request = entry["request"]
+            post_data = (request.get("postData") or {}).get("text", "")
+            self._responses[_key(request["method"], request["url"], post_data)] = entry["response"]
+
+    def __len__(self):
+        return len(self._responses)
+
+    def lookup(self, method: str, url: str, post_data: str = None):
+        """요청에 해당하는 HAR 응답 반환 (없으면 None)"""
+        return self._responses.get(_key(method, url, post_data or ""))
+
+    def install(self, context: BrowserContext):
+        """컨텍스트의 모든 요청을 인덱스에서 응답"""
+        context.route("**/*", self._handle)
+
+    async def install_async(self, context):
+        """비동기 API 컨텍스트의 모든 요청을 인덱스에서 응답"""
+        await context.route("**/*", self._handle)
+
+    def _handle(self, route: Route):
+        # route 호출 결과를 반환 (install_async에서는 Playwright가 await)
+        request = route.request
+        response = self.lookup(request.method, request.url, request.post_data)
+        if response is None:
+            if self.not_found == "fallback":
+                return route.fallback()
+            return route.abort("internetdisconnected")
+
+        content = response.get("content", {})
+        body = content.get("text", "")
+        body = base64.b64decode(body) if content.get("encoding") == "base64" else body.encode("utf-8")
+        headers = {
+            h["name"]: h["value"] for h in response.get("headers", [])
+            if h["name"].lower() not in _SKIPPED_HEADERS
+        }
+        return route.fulfill(status=response["status"], headers=headers, body=body)
+
+
+def _key(method: str, url: str, post_data: str) -> tuple:
+    return method.upper(), url.split("#", 1)[0], post_data
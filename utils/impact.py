@@ -0,0 +1,388 @@
+import ast
+import fnmatch
+import inspect
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Optional
+
+import pytest
+
+from utils import instrumentation
+from utils.config import Config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PAGES_DIR = os.path.join(ROOT, "pages") + os.sep
+_INSTRUMENTATION_FILE = instrumentation.__file__
+
+# 의존성 키("파일::qualname")로 변경 위치를 판단할 수 있는 경로 (그 외 코드 변경은 전체 실행)
+ANALYZED = ("pages/", "data/", "conftest.py")
+_KEY_KINDS = ("methods", "classes", "fixtures", "data")
+
+_HUNK = re.compile(r"@@ -\S+ \+(\d+)(?:,(\d+))? @@")
+
+
+class ImpactError(RuntimeError):
+    """변경 내역(git diff)을 읽을 수 없는 경우"""
+
+
+def relpath(filename: str) -> Optional[str]:
+    """저장소 루트 기준 경로 (저장소 밖이나 설치된 패키지면 None)"""
+    path = os.path.abspath(filename)
+    if not path.startswith(ROOT + os.sep) or "site-packages" in path:
+        return None
+    return os.path.relpath(path, ROOT).replace(os.sep, "/")
+
+
+def _class_key(cls) -> Optional[str]:
+    try:
+        path = relpath(inspect.getfile(cls))
+    except TypeError:
+        return None
+    return f"{path}::{cls.__qualname__}" if path else None
+
+
+class DependencyRecorder:
+    """ActionTracer 리스너: BasePage 액션을 실행한 페이지 객체 메서드/클래스와 셀렉터를 기록
+
+    액션이 기록되는 시점의 호출 스택에서 pages/의 프레임을 찾아 'pages/파일.py::클래스.메서드'로 남기고,
+    페이지 객체 클래스는 상속한 클래스(BasePage, 셀렉터 클래스)까지 기록한다.
+    """
+
+    def __init__(self):
+        self.methods: set[str] = set()
+        self.classes: set[str] = set()
+        self.selectors: set[str] = set()
+        self._types: set[type] = set()
+
+    def __call__(self, event):
+        if event.selector is not None:
+            self.selectors.add(str(event.selector))
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename == _INSTRUMENTATION_FILE and code.co_name == "wrapper":
+                # 계측된 BasePage 메서드는 기록 시점에 이미 반환했으므로 데코레이터가 감싼 메서드로 기록
+                method = frame.f_locals.get("method")
+                method_code = getattr(method, "__code__", None)
+                if method_code and method_code.co_filename.startswith(_PAGES_DIR):
+                    self.methods.add(f"{relpath(method_code.co_filename)}::{method.__qualname__}")
+            elif code.co_filename.startswith(_PAGES_DIR):
+                self.methods.add(f"{relpath(code.co_filename)}::{code.co_qualname}")
+                page = frame.f_locals.get("self")
+                if page is not None and type(page) not in self._types:
+                    self._types.add(type(page))
+                    self.classes.update(key for key in map(_class_key, type(page).__mro__)
+                                        if key and key.startswith("pages/"))
+            frame = frame.f_back
+
+
+def _code_names(code):
+    yield from code.co_names
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            yield from _code_names(const)
+
+
+def data_refs(functions) -> set[str]:
+    """함수(와 함수가 호출하는 저장소 내 함수)가 참조하는 data/ 클래스 ('data/users.py::Users')"""
+    refs, seen = set(), set()
+    pending = [getattr(func, "__func__", func) for func in functions]
+    while pending:
+        func = inspect.unwrap(pending.pop())
+        code = getattr(func, "__code__", None)
+        if code is None or code in seen or relpath(code.co_filename) is None:
+            continue
+        seen.add(code)
+        for name in _code_names(code):
+            value = func.__globals__.get(name)
+            if inspect.isclass(value):
+                key = _class_key(value)
+                if key and key.startswith("data/"):
+                    refs.add(key)
+            elif inspect.isfunction(value):
+                pending.append(value)
+    return refs
+
+
+def dependencies_of(item, recorder: DependencyRecorder = None) -> dict:
+    """테스트 하나의 의존성 기록 (complete: 액션 계측 중에 통과해서 끝까지 실행된 기록인지)"""
+    fixtures, functions = set(), [item.obj]
+    for defs in item._fixtureinfo.name2fixturedefs.values():
+        func = defs[-1].func
+        code = getattr(func, "__code__", None)
+        path = relpath(code.co_filename) if code else None
+        if path:
+            fixtures.add(f"{path}::{func.__qualname__}")
+            functions.append(func)
+    data = data_refs(functions)
+    # 테스트 모듈의 헬퍼(여정 단계 등)가 참조하는 data 클래스도 포함되도록 모듈에 import된 data 클래스 추가
+    module_classes = (value for value in vars(item.module).values() if inspect.isclass(value))
+    data.update(key for key in map(_class_key, module_classes) if key and key.startswith("data/"))
+    rep_call = getattr(item, "rep_call", None)
+    return {
+        "complete": bool(recorder and rep_call and rep_call.passed),
+        "methods": sorted(recorder.methods) if recorder else [],
+        "classes": sorted(recorder.classes) if recorder else [],
+        "selectors": sorted(recorder.selectors) if recorder else [],
+        "fixtures": sorted(fixtures),
+        "data": sorted(data),
+    }
+
+
+# 변경 내역 → 의존성 키
+
+def parse_diff(text: str) -> dict[str, Optional[set[int]]]:
+    """git diff -U0 출력 → 파일별 변경된 줄 번호 (삭제/바이너리 파일은 None: 파일 전체 변경)"""
+    changes: dict[str, Optional[set[int]]] = {}
+    path = None
+    for line in text.splitlines():
+        if line.startswith("diff --git "):
+            path = line.rsplit(" b/", 1)[-1]
+            changes[path] = None
+        elif line.startswith("+++ ") and path:
+            if line != "+++ /dev/null":
+                changes[path] = set()
+        elif line.startswith("@@") and path and changes.get(path) is not None:
+            match = _HUNK.match(line)
+            if match:
+                start, count = int(match[1]), int(match[2] or 1)
+                # 삭제만 있는 hunk는 삭제 위치 앞뒤 줄로 판단
+                changes[path].update(range(start, start + count) if count else (max(start, 1), start + 1))
+    return changes
+
+
+def _spans(node, prefix: str = "", in_class: bool = False):
+    """(시작 줄, 끝 줄, qualname) - 함수/클래스와 클래스 속성 (co_qualname과 같은 형식)"""
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            name = prefix + child.name
+            start = min([child.lineno] + [decorator.lineno for decorator in child.decorator_list])
+            yield start, child.end_lineno, name
+            is_class = isinstance(child, ast.ClassDef)
+            yield from _spans(child, name + ("." if is_class else ".<locals>."), is_class)
+        elif in_class and isinstance(child, (ast.Assign, ast.AnnAssign)):
+            targets = child.targets if isinstance(child, ast.Assign) else [child.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    yield child.lineno, child.end_lineno, prefix + target.id
+
+
+def changed_keys(path: str, lines: Optional[set[int]]) -> set[str]:
+    """변경된 줄을 감싸는 가장 안쪽 함수/클래스/클래스 속성의 키 (모듈 수준 코드는 파일 경로)"""
+    if lines is None or not path.endswith(".py"):
+        return {path}
+    try:
+        with open(os.path.join(ROOT, path), encoding="utf-8") as f:
+            spans = list(_spans(ast.parse(f.read())))
+    except (OSError, SyntaxError, ValueError):
+        return {path}
+    keys = set()
+    for line in lines:
+        enclosing = [span for span in spans if span[0] <= line <= span[1]]
+        keys.add(f"{path}::{min(enclosing, key=lambda s: s[1] - s[0])[2]}" if enclosing else path)
+    return keys
+
+
+def _git(*args) -> str:
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError) as exc:
+        raise ImpactError(f"git {' '.join(args)} 실패: {getattr(exc, 'stderr', '') or exc}".strip()) from exc
+
+
+def load_changes(ref: str) -> dict[str, Optional[set[int]]]:
+    """ref(와 현재 HEAD의 merge-base) 이후 변경 내역 (IMPACT_DIFF_FILE이 있으면 git 대신 파일 사용)"""
+    if Config.IMPACT_DIFF_FILE:
+        try:
+            with open(Config.IMPACT_DIFF_FILE, encoding="utf-8") as f:
+                return parse_diff(f.read())
+        except OSError as exc:
+            raise ImpactError(f"IMPACT_DIFF_FILE을 읽을 수 없습니다: {exc}") from exc
+    base = _git("merge-base", ref, "HEAD").strip()
+    changes = parse_diff(_git("diff", "-U0", "--no-color", "--no-ext-diff", "--no-renames", base, "--"))
+    for path in _git("ls-files", "--others", "--exclude-standard").splitlines():
+        changes.setdefault(path, None)
+    return changes
+
+
+# 선택
+
+def _entry_keys(entry: dict) -> set[str]:
+    return {key for kind in _KEY_KINDS for key in entry.get(kind, [])}
+
+
+def full_run_reason(changes: dict[str, list[str]], tests: dict[str, dict]) -> Optional[str]:
+    """영향 범위를 판단할 수 없어 전체 실행해야 하는 이유 (선택 실행 가능하면 None)"""
+    recorded = set().union(*map(_entry_keys, tests.values()))
+    files = {key.split("::")[0] for key in recorded}
+    for path, keys in changes.items():
+        if path.startswith("tests/"):
+            continue
+        if not path.startswith(ANALYZED):
+            return f"{path} 변경"
+        if path not in files:
+            return f"{path} 변경 (의존성 기록 없음)"
+        if path == "conftest.py":
+            unknown = sorted(key for key in keys if key not in recorded)
+            if unknown:
+                return f"{unknown[0]} 변경 (fixture가 아닌 conftest 코드)"
+    return None
+
+
+def _depends(keys: set[str], path: str, key: str, recorded: set[str]) -> bool:
+    if key == path or path.startswith("data/"):
+        return any(k.startswith(path + "::") for k in keys)
+    if key in recorded:
+        return key in keys
+    # 어떤 테스트도 기록하지 않은 메서드/속성(계측되지 않는 경로 포함)은 클래스 단위로 판단
+    owner = f"{path}::{key.split('::', 1)[1].split('.')[0]}"
+    return any(k == owner or k.startswith(owner + ".") for k in keys)
+
+
+def affected(nodeids, changes: dict[str, list[str]], tests: dict[str, dict]) -> set[str]:
+    """변경에 영향을 받는 테스트 (변경된 테스트 파일의 테스트와 기록 없는 테스트 포함)"""
+    index = {nodeid: _entry_keys(entry) for nodeid, entry in tests.items()}
+    recorded = set().union(*index.values())
+    selected = {nodeid for nodeid in nodeids if nodeid not in index}
+    for path, keys in changes.items():
+        for nodeid in nodeids:
+            if nodeid in selected:
+                continue
+            if path.startswith("tests/"):
+                if nodeid.split("::")[0] == path:
+                    selected.add(nodeid)
+            elif nodeid in index and any(_depends(index[nodeid], path, key, recorded) for key in keys):
+                selected.add(nodeid)
+    return selected
+
+
+class ImpactAnalysis:
+    """테스트 영향 분석 플러그인
+
+    - 기록: 테스트마다 실행한 페이지 객체 메서드/클래스, 셀렉터, fixture, data/ 클래스를 IMPACT_MAP_FILE에 누적
+    - --changed-since REF: REF 이후 변경된 함수/클래스에 의존하는 테스트, 변경된 테스트 파일, 기록 없는 테스트만 실행
+    - 판단할 수 없는 변경(utils/, 설정 파일, conftest hook 등)이나 IMPACT_FULL_RUN_EVERY번째 선택 실행은 전체 실행
+    xdist 사용 시 변경 분석은 컨트롤러에서 한 번만 수행해 워커에 전달하고, 기록은 컨트롤러에서 합쳐 저장한다.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+        self.ref = config.getoption("changed_since") or None
+        self.map = self._load()
+        self.recorded: dict[str, dict] = {}
+        self.changes: Optional[dict[str, list[str]]] = None
+        self.full_reason: Optional[str] = None
+        self.selected = self.deselected = None
+        if not self.ref:
+            return
+        if self.is_worker:
+            shared = config.workerinput.get("impact", {})
+            self.changes, self.full_reason = shared.get("changes"), shared.get("full_reason")
+        else:
+            self.changes, self.full_reason = self._analyze()
+
+    def _analyze(self):
+        tests = self.map["tests"]
+        if not tests:
+            return None, f"의존성 기록 없음 ({Config.IMPACT_MAP_FILE})"
+        runs = self.map.get("selective_runs", 0)
+        if Config.IMPACT_FULL_RUN_EVERY and runs >= Config.IMPACT_FULL_RUN_EVERY:
+            return None, f"주기적 전체 실행 (선택 실행 {runs}회 후)"
+        try:
+            lines = load_changes(self.ref)
+        except ImpactError as exc:
+            return None, str(exc)
+        ignore = [pattern.strip() for pattern in Config.IMPACT_IGNORE.split(",") if pattern.strip()]
+        changes = {
+            path: sorted(changed_keys(path, changed)) for path, changed in sorted(lines.items())
+            if not any(fnmatch.fnmatch(path, pattern) for pattern in ignore)
+        }
+        return changes, full_run_reason(changes, tests)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node):
+        node.workerinput["impact"] = {"changes": self.changes, "full_reason": self.full_reason}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.ref or self.full_reason or self.changes is None:
+            return
+        selected = affected([item.nodeid for item in items], self.changes, self.map["tests"])
+        keep = [item for item in items if item.nodeid in selected]
+        drop = [item for item in items if item.nodeid not in selected]
+        if drop:
+            config.hook.pytest_deselected(items=drop)
+            items[:] = keep
+        self.selected, self.deselected = len(keep), len(drop)
+
+    def record(self, item, recorder: DependencyRecorder = None):
+        """테스트 종료 시 의존성 기록 (impact_deps fixture에서 호출)"""
+        self.recorded[item.nodeid] = dependencies_of(item, recorder)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.recorded.update(node.workeroutput.get("impact_deps", {}))
+        selected, deselected = node.workeroutput.get("impact_selected"), node.workeroutput.get("impact_deselected")
+        if selected is not None:  # 워커는 모두 같은 테스트 목록을 수집하므로 한 워커의 값을 사용
+            self.selected, self.deselected = selected, deselected
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker:
+            self.config.workeroutput["impact_deps"] = self.recorded
+            self.config.workeroutput["impact_selected"] = self.selected
+            self.config.workeroutput["impact_deselected"] = self.deselected
+            return
+        if self.selected == 0 and session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+            session.exitstatus = pytest.ExitCode.OK  # 영향 받는 테스트가 없는 변경은 성공 (CI 빌드를 실패시키지 않음)
+        tests = self.map["tests"]
+        for nodeid, entry in self.recorded.items():
+            previous = tests.get(nodeid)
+            if previous and not entry["complete"]:
+                # 중간에 실패한 테스트는 이전 기록과 합침 (실행하지 못한 부분의 의존성을 잃지 않도록)
+                entry = {kind: sorted(set(previous.get(kind, [])) | set(value)) if isinstance(value, list) else value
+                         for kind, value in entry.items()}
+            tests[nodeid] = entry
+        if self.ref and not self.config.option.collectonly:
+            if self.full_reason:
+                self.map["selective_runs"] = 0
+            elif self.selected:  # 테스트를 하나도 실행하지 않은 실행은 세지 않음
+                self.map["selective_runs"] = self.map.get("selective_runs", 0) + 1
+        if self.recorded or self.ref:
+            self._save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.ref:
+            return
+        terminalreporter.write_sep("-", "impact analysis")
+        if self.full_reason:
+            terminalreporter.write_line(f"full run: {self.full_reason}")
+            return
+        changed = [path for path in self.changes] or ["(없음)"]
+        terminalreporter.write_line(f"changed since {self.ref}: {', '.join(changed)}")
+        if self.selected is not None:
+            terminalreporter.write_line(f"selected {self.selected}, deselected {self.deselected}")
+        terminalreporter.write_line(
+            f"selective runs since last full run: {self.map['selective_runs']}"
+            + (f"/{Config.IMPACT_FULL_RUN_EVERY}" if Config.IMPACT_FULL_RUN_EVERY else "")
+        )
+
+    def _load(self) -> dict:
+        try:
+            with open(Config.IMPACT_MAP_FILE, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        data.setdefault("selective_runs", 0)
+        data.setdefault("tests", {})
+        return data
+
+    def _save(self):
+        os.makedirs(os.path.dirname(Config.IMPACT_MAP_FILE), exist_ok=True)
+        tmp_path = f"{Config.IMPACT_MAP_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.map, f, indent=2, sort_keys=True, ensure_ascii=False)
+        os.replace(tmp_path, Config.IMPACT_MAP_FILE)
@@ -0,0 +1,183 @@
+import functools
+import json
+import os
+import re
+import time
+from collections import deque
+from typing import NamedTuple, Optional
+
+import allure_commons
+from allure_commons.model2 import Parameter, Status, TestStepResult
+
+from utils.config import Config
+
+EXPORTS = ("jsonl", "allure", "trace")
+
+_active = None
+
+
+class ActionEvent(NamedTuple):
+    """BasePage 액션 1회의 기록 (시각/시간 단위는 ms, start는 수집기 생성 시점 기준)"""
+
+    action: str
+    selector: Optional[str]
+    start: float
+    wait: float
+    act: float
+    status: str  # ok, timeout(대기 결과 False), 예외 클래스 이름
+
+    @property
+    def duration(self) -> float:
+        return self.wait + self.act
+
+    def to_dict(self) -> dict:
+        return {
+            "action": self.action, "selector": self.selector, "start_ms": round(self.start, 3),
+            "wait_ms": round(self.wait, 3), "act_ms": round(self.act, 3),
+            "duration_ms": round(self.duration, 3), "status": self.status,
+        }
+
+
+class ActionTracer:
+    """테스트 하나의 BasePage 액션 기록기
+
+    기록은 고정 크기 링 버퍼(deque)에 쌓고 내보내기는 테스트 종료 시 한 번만 수행한다.
+    capacity를 넘으면 오래된 기록부터 버리고 dropped에 개수를 남긴다.
+    """
+
+    def __init__(self, capacity: int = None):
+        self.events: deque[ActionEvent] = deque(maxlen=capacity or Config.INSTRUMENT_BUFFER_SIZE)
+        self.dropped = 0
+        self.listeners = []
+        self.origin = time.perf_counter()
+        self.origin_epoch = time.time()
+
+    def add_listener(self, listener):
+        """액션마다 ActionEvent를 받을 콜백 등록 (계측 확장용)"""
+        self.listeners.append(listener)
+
+    def record(self, event: ActionEvent):
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append(event)
+        for listener in self.listeners:
+            listener(event)
+
+    def epoch_ms(self, offset_ms: float) -> int:
+        """start 기준 ms를 epoch ms로 변환"""
+        return int(self.origin_epoch * 1000 + offset_ms)
+
+    def to_records(self) -> list[dict]:
+        return [event.to_dict() for event in self.events]
+
+    def to_chrome_trace(self, name: str) -> dict:
+        """Chrome trace / Perfetto에서 열 수 있는 타임라인 (액션 아래에 wait/act 구간)"""
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}}]
+        for event in self.events:
+            start = event.start * 1000  # us
+            events.append({
+                "name": event.action, "cat": "action", "ph": "X", "pid": pid, "tid": 0,
+                "ts": round(start, 1), "dur": round(event.duration * 1000, 1),
+                "args": {"selector": event.selector, "status": event.status},
+            })
+            for phase, offset, length in (("wait", 0, event.wait), ("act", event.wait, event.act)):
+                if length > 0:
+                    events.append({
+                        "name": phase, "cat": phase, "ph": "X", "pid": pid, "tid": 0,
+                        "ts": round(start + offset * 1000, 1), "dur": round(length * 1000, 1),
+                    })
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"test": name, "dropped": self.dropped}}
+
+
+def set_active(tracer: ActionTracer = None):
+    """BasePage 액션이 기록될 tracer 지정 (None이면 계측 안 함)"""
+    global _active
+    _active = tracer
+
+
+def instrumented(action: str, wait_state: str = None, wait_only: bool = False):
+    """BasePage 액션 계측 데코레이터 (첫 번째 인자를 셀렉터/URL로 기록)
+
+    - wait_state: INSTRUMENT_SPLIT_WAIT이면 액션 전에 해당 상태까지 먼저 대기해 대기/실행 시간을 나눈다
+      (아니면 액션 자체의 자동 대기를 포함한 전체를 실행 시간으로 기록)
+    - wait_only: 액션 전체를 대기 시간으로 기록 (False 반환은 timeout으로 기록)
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tracer = _active
+            if tracer is None:
+                return method(self, *args, **kwargs)
+            selector = args[0] if args else next(iter(kwargs.values()), None)
+            start = waited = time.perf_counter()
+            status = "ok"
+            try:
+                if wait_state and Config.INSTRUMENT_SPLIT_WAIT:
+                    self.page.wait_for_selector(selector, state=wait_state)
+                    waited = time.perf_counter()
+                result = method(self, *args, **kwargs)
+                if wait_only and result is False:
+                    status = "timeout"
+                return result
+            except Exception as exc:
+                status = type(exc).__name__
+                raise
+            finally:
+                end = time.perf_counter()
+                if wait_only:
+                    waited = end
+                tracer.record(ActionEvent(
+                    action, selector, (start - tracer.origin) * 1000,
+                    (waited - start) * 1000, (end - waited) * 1000, status,
+                ))
+        return wrapper
+    return decorator
+
+
+def parse_exports(value: str) -> list[str]:
+    """'jsonl,trace' 형식의 내보내기 목록 파싱"""
+    exports = [part.strip() for part in value.split(",") if part.strip()]
+    unknown = set(exports) - set(EXPORTS)
+    if unknown:
+        raise ValueError(f"지원하지 않는 계측 내보내기: {', '.join(sorted(unknown))} (사용 가능: {', '.join(EXPORTS)})")
+    return exports
+
+
+def append_jsonl(path: str, nodeid: str, tracer: ActionTracer):
+    """테스트의 액션 기록을 JSONL 파일에 추가 (액션당 한 줄, 테스트당 쓰기 1회)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lines = "".join(
+        json.dumps({"nodeid": nodeid, **record}, ensure_ascii=False) + "\n" for record in tracer.to_records()
+    )
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(lines)
+
+
+def write_chrome_trace(directory: str, nodeid: str, tracer: ActionTracer) -> str:
+    """테스트별 Chrome trace JSON 파일 저장 후 경로 반환"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, re.sub(r"[^\w.-]+", "_", nodeid) + ".trace.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(tracer.to_chrome_trace(nodeid), f, ensure_ascii=False)
+    return path
+
+
+def add_allure_steps(tracer: ActionTracer):
+    """현재 Allure 테스트 결과에 액션 기록을 실제 시각의 step으로 추가 (timeout은 대기 결과이므로 통과로 표시)"""
+    reporter = next((plugin.allure_logger for plugin in allure_commons.plugin_manager.get_plugins()
+                     if hasattr(plugin, "allure_logger")), None)
+    test = reporter.get_test(None) if reporter else None
+    if test is None:
+        return  # allure-pytest가 비활성화된 실행
+    for event in tracer.events:
+        test.steps.append(TestStepResult(
+            name=f"{event.action} {event.selector}" if event.selector else event.action,
+            start=tracer.epoch_ms(event.start),
+            stop=tracer.epoch_ms(event.start + event.duration),
+            status=Status.PASSED if event.status in ("ok", "timeout") else Status.BROKEN,
+            parameters=[Parameter(name="wait_ms", value=f"{event.wait:.1f}"),
+                        Parameter(name="act_ms", value=f"{event.act:.1f}")],
+        ))
+    test.steps.sort(key=lambda step: step.start or 0)
@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from playwright.sync_api import Browser, BrowserContext, Error as PlaywrightError, Page
+
+from data.users import User
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from utils.auth_state import AuthStateCache
+from utils.storage_state import apply_storage_state, clear_origin_storage, origin_of
+
+
+class JourneyStateError(RuntimeError):
+    """여정 단계를 실행했지만 목표 상태에 도달하지 못한 경우"""
+
+
+@dataclass(frozen=True)
+class Journey:
+    """이름 붙은 앱 상태와 그 상태까지 가는 단계
+
+    steps는 로그인된 InventoryPage를 받아 목표 상태까지 진행하고 테스트에 넘길 값(JSON 직렬화 가능)을 반환한다.
+    verify는 현재 페이지가 목표 상태인지 확인한다.
+    """
+
+    name: str
+    steps: Callable[[InventoryPage], Any]
+    verify: Callable[[Page], bool]
+
+
+@dataclass
+class JourneySnapshot:
+    """목표 상태의 storage_state, URL, steps 반환값"""
+
+    storage_state: dict
+    url: str
+    data: Any
+    restores: int = 0  # 복원에 성공한 횟수
+
+
+class JourneySnapshotCache:
+    """여정 상태를 워커(세션)당 한 번 만들어 스냅샷으로 저장하고, 테스트마다 스냅샷을 복원
+
+    스냅샷은 별도 컨텍스트에서 steps를 실행한 뒤 storage_state(쿠키 + localStorage)와 URL을 저장한 것으로,
+    테스트 컨텍스트에 storage_state를 적용하고 URL로 바로 이동해 복원한다.
+    스냅샷 생성이나 복원(verify)에 실패하면 테스트 페이지에서 steps를 다시 실행한다.
+    복원에 성공한 적이 있는 스냅샷이 실패하면(세션 쿠키 만료 등) 스냅샷과 로그인 상태 캐시를 버리고 다음 테스트에서 다시 만들며,
+    만든 직후부터 복원에 실패하는 스냅샷은 더 이상 사용하지 않는다.
+    """
+
+    def __init__(self, browser: Browser, auth_state_cache: AuthStateCache = None, prepare_context=None,
+                 enabled: bool = True):
+        self.browser = browser
+        self.auth_state_cache = auth_state_cache  # 있으면 캐시된 로그인 상태로 스냅샷 생성
+        self.prepare_context = prepare_context  # 스냅샷용 컨텍스트 생성 직후 호출 (라우팅 설정 등)
+        self.enabled = enabled
+        self._snapshots: dict[tuple[str, str], Optional[JourneySnapshot]] = {}
+        self.restored = 0
+        self.replayed = 0
+
+    def enter(self, context: BrowserContext, page: Page, journey: Journey, user: User):
+        """테스트 페이지를 journey 상태로 만들고 steps 반환값 반환 (복원 실패 시 steps 재실행)"""
+        snapshot = self.get(journey, user) if self.enabled else None
+        if snapshot and self._restore(context, page, journey, snapshot):
+            snapshot.restores += 1
+            self.restored += 1
+            return snapshot.data
+        if snapshot:
+            self._discard(journey, user, snapshot)
+        self.replayed += 1
+        return replay(page, journey, user)
+
+    def get(self, journey: Journey, user: User) -> Optional[JourneySnapshot]:
+        """사용자별 journey 스냅샷 (처음 요청 시 생성, 생성에 실패했으면 None)"""
+        key = (journey.name, user.username)
+        if key not in self._snapshots:
+            try:
+                self._snapshots[key] = self._build(journey, user)
+            except (PlaywrightError, JourneyStateError):
+                self._snapshots[key] = None  # 이후 테스트는 재실행으로 진행
+        return self._snapshots[key]
+
+    def _discard(self, journey: Journey, user: User, snapshot: JourneySnapshot):
+        """복원에 실패한 스냅샷 폐기"""
+        key = (journey.name, user.username)
+        if not snapshot.restores:
+            self._snapshots[key] = None  # 만든 직후부터 복원되지 않음 - 다시 만들어도 같으므로 재실행으로 진행
+            return
+        del self._snapshots[key]  # 만료된 상태 - 다음 테스트에서 새 로그인 상태로 다시 생성
+        if self.auth_state_cache:
+            self.auth_state_cache.invalidate(user)
+
+    def _build(self, journey: Journey, user: User) -> JourneySnapshot:
+        args = {"storage_state": self.auth_state_cache.get(user)} if self.auth_state_cache else {}
+        context = self.browser.new_context(**args)
+        try:
+            if self.prepare_context:
+                self.prepare_context(context)
+            page = context.new_page()
+            data = replay(page, journey, user)
+            return JourneySnapshot(context.storage_state(), page.url, data)
+        finally:
+            context.close()
+
+    def _restore(self, context: BrowserContext, page: Page, journey: Journey, snapshot: JourneySnapshot) -> bool:
+        try:
+            apply_storage_state(context, page, snapshot.storage_state)
+            page.goto(snapshot.url)
+            if journey.verify(page):
+                return True
+        except PlaywrightError:
+            pass
+        # 복원 중 적용된 상태가 재실행에 섞이지 않도록 초기화
+        context.clear_cookies()
+        clear_origin_storage(context, page, origin_of(snapshot.url))
+        return False
+
+
+def replay(page: Page, journey: Journey, user: User):
+    """로그인부터 journey steps를 실행하고 반환값 반환 (목표 상태가 아니면 JourneyStateError)"""
+    inventory = InventoryPage(page)
+    inventory.open()
+    page.wait_for_selector(f"{InventoryPage.INVENTORY_LIST}, {LoginPage.LOGIN_BUTTON}")
+    if not inventory.is_present_now(InventoryPage.INVENTORY_LIST):
+        LoginPage(page).login(user.username, user.password)
+    data = journey.steps(inventory)
+    if not journey.verify(page):
+        raise JourneyStateError(f"{journey.name}: {user.username} 여정이 목표 상태에 도달하지 못했습니다 ({page.url})")
+    return data
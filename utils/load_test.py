@@ -0,0 +1,234 @@
+"""구매 여정 부하 테스트
+
+TestFullCheckoutFlow와 같은 여정(로그인 → 상품 추가 → 장바구니 → 체크아웃 1/2단계 → 완료)을
+비동기 페이지 객체(pages/aio)로 N명의 가상 사용자가 동시에 반복 실행하고,
+단계별 지연 시간(p50/p95/p99)과 처리량(여정/분)을 보고한다. 대상은 TEST_URL.
+
+    TEST_URL=http://localhost:8000 python -m utils.load_test --users 20 --duration 120 --ramp-up 30
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import time
+
+from playwright.async_api import Browser, async_playwright
+
+from data.products import Products
+from data.users import Users
+from pages.aio.cart_page import CartPage
+from pages.aio.checkout_page import CheckoutCompletePage, CheckoutStepOnePage, CheckoutStepTwoPage
+from pages.aio.inventory_page import InventoryPage
+from pages.aio.login_page import LoginPage
+from utils.config import Config
+from utils.network import NetworkProfile, parse_categories
+
+STEPS = ("login", "add_items", "cart", "checkout_step_one", "checkout_step_two", "finish")
+PERCENTILES = (50, 95, 99)
+
+
+class JourneyError(Exception):
+    """여정 단계의 결과 검증 실패"""
+
+    def __init__(self, step: str, message: str):
+        super().__init__(f"{step}: {message}")
+        self.step = step
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """nearest-rank 백분위수 (정렬된 값 목록 기준)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LoadRecorder:
+    """단계별 지연 시간, 완료 여정 수, 실패 수 집계"""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {step: [] for step in STEPS}
+        self.errors: dict[str, int] = {}
+        self.journeys = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, step: str, elapsed_ms: float):
+        self.latencies[step].append(elapsed_ms)
+
+    def record_error(self, step: str):
+        self.errors[step] = self.errors.get(step, 0) + 1
+
+    def summary(self) -> dict:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        steps = {}
+        for step, values in self.latencies.items():
+            values = sorted(values)
+            steps[step] = {
+                "count": len(values),
+                **{f"p{p}": round(percentile(values, p), 1) for p in PERCENTILES},
+                "max": round(values[-1], 1) if values else 0.0,
+            }
+        return {
+            "elapsed_s": round(elapsed, 1),
+            "journeys": self.journeys,
+            "errors": dict(self.errors),
+            "throughput_per_min": round(self.journeys / elapsed * 60, 2) if elapsed else 0.0,
+            "steps": steps,
+        }
+
+
+class _StepTimer:
+    """async with로 감싼 단계의 소요 시간을 기록 (예외 발생 시 실패로 기록)"""
+
+    def __init__(self, recorder: LoadRecorder, step: str):
+        self.recorder = recorder
+        self.step = step
+
+    async def __aenter__(self):
+        self.start = time.perf_counter()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.recorder.record(self.step, (time.perf_counter() - self.start) * 1000)
+        else:
+            self.recorder.record_error(self.step)
+
+
+def journey_products(items: int) -> tuple:
+    """여정에서 장바구니에 담을 상품 (인벤토리 표시 순서의 앞에서부터 items개)"""
+    if not 1 <= items <= len(Products.ALL):
+        raise ValueError(f"items는 1 이상 {len(Products.ALL)} 이하여야 합니다: {items}")
+    return Products.ALL[:items]
+
+
+def _check(step: str, condition: bool, message: str):
+    if not condition:
+        raise JourneyError(step, message)
+
+
+async def run_journey(page, recorder: LoadRecorder, user=Users.STANDARD, items: int = 1):
+    """구매 여정 1회 실행 (단계마다 다음 화면이 표시될 때까지를 지연 시간으로 기록)"""
+    products = journey_products(items)
+    login = LoginPage(page)
+    inventory = InventoryPage(page)
+    cart = CartPage(page)
+    step_one = CheckoutStepOnePage(page)
+    step_two = CheckoutStepTwoPage(page)
+    complete = CheckoutCompletePage(page)
+
+    async with _StepTimer(recorder, "login"):
+        await login.open()
+        await login.login(user.username, user.password)
+        _check("login", await inventory.is_inventory_page(), "인벤토리 페이지가 표시되지 않음")
+
+    async with _StepTimer(recorder, "add_items"):
+        # 담을 때마다 Add 버튼 목록이 줄어들어 인덱스가 밀리므로 이름으로 추가
+        for product in products:
+            await inventory.add_item_to_cart_by_name(product.name)
+        _check("add_items", await inventory.get_cart_badge_count() == items, "장바구니 배지 수 불일치")
+
+    async with _StepTimer(recorder, "cart"):
+        await inventory.click_shopping_cart()
+        _check("cart", await cart.is_cart_page(), "장바구니 페이지가 표시되지 않음")
+
+    async with _StepTimer(recorder, "checkout_step_one"):
+        await cart.click_checkout()
+        _check("checkout_step_one", await step_one.is_checkout_step_one_page(), "체크아웃 1단계가 표시되지 않음")
+
+    async with _StepTimer(recorder, "checkout_step_two"):
+        await step_one.fill_checkout_info("Load", "Test", "10001")
+        await step_one.click_continue()
+        _check("checkout_step_two", await step_two.is_checkout_step_two_page(), "체크아웃 2단계가 표시되지 않음")
+
+    async with _StepTimer(recorder, "finish"):
+        await step_two.click_finish()
+        _check("finish", await complete.is_checkout_complete_page(), "주문 완료 페이지가 표시되지 않음")
+
+    recorder.journeys += 1
+
+
+async def _virtual_user(browser: Browser, recorder: LoadRecorder, profile: NetworkProfile,
+                        start_delay: float, deadline: float, user, items: int):
+    """시작 지연 후 종료 시각까지 새 컨텍스트에서 여정을 반복"""
+    await asyncio.sleep(start_delay)
+    while time.perf_counter() < deadline:
+        context = await browser.new_context()
+        try:
+            await profile.install_async(context)
+            page = await context.new_page()
+            try:
+                await run_journey(page, recorder, user, items)
+            except Exception:
+                pass  # 실패 단계는 _StepTimer가 기록하고 다음 여정을 계속 실행
+        finally:
+            await context.close()
+
+
+async def run_load(users: int, duration: float, ramp_up: float = 0, user=Users.STANDARD, items: int = 1,
+                   browser_name: str = None, headless: bool = None) -> dict:
+    """가상 사용자 users명으로 duration초 동안 여정 반복 (ramp_up초에 걸쳐 선형으로 사용자 증가)"""
+    journey_products(items)  # 브라우저를 띄우기 전에 items 검증
+    recorder = LoadRecorder()
+    profile = NetworkProfile(parse_categories(Config.BLOCK_RESOURCES))
+    async with async_playwright() as playwright:
+        browser_type = getattr(playwright, browser_name or Config.BROWSER)
+        browser = await browser_type.launch(headless=Config.HEADLESS if headless is None else headless)
+        try:
+            recorder.started = time.perf_counter()  # 처리량 계산에서 브라우저 시작 시간 제외
+            deadline = recorder.started + duration
+            await asyncio.gather(*(
+                _virtual_user(browser, recorder, profile, ramp_up * i / users, deadline, user, items)
+                for i in range(users)
+            ))
+        finally:
+            recorder.finished = time.perf_counter()
+            await browser.close()
+    return recorder.summary()
+
+
+def format_report(summary: dict) -> str:
+    """콘솔 출력용 보고서 문자열"""
+    lines = [
+        f"journeys: {summary['journeys']} in {summary['elapsed_s']}s "
+        f"({summary['throughput_per_min']} journeys/min), errors: {summary['errors'] or 0}",
+        f"{'step':<20}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)",
+    ]
+    for step, stats in summary["steps"].items():
+        lines.append(f"{step:<20}{stats['count']:>8}{stats['p50']:>10}{stats['p95']:>10}"
+                     f"{stats['p99']:>10}{stats['max']:>10}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="구매 여정 부하 테스트 (대상: TEST_URL)")
+    parser.add_argument("--users", type=int, default=10, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=60, help="실행 시간 (초)")
+    parser.add_argument("--ramp-up", type=float, default=0, help="가상 사용자를 모두 시작하기까지 걸리는 시간 (초)")
+    parser.add_argument("--user", default=Users.STANDARD.username, help="로그인 사용자")
+    parser.add_argument("--items", type=int, default=1, help="여정당 장바구니에 담을 상품 수")
+    parser.add_argument("--report", default=os.path.join(Config.REPORTS_DIR, "load_report.json"),
+                        help="JSON 보고서 저장 경로")
+    args = parser.parse_args()
+    try:
+        journey_products(args.items)
+    except ValueError as e:
+        parser.error(str(e))
+
+    summary = asyncio.run(run_load(
+        args.users, args.duration, args.ramp_up, Users.get_by_username(args.user), args.items
+    ))
+    summary["config"] = {
+        "base_url": Config.BASE_URL, "users": args.users, "duration": args.duration,
+        "ramp_up": args.ramp_up, "user": args.user, "items": args.items,
+    }
+    print(format_report(summary))
+
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import base64
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Route
+
+from utils.config import Config
+
+# 1x1 투명 PNG (이미지 요청을 차단 대신 대체할 때 사용 - 레이아웃과 load 이벤트 유지)
+TRANSPARENT_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+ANALYTICS_HOSTS = (
+    "backtrace.io",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "segment.io",
+    "optimizely.com",
+)
+
+# 차단 대상 카테고리: Playwright resource_type + 분석 스크립트(analytics) + 외부 출처(third_party)
+CATEGORIES = ("image", "font", "media", "stylesheet", "analytics", "third_party")
+
+
+def parse_categories(value: str) -> set[str]:
+    """'image,font' 형식의 문자열을 카테고리 집합으로 변환"""
+    categories = {c.strip() for c in value.split(",") if c.strip()}
+    unknown = categories - set(CATEGORIES)
+    if unknown:
+        raise ValueError(f"Unknown resource categories: {', '.join(sorted(unknown))} "
+                         f"(choose from {', '.join(CATEGORIES)})")
+    return categories
+
+
+class NetworkProfile:
+    """테스트 브라우저의 요청 차단/대체 프로필
+
+    이미지는 1x1 PNG로 대체하고, 나머지 차단 대상은 요청 자체를 중단한다.
+    """
+
+    def __init__(self, blocked: set[str], base_url: str = None):
+        self.blocked = set(blocked)
+        self.origin = _origin(base_url or Config.BASE_URL)
+
+    @classmethod
+    def for_test(cls, node) -> "NetworkProfile":
+        """Config 기본값에 테스트의 block_resources / allow_resources 마커를 반영한 프로필"""
+        blocked = parse_categories(Config.BLOCK_RESOURCES)
+        for marker in node.iter_markers("block_resources"):
+            blocked |= parse_categories(",".join(marker.args))
+        for marker in node.iter_markers("allow_resources"):
+            blocked -= parse_categories(",".join(marker.args))
+        return cls(blocked)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.blocked)
+
+    def install(self, context: BrowserContext):
+        """컨텍스트의 모든 요청에 프로필 적용"""
+        if self.enabled:
+            context.route("**/*", self._handle)
+
+    async def install_async(self, context):
+        """비동기 API 컨텍스트에 프로필 적용"""
+        if self.enabled:
+            await context.route("**/*", self._handle)
+
+    def category_of(self, url: str, resource_type: str):
+        """요청이 해당하는 차단 카테고리 반환 (차단 대상이 아니면 None)"""
+        host = urlsplit(url).hostname or ""
+        if "analytics" in self.blocked and any(host == h or host.endswith(f".{h}") for h in ANALYTICS_HOSTS):
+            return "analytics"
+        if resource_type in self.blocked:
+            return resource_type
+        if "third_party" in self.blocked and url.startswith("http") and _origin(url) != self.origin:
+            return "third_party"
+        return None
+
+    def _handle(self, route: Route):
+        # 비동기 API에서는 반환된 코루틴을 Playwright가 await하므로 동기/비동기 컨텍스트 모두에서 사용 가능
+        request = route.request
+        category = self.category_of(request.url, request.resource_type)
+        if category is None:
+            return route.fallback()
+        if category == "image":
+            return route.fulfill(status=200, content_type="image/png", body=TRANSPARENT_PNG)
+        return route.abort("blockedbyclient")
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
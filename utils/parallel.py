@@ -0,0 +1,33 @@
+import os
+import shutil
+
+import pytest
+
+from utils.config import Config
+
+
+def resolve_worker_count(value: str) -> int:
+    """--workers 값을 실제 워커 프로세스 수로 변환
+
+    auto: CPU 수와 /dev/shm 크기(docker-compose의 shm_size) 중 작은 쪽에 맞춘다.
+    워커마다 브라우저를 하나씩 띄우므로 공유 메모리가 부족하면 Chromium이 죽는다.
+    """
+    if value != "auto":
+        try:
+            return max(1, int(value))
+        except ValueError:
+            raise pytest.UsageError(f"--workers(WORKERS) 값은 숫자 또는 auto여야 합니다: {value!r}") from None
+
+    cpu_count = os.cpu_count() or 1
+    shm_mb = _shm_size_mb()
+    if shm_mb is None:
+        return cpu_count
+    return max(1, min(cpu_count, shm_mb // Config.SHM_PER_WORKER_MB))
+
+
+def _shm_size_mb():
+    """/dev/shm 전체 크기(MB) 반환 (없으면 None)"""
+    try:
+        return shutil.disk_usage("/dev/shm").total // (1024 * 1024)
+    except OSError:
+        return None
@@ -0,0 +1,257 @@
+import contextlib
+import functools
+import inspect
+import os
+import time
+from collections import Counter, defaultdict
+
+import allure_commons
+import pytest
+
+from utils.config import Config
+
+# 프레임 이름 접두사로 집계 분류
+FIXTURE = "fixture:"
+PAGE = "page:"
+ALLURE = "allure:"
+PHASES = ("setup", "call", "teardown")
+
+
+class _FrameStack:
+    """프레임 스택의 경로별 self time(초)을 누적"""
+
+    def __init__(self):
+        self.frames: list[str] = []
+        self.self_time: dict[tuple, float] = defaultdict(float)
+        self.calls: Counter = Counter()
+        self._last = time.perf_counter()
+
+    def _flush(self):
+        now = time.perf_counter()
+        if self.frames:
+            self.self_time[tuple(self.frames)] += now - self._last
+        self._last = now
+
+    def push(self, name: str, count: bool = True):
+        self._flush()
+        self.frames.append(name)
+        if count:
+            self.calls[name] += 1
+
+    def pop(self, name: str):
+        """name 프레임(과 그 위에 남은 프레임)을 내림"""
+        self._flush()
+        if name in self.frames:
+            del self.frames[len(self.frames) - 1 - self.frames[::-1].index(name):]
+
+    @contextlib.contextmanager
+    def frame(self, name: str):
+        self.push(name)
+        try:
+            yield
+        finally:
+            self.pop(name)
+
+
+def _page_classes() -> list[type]:
+    """BasePage와 모든 하위 페이지 객체 클래스"""
+    from pages.base_page import BasePage
+
+    classes, pending = [], [BasePage]
+    while pending:
+        cls = pending.pop()
+        classes.append(cls)
+        pending.extend(cls.__subclasses__())
+    return classes
+
+
+def _framed(stack: _FrameStack, frame: str, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with stack.frame(frame):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+class SuiteProfiler:
+    """--profile-suite: 테스트 시간을 fixture/본문/페이지 객체 메서드/Allure I/O로 나눠 집계
+
+    테스트마다 모듈 → 테스트 → setup/call/teardown → fixture → 페이지 객체 메서드 순의 프레임 스택을 만들고,
+    경로별 self time을 flamegraph 형식(collapsed stack)과 정렬된 보고서로 저장한다.
+    fixture teardown 시간은 해당 fixture 프레임에 포함된다 (capture_screenshot 등).
+    xdist 사용 시 워커의 스택을 컨트롤러에서 합친다.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+        self.stack = _FrameStack()
+        self.stacks: dict[str, float] = defaultdict(float)  # "a;b;c" -> 초 (워커 합산 포함)
+        self.calls: Counter = Counter()
+        self._originals = []
+        self._started = time.perf_counter()
+        for cls in _page_classes():
+            self._wrap_methods(cls)
+        allure_commons.plugin_manager.register(self, "suite_profiler")
+
+    def _wrap_methods(self, cls):
+        """페이지 객체의 공개 메서드 호출을 'page:클래스.메서드' 프레임으로 기록 (unconfigure 시 복원)"""
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(method):
+                continue
+            self._originals.append((cls, name, method))
+            setattr(cls, name, _framed(self.stack, f"{PAGE}{cls.__name__}.{name}", method))
+
+    # pytest 단계
+
+    @pytest.hookimpl(wrapper=True, tryfirst=True)
+    def pytest_runtest_protocol(self, item):
+        module = item.nodeid.split("::")[0]
+        with self.stack.frame(module), self.stack.frame(item.name.replace(";", ",")):
+            return (yield)
+
+    @pytest.hookimpl(wrapper=True, tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        with self.stack.frame("setup"):
+            return (yield)
+
+    @pytest.hookimpl(wrapper=True, tryfirst=True)
+    def pytest_runtest_call(self, item):
+        with self.stack.frame("call"):
+            return (yield)
+
+    @pytest.hookimpl(wrapper=True, tryfirst=True)
+    def pytest_runtest_teardown(self, item):
+        with self.stack.frame("teardown"):
+            return (yield)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        frame = FIXTURE + fixturedef.argname
+        try:
+            with self.stack.frame(frame):
+                return (yield)
+        finally:
+            # 나중에 등록한 finalizer가 먼저 실행되므로 fixture 자체 teardown 직전에 프레임을 올림
+            fixturedef.addfinalizer(lambda: self.stack.push(frame, count=False))
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        self.stack.pop(FIXTURE + fixturedef.argname)
+
+    # Allure 결과/첨부 파일 쓰기
+
+    @allure_commons.hookimpl(hookwrapper=True)
+    def attach_data(self, body, name, attachment_type, extension):
+        with self.stack.frame(ALLURE + "attach_data"):
+            yield
+
+    @allure_commons.hookimpl(hookwrapper=True)
+    def attach_file(self, source, name, attachment_type, extension):
+        with self.stack.frame(ALLURE + "attach_file"):
+            yield
+
+    @allure_commons.hookimpl(hookwrapper=True)
+    def report_result(self, result):
+        with self.stack.frame(ALLURE + "report_result"):
+            yield
+
+    @allure_commons.hookimpl(hookwrapper=True)
+    def report_container(self, container):
+        with self.stack.frame(ALLURE + "report_container"):
+            yield
+
+    # 집계
+
+    def _collect_local(self):
+        for frames, seconds in self.stack.self_time.items():
+            self.stacks[";".join(frames)] += seconds
+        self.calls.update(self.stack.calls)
+        self.stack.self_time.clear()
+        self.stack.calls.clear()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        output = node.workeroutput.get("suite_profile", {})
+        for path, seconds in output.get("stacks", {}).items():
+            self.stacks[path] += seconds
+        self.calls.update(output.get("calls", {}))
+
+    def pytest_sessionfinish(self, session):
+        self._collect_local()
+        if self.is_worker:
+            self.config.workeroutput["suite_profile"] = {"stacks": dict(self.stacks), "calls": dict(self.calls)}
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.stacks:
+            return
+        report = format_report(self.stacks, self.calls, time.perf_counter() - self._started)
+        os.makedirs(Config.PROFILE_DIR, exist_ok=True)
+        with open(os.path.join(Config.PROFILE_DIR, "suite_profile.txt"), "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+        with open(os.path.join(Config.PROFILE_DIR, "suite_profile.folded"), "w", encoding="utf-8") as f:
+            f.write(to_folded(self.stacks))
+        terminalreporter.write_sep("-", "suite profile")
+        terminalreporter.write_line(report)
+        terminalreporter.write_line(f"saved: {Config.PROFILE_DIR}/suite_profile.txt, suite_profile.folded")
+
+    def pytest_unconfigure(self, config):
+        for cls, name, method in reversed(self._originals):
+            setattr(cls, name, method)
+        allure_commons.plugin_manager.unregister(self)
+
+
+def inclusive_times(stacks: dict[str, float]) -> dict[str, float]:
+    """프레임별 inclusive 시간 (같은 경로에서 중복된 프레임은 한 번만 합산)"""
+    totals = defaultdict(float)
+    for path, seconds in stacks.items():
+        for frame in set(path.split(";")):
+            totals[frame] += seconds
+    return totals
+
+
+def _by_depth(stacks: dict[str, float], depth: int) -> dict[str, float]:
+    totals = defaultdict(float)
+    for path, seconds in stacks.items():
+        frames = path.split(";")
+        totals[frames[depth] if len(frames) > depth else "(self)"] += seconds
+    return totals
+
+
+def to_folded(stacks: dict[str, float]) -> str:
+    """flamegraph.pl / speedscope용 collapsed stack (값은 마이크로초)"""
+    return "".join(f"{path} {round(seconds * 1_000_000)}\n"
+                   for path, seconds in sorted(stacks.items()) if seconds > 0)
+
+
+def format_report(stacks: dict[str, float], calls: Counter, wall: float, top: int = None) -> str:
+    """단계, fixture, 페이지 객체 메서드, 모듈, Allure I/O별 시간을 큰 순서로 정렬한 보고서"""
+    top = top or Config.PROFILE_TOP
+    inclusive = inclusive_times(stacks)
+    profiled = sum(stacks.values())
+
+    def table(title, totals, prefix=None):
+        rows = sorted(totals.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        lines = [f"{title:<60}{'total(s)':>10}{'%':>7}" + (f"{'calls':>8}" if prefix else "")]
+        for name, seconds in rows:
+            share = seconds / profiled * 100 if profiled else 0
+            label = name[len(prefix):] if prefix else name
+            lines.append(f"  {label[:58]:<58}{seconds:>10.2f}{share:>7.1f}" + (f"{calls[name]:>8}" if prefix else ""))
+        return lines
+
+    def category(prefix):
+        return {name: seconds for name, seconds in inclusive.items() if name.startswith(prefix)}
+
+    phases = {name: seconds for name, seconds in _by_depth(stacks, 2).items() if name in PHASES}
+    phases["(allure result outside phases)"] = sum(
+        seconds for path, seconds in stacks.items()
+        if len(path.split(";")) > 2 and path.split(";")[2].startswith(ALLURE)
+    )
+    sections = [
+        [f"wall {wall:.2f}s, profiled {profiled:.2f}s (test time summed across workers)"],
+        table("phase", phases),
+        table("fixture (setup + teardown)", category(FIXTURE), FIXTURE),
+        table("page object method", category(PAGE), PAGE),
+        table("module", _by_depth(stacks, 0)),
+        table("allure I/O", category(ALLURE), ALLURE),
+    ]
+    return "\n\n".join("\n".join(lines) for lines in sections)
@@ -0,0 +1,157 @@
+"""Allure 결과 디렉터리 크기 예산 (REPORT_SIZE_BUDGET_MB 초과 시 우선순위가 낮은 첨부 파일부터 삭제)"""
+import json
+import os
+from typing import NamedTuple
+
+import pytest
+
+from utils import allure_writer
+from utils.config import Config
+
+# 결과/컨테이너 JSON에서 첨부 파일을 가질 수 있는 속성 (steps, fixture befores/afters)
+_NESTED_ATTRS = ("steps", "befores", "afters")
+_ORPHAN = (-1, 0)  # 어떤 결과도 참조하지 않는 첨부 파일 (중단된 실행의 잔여물 등) - 가장 먼저 삭제
+
+
+class Eviction(NamedTuple):
+    """예산 적용 결과 (크기는 바이트)"""
+
+    before: int
+    after: int
+    evicted: int
+    budget: int
+
+
+def parse_order(value: str) -> dict[str, int]:
+    """'passed,skipped,...' -> 상태별 삭제 순위 (앞쪽이 먼저 삭제, 목록에 없는 상태는 삭제하지 않음)"""
+    statuses = [status.strip() for status in value.split(",") if status.strip()]
+    return {status: rank for rank, status in enumerate(statuses)}
+
+
+def _attachments(node: dict):
+    yield from node.get("attachments") or []
+    for attr in _NESTED_ATTRS:
+        for child in node.get(attr) or []:
+            yield from _attachments(child)
+
+
+def _strip(node: dict, evicted: set) -> bool:
+    """삭제된 첨부 파일 참조를 제거하고 변경 여부 반환"""
+    attachments = node.get("attachments") or []
+    kept = [attachment for attachment in attachments if attachment.get("source") not in evicted]
+    changed = len(kept) != len(attachments)
+    if changed:
+        node["attachments"] = kept
+    for attr in _NESTED_ATTRS:
+        for child in node.get(attr) or []:
+            changed = _strip(child, evicted) or changed
+    return changed
+
+
+def _load(path: str):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _eviction_keys(docs: dict[str, dict], order: dict[str, int]) -> dict[str, tuple]:
+    """첨부 파일별 삭제 우선순위 (상태 순위, 최근 종료 시각) - 참조하는 테스트 중 가장 보호되는 쪽 기준
+
+    보호 대상 상태(order에 없음)의 테스트가 참조하는 첨부 파일은 키가 None이다.
+    """
+    results = {doc["uuid"]: doc for name, doc in docs.items() if name.endswith("-result.json") and "uuid" in doc}
+    owners: dict[str, list[tuple[str, int]]] = {}
+    for name, doc in docs.items():
+        if name.endswith("-result.json"):
+            tests = [doc]
+        else:  # 컨테이너(fixture)의 첨부 파일은 자식 테스트 결과 기준 (자식이 없으면 컨테이너 자체)
+            tests = [results[uuid] for uuid in doc.get("children") or [] if uuid in results] or [doc]
+        owned = [(test.get("status", "unknown"), test.get("stop") or 0) for test in tests]
+        for attachment in _attachments(doc):
+            owners.setdefault(attachment.get("source"), []).extend(owned)
+
+    keys = {}
+    for source, owned in owners.items():
+        ranks = [order.get(status) for status, _ in owned]
+        keys[source] = None if None in ranks else (max(ranks), max(stop for _, stop in owned))
+    return keys
+
+
+def enforce(results_dir: str, max_bytes: int, order: str = None) -> Eviction:
+    """results_dir 크기가 max_bytes를 넘으면 첨부 파일을 상태 순위 → 오래된 순으로 삭제
+
+    첨부 파일만 삭제하고 결과 JSON은 남기며, 삭제한 첨부 파일 참조는 결과/컨테이너 JSON에서 제거한다.
+    같은 내용의 첨부 파일(allure_writer 중복 제거)을 여러 테스트가 참조하면 가장 보호되는 테스트 기준으로 판단한다.
+    """
+    order = parse_order(order if order is not None else Config.REPORT_EVICTION_ORDER)
+    sizes = {}
+    for entry in os.scandir(results_dir):
+        if entry.is_file():
+            sizes[entry.name] = entry.stat().st_size
+    total = sum(sizes.values())
+    if total <= max_bytes:
+        return Eviction(total, total, 0, max_bytes)
+
+    docs = {}
+    for name in sizes:
+        if name.endswith("-result.json") or name.endswith("-container.json"):
+            doc = _load(os.path.join(results_dir, name))
+            if isinstance(doc, dict):
+                docs[name] = doc
+    keys = _eviction_keys(docs, order)
+    candidates = [name for name in sizes if "-attachment" in name and keys.get(name, _ORPHAN) is not None]
+    candidates.sort(key=lambda name: keys.get(name, _ORPHAN))
+
+    evicted = set()
+    remaining = total
+    for name in candidates:
+        if remaining <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(results_dir, name))
+        except FileNotFoundError:
+            pass
+        evicted.add(name)
+        remaining -= sizes[name]
+
+    for name, doc in docs.items():
+        if _strip(doc, evicted):
+            path = os.path.join(results_dir, name)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(doc, f, ensure_ascii=False)
+            remaining += os.path.getsize(path) - sizes[name]
+    return Eviction(total, remaining, len(evicted), max_bytes)
+
+
+class ReportBudget:
+    """REPORT_SIZE_BUDGET_MB: 세션 종료 시 Allure 결과 디렉터리를 크기 예산 이하로 정리하는 플러그인
+
+    리포트 생성/아티팩트 보관 시간은 결과 디렉터리 크기에 비례하므로, 통과한 테스트의 오래된 첨부 파일부터 삭제한다.
+    xdist 사용 시 모든 워커의 기록이 끝난 뒤 컨트롤러 프로세스에서만 수행한다.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_terminal_summary(self, terminalreporter):
+        results_dir = self.config.getoption("allure_report_dir", None)
+        if self.is_worker or not results_dir or not os.path.isdir(results_dir):
+            return
+        allure_writer.flush_all()  # 비동기 writer가 아직 기록하지 않은 결과 포함
+        result = enforce(results_dir, Config.REPORT_SIZE_BUDGET_MB * 1024 * 1024)
+        if not result.evicted and result.after <= result.budget:
+            return
+        mb = 1024 * 1024
+        terminalreporter.write_sep("-", "report budget")
+        terminalreporter.write_line(
+            f"{results_dir}: {result.before / mb:.1f}MB -> {result.after / mb:.1f}MB "
+            f"(budget {result.budget / mb:.0f}MB, evicted {result.evicted} attachments)"
+        )
+        if result.after > result.budget:
+            terminalreporter.write_line(
+                "REPORT BUDGET EXCEEDED 삭제 가능한 첨부 파일이 없습니다 (REPORT_EVICTION_ORDER 확인)", yellow=True
+            )
@@ -0,0 +1,194 @@
+import json
+import os
+
+import pytest
+from _pytest.runner import call_and_report
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from utils.budgets import BudgetExceeded
+from utils.config import Config
+
+RERUN = "rerun"  # 재시도한 시도의 보고서 outcome
+FLAKY = "flaky"  # 기록: 재시도 후 통과
+FLIPS = 2  # 기록 안에서 통과/실패가 이 횟수 이상 바뀌면 불안정한 테스트로 판단
+
+
+class FlakyHistory:
+    """테스트별 최근 실행 결과 기록 (JSON 파일)
+
+    결과는 passed, failed, flaky(재시도 후 통과)이며 테스트마다 최근 size개만 보관한다.
+    """
+
+    def __init__(self, path: str, size: int = None):
+        self.path = path
+        self.size = size or Config.RETRY_HISTORY_SIZE
+        self.history: dict[str, list[str]] = self._load()
+        self.current: dict[str, str] = {}
+
+    def record(self, nodeid: str, outcome: str):
+        """이번 실행의 최종 결과 기록"""
+        self.current[nodeid] = outcome
+
+    def is_flaky(self, nodeid: str) -> bool:
+        """최근 기록에 재시도 후 통과가 있거나 통과/실패가 FLIPS번 이상 바뀐 테스트인지 확인"""
+        outcomes = self.history.get(nodeid, [])
+        if FLAKY in outcomes:
+            return True
+        results = [outcome for outcome in outcomes if outcome in ("passed", "failed")]
+        return sum(a != b for a, b in zip(results, results[1:])) >= FLIPS
+
+    def save(self):
+        """이번 실행 결과를 과거 기록 뒤에 붙여 저장"""
+        merged = dict(self.history)
+        for nodeid, outcome in self.current.items():
+            merged[nodeid] = (merged.get(nodeid, []) + [outcome])[-self.size:]
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+def is_timing_failure(excinfo) -> bool:
+    """Playwright 대기 시간 초과 예외로 인한 실패인지 확인 (예외의 원인으로 발생한 경우 포함)
+
+    페이지 객체 확인 메서드(is_visible 등)가 False를 반환해 실패한 assert는 실제 회귀일 수 있으므로 포함하지 않는다.
+    """
+    exc = excinfo.value if excinfo is not None else None
+    while exc is not None:
+        if isinstance(exc, PlaywrightTimeoutError):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def _close_allure_attempt(item):
+    """현재 시도의 Allure 결과를 닫아 다음 시도가 새 결과(같은 historyId → Retries)로 기록되게 함"""
+    listener = item.config.pluginmanager.get_plugin("allure_listener")
+    if listener is None:
+        return
+    uuid = listener._cache.pop(item.nodeid)
+    if uuid:
+        listener.allure_logger.close_test(uuid)
+
+
+class RetryPolicy:
+    """알려진 불안정 테스트와 대기 시간 초과로 실패한 테스트만 바로 재시도하는 플러그인
+
+    - 재시도 대상: known_flaky 마커나 기록상 불안정한 테스트의 실패, Playwright 대기 시간 초과로 인한 실패
+    - 재시도 제외: 지연 시간 예산 초과(BudgetExceeded), xfail, 프로세스(워커)당 RETRY_SESSION_LIMIT 초과
+    - 재시도 전에는 함수 범위 fixture만 정리하므로 테스트는 새 컨텍스트(캐시된 로그인 상태 사용)에서 다시 실행되고
+      클래스/모듈/세션 fixture(브라우저, 로그인 캐시, 여정 스냅샷)는 유지된다
+    - 재시도한 시도의 보고서는 rerun으로, Allure에는 시도마다 별도 결과로 기록된다
+    xdist 사용 시 재시도는 워커에서, 결과 기록은 컨트롤러 프로세스에서만 수행한다.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+        self.history = FlakyHistory(os.path.join(Config.REPORTS_DIR, "flaky_history.json"))
+        self.retries = 0
+        self.retried: set[str] = set()
+        self._excinfo = {}
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        report = yield
+        if report.failed and call.excinfo is not None:
+            self._excinfo[item.nodeid] = call.excinfo
+        return report
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        item.execution_count = 0
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        while True:
+            item.execution_count += 1
+            reports, retry = self._run_attempt(item, nextitem)
+            for report in reports:
+                if retry and report.failed:
+                    report.outcome = RERUN
+                item.ihook.pytest_runtest_logreport(report=report)
+            if not retry:
+                break
+            self.retries += 1
+            _close_allure_attempt(item)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def _run_attempt(self, item, nextitem):
+        """setup/call 후 재시도 여부를 정하고, 재시도하면 함수 범위 fixture만 정리 (runtestprotocol과 같은 순서)"""
+        for when in ("setup", "call", "teardown"):
+            item.__dict__.pop(f"rep_{when}", None)  # conftest가 저장한 이전 시도 보고서
+        self._excinfo.pop(item.nodeid, None)
+        hasrequest = hasattr(item, "_request")
+        if hasrequest and not item._request:
+            item._initrequest()
+        try:
+            reports = [call_and_report(item, "setup", log=False)]
+            if reports[0].passed and not item.config.getoption("setuponly", False):
+                reports.append(call_and_report(item, "call", log=False))
+            retry = self._should_retry(item, reports)
+            if item.session.shouldfail or item.session.shouldstop:
+                nextitem = None
+            # 재시도 시 teardown_exact(item.parent): 테스트 노드(함수 범위 fixture)만 정리
+            reports.append(call_and_report(item, "teardown", log=False, nextitem=item.parent if retry else nextitem))
+        finally:
+            if hasrequest:
+                item._request = False
+                item.funcargs = None
+        return reports, retry
+
+    def _should_retry(self, item, reports) -> bool:
+        excinfo = self._excinfo.pop(item.nodeid, None)
+        if not any(report.failed for report in reports) or any(hasattr(report, "wasxfail") for report in reports):
+            return False
+        if item.execution_count > Config.RETRY_MAX or self.retries >= Config.RETRY_SESSION_LIMIT:
+            return False
+        if item.session.shouldfail or item.session.shouldstop:
+            return False
+        if excinfo is not None and excinfo.errisinstance(BudgetExceeded):
+            return False  # 예산 초과는 성능 회귀 신호이므로 재시도로 숨기지 않음
+        return (item.get_closest_marker("known_flaky") is not None
+                or self.history.is_flaky(item.nodeid)
+                or is_timing_failure(excinfo))
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == RERUN:
+            return RERUN, "R", ("RERUN", {"yellow": True})
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        if self.is_worker:
+            return
+        if report.outcome == RERUN:
+            self.retried.add(report.nodeid)
+            return
+        if report.when == "call" or (report.when == "setup" and not report.passed):
+            if report.skipped:
+                return
+            outcome = report.outcome
+            if outcome == "passed" and report.nodeid in self.retried:
+                outcome = FLAKY
+            self.history.record(report.nodeid, outcome)
+
+    def pytest_sessionfinish(self, session):
+        if not self.is_worker and self.history.current:
+            self.history.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.retried:
+            return
+        terminalreporter.write_sep("-", "retries")
+        for nodeid in sorted(self.retried):
+            outcome = self.history.current.get(nodeid, "failed")
+            label = "passed on retry" if outcome == FLAKY else outcome
+            terminalreporter.write_line(f"{nodeid}: {label}", yellow=outcome == FLAKY, red=outcome == "failed")
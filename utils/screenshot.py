@@ -0,0 +1,45 @@
+import allure
+from playwright.sync_api import Page
+
+from utils.config import Config
+
+POLICIES = ("always", "on-failure", "on-failure-or-retry", "never")
+
+_ATTACHMENT_TYPES = {
+    "png": allure.attachment_type.PNG,
+    "jpeg": allure.attachment_type.JPG,
+}
+
+
+def should_capture(policy: str, failed: bool, retried: bool) -> bool:
+    """스크린샷 정책에 따라 캡처 여부 결정"""
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown SCREENSHOT_POLICY: {policy} (choose from {', '.join(POLICIES)})")
+    if policy == "always":
+        return True
+    if policy == "on-failure":
+        return failed
+    if policy == "on-failure-or-retry":
+        return failed or retried
+    return False
+
+
+def attach_screenshot(page: Page, failed: bool):
+    """스크린샷을 찍어 Allure에 첨부
+
+    실패 시에는 디버깅을 위해 전체 페이지를, 통과 시에는 뷰포트만 캡처한다.
+    """
+    image_type = Config.SCREENSHOT_FORMAT
+    if image_type not in _ATTACHMENT_TYPES:
+        raise ValueError(f"Unknown SCREENSHOT_FORMAT: {image_type} (choose from png, jpeg)")
+
+    options = {"full_page": failed, "type": image_type}
+    if image_type == "jpeg":
+        options["quality"] = Config.SCREENSHOT_QUALITY
+
+    status = "failed" if failed else "passed"
+    allure.attach(
+        page.screenshot(**options),
+        name=f"screenshot_{status}",
+        attachment_type=_ATTACHMENT_TYPES[image_type]
+    )
@@ -0,0 +1,73 @@
+import json
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Page
+
+# 출처(origin)의 저장소에 접근하기 위해 라우팅으로 응답하는 빈 문서 경로 (실제 서버로 요청이 나가지 않음)
+BLANK_PATH = "/__storage_blank__"
+
+_SET_LOCAL_STORAGE_SCRIPT = """
+(items) => { for (const { name, value } of items) localStorage.setItem(name, value); }
+"""
+
+# 저장소를 비우고 남은 항목 수를 반환 (검증용)
+_CLEAR_STORAGE_SCRIPT = """
+async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        for (const db of await indexedDB.databases()) indexedDB.deleteDatabase(db.name);
+    }
+    return localStorage.length + sessionStorage.length;
+}
+"""
+
+
+def origin_of(url: str) -> str:
+    """URL의 출처(scheme://host[:port]) 반환 (http/https가 아니면 빈 문자열)"""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return ""
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def load_storage_state(state) -> dict:
+    """storage_state 파일 경로 또는 dict를 dict로 반환"""
+    if isinstance(state, dict):
+        return state
+    with open(state, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def apply_storage_state(context: BrowserContext, page: Page, state):
+    """이미 생성된 컨텍스트에 storage_state(쿠키 + localStorage) 적용"""
+    state = load_storage_state(state)
+    if state.get("cookies"):
+        context.add_cookies(state["cookies"])
+    for entry in state.get("origins", []):
+        if entry.get("localStorage"):
+            with_origin_page(context, page, entry["origin"],
+                             lambda p, items=entry["localStorage"]: p.evaluate(_SET_LOCAL_STORAGE_SCRIPT, items))
+
+
+def clear_origin_storage(context: BrowserContext, page: Page, origin: str) -> int:
+    """출처의 localStorage/sessionStorage/IndexedDB를 비우고 남은 항목 수 반환"""
+    return with_origin_page(context, page, origin, lambda p: p.evaluate(_CLEAR_STORAGE_SCRIPT))
+
+
+def with_origin_page(context: BrowserContext, page: Page, origin: str, action):
+    """출처의 빈 문서로 이동한 페이지에서 action(page) 실행
+
+    문서 요청은 라우팅으로 응답하므로 대상 사이트에 접속하지 않고 해당 출처의 저장소만 다룰 수 있다.
+    """
+    url = origin + BLANK_PATH
+
+    def fulfill(route):
+        route.fulfill(status=200, content_type="text/html", body="<!doctype html><title></title>")
+
+    context.route(url, fulfill)
+    try:
+        page.goto(url)
+        return action(page)
+    finally:
+        context.unroute(url, fulfill)
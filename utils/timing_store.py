@@ -0,0 +1,130 @@
+import heapq
+import json
+import os
+import statistics
+import time
+
+import pytest
+
+from utils.config import Config
+
+PHASES = ("setup", "call", "teardown")
+
+
+class TimingStore:
+    """테스트별 setup/call/teardown 소요 시간 기록 (JSON 파일)
+
+    이전 실행 값과 이번 실행 값을 지수 이동 평균으로 합쳐 저장한다.
+    """
+
+    SMOOTHING = 0.5
+
+    def __init__(self, path: str):
+        self.path = path
+        self.history: dict[str, dict] = self._load()
+        self.current: dict[str, dict] = {}
+
+    def record(self, nodeid: str, when: str, duration: float):
+        """이번 실행의 단계별 소요 시간 기록"""
+        self.current.setdefault(nodeid, {})[when] = duration
+
+    def expected(self, nodeid: str):
+        """과거 기록 기준 예상 소요 시간 (기록이 없으면 None)"""
+        entry = self.history.get(nodeid)
+        if entry is None:
+            return None
+        return sum(entry.get(phase, 0.0) for phase in PHASES)
+
+    def save(self):
+        """이번 실행 결과를 과거 기록과 합쳐 저장"""
+        merged = dict(self.history)
+        for nodeid, phases in self.current.items():
+            previous = merged.get(nodeid, {})
+            entry = {"runs": previous.get("runs", 0) + 1}
+            for phase in PHASES:
+                value = phases.get(phase, 0.0)
+                if phase in previous:
+                    value = self.SMOOTHING * value + (1 - self.SMOOTHING) * previous[phase]
+                entry[phase] = round(value, 4)
+            merged[nodeid] = entry
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+def estimate_durations(nodeids, store: TimingStore) -> dict[str, float]:
+    """테스트별 예상 소요 시간 (기록 없는 테스트는 기록된 테스트의 중앙값으로 가정)"""
+    known = {nodeid: store.expected(nodeid) for nodeid in nodeids}
+    recorded = [d for d in known.values() if d is not None]
+    fallback = statistics.median(recorded) if recorded else 1.0
+    return {nodeid: fallback if d is None else d for nodeid, d in known.items()}
+
+
+def predict_makespan(durations, workers: int) -> float:
+    """LPT(긴 작업 우선) 방식으로 워커에 배정했을 때의 예상 총 소요 시간"""
+    loads = [0.0] * max(1, workers)
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
+
+
+class DurationScheduler:
+    """과거 소요 시간 기반 테스트 스케줄링 플러그인
+
+    --schedule duration이면 예상 소요 시간이 긴 테스트부터 실행하도록 정렬해(LPT)
+    느린 체크아웃/performance_glitch_user 테스트가 마지막에 몰려 꼬리를 늘리지 않게 한다.
+    xdist 사용 시 소요 시간 기록과 리포트는 컨트롤러 프로세스에서만 수행한다.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.store = TimingStore(os.path.join(Config.REPORTS_DIR, "test_durations.json"))
+        self.is_worker = hasattr(config, "workerinput")
+        self.started_at = None
+        self.finished_at = None
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items):
+        if self.config.getoption("schedule") != "duration":
+            return
+        durations = estimate_durations([item.nodeid for item in items], self.store)
+        # sort는 안정 정렬이므로 예상 시간이 같으면 TEST_ORDER 순서가 유지된다
+        items.sort(key=lambda item: durations[item.nodeid], reverse=True)
+
+    def pytest_sessionstart(self, session):
+        self.started_at = time.perf_counter()
+
+    def pytest_runtest_logreport(self, report):
+        if not self.is_worker and report.when in PHASES:
+            self.store.record(report.nodeid, report.when, report.duration)
+
+    def pytest_sessionfinish(self, session):
+        self.finished_at = time.perf_counter()
+        if not self.is_worker and self.store.current:
+            self.store.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.store.current or self.config.getoption("schedule") != "duration":
+            return
+        nodeids = list(self.store.current)
+        known = sum(1 for nodeid in nodeids if nodeid in self.store.history)
+        if not known:
+            return  # 과거 기록이 없으면 예측값이 의미 없음
+        workers = self.config.getoption("numprocesses", None) or 1
+        predicted = predict_makespan(estimate_durations(nodeids, self.store).values(), workers)
+        actual = (self.finished_at or time.perf_counter()) - self.started_at
+        terminalreporter.write_sep("-", "makespan")
+        terminalreporter.write_line(
+            f"workers={workers} predicted={predicted:.1f}s actual={actual:.1f}s "
+            f"(tests={len(nodeids)}, history={known})"
+        )
@@ -0,0 +1,120 @@
+import json
+import os
+
+from playwright.sync_api import BrowserContext, Error as PlaywrightError, Page
+
+# 문서마다 성능 관찰자를 등록 - LCP, 레이아웃 이동(CLS), long task, 마지막 사용자 입력/DOM 변경 시각 기록
+INIT_SCRIPT = """
+(() => {
+    if (window.__webVitals) return;
+    const v = window.__webVitals = {
+        lcp: null, shifts: [], longTasks: [], inputAt: 0, mutationAt: 0, collectedHref: null,
+    };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+        } catch (e) { /* 지원하지 않는 브라우저 */ }
+    };
+    observe("largest-contentful-paint", (e) => { v.lcp = e.startTime; });
+    observe("layout-shift", (e) => { if (!e.hadRecentInput) v.shifts.push([e.startTime, e.value]); });
+    observe("longtask", (e) => { v.longTasks.push([e.startTime, e.duration]); });
+    for (const type of ["pointerdown", "keydown"]) {
+        addEventListener(type, (e) => { v.inputAt = e.timeStamp; }, true);
+    }
+    new MutationObserver(() => { v.mutationAt = performance.now(); })
+        .observe(document, { childList: true, subtree: true });
+})();
+"""
+
+# 마지막 수집 이후 URL이 바뀌었으면 지표를 반환 (바뀌지 않았으면 null)
+# - hard: 새 문서 로드 (Navigation Timing, paint, LCP)
+# - soft: 같은 문서 안의 라우팅 (마지막 입력부터 마지막 DOM 변경까지의 시간)
+COLLECT_SCRIPT = """
+() => {
+    const v = window.__webVitals;
+    if (!v || v.collectedHref === location.href) return null;
+    const soft = v.collectedHref !== null;
+    v.collectedHref = location.href;
+
+    const since = soft ? v.inputAt : 0;
+    const nav = performance.getEntriesByType("navigation")[0];
+    const paint = Object.fromEntries(performance.getEntriesByType("paint").map((p) => [p.name, p.startTime]));
+    const shifts = v.shifts.filter(([start]) => start >= since);
+    const tasks = v.longTasks.filter(([start]) => start >= since);
+    const ms = (x) => (x === null || x === undefined ? null : Math.round(x * 10) / 10);
+    const hard = (x) => (soft ? null : ms(x));
+    return {
+        url: location.href,
+        type: soft ? "soft" : "hard",
+        duration: soft ? ms(Math.max(v.mutationAt - since, 0)) : ms(nav ? nav.loadEventEnd || nav.duration : null),
+        ttfb: hard(nav && nav.responseStart),
+        dom_content_loaded: hard(nav && nav.domContentLoadedEventEnd),
+        load: hard(nav && nav.loadEventEnd),
+        first_paint: hard(paint["first-paint"]),
+        first_contentful_paint: hard(paint["first-contentful-paint"]),
+        lcp: hard(v.lcp),
+        cls: Math.round(shifts.reduce((sum, [, value]) => sum + value, 0) * 10000) / 10000,
+        long_tasks: tasks.length,
+        long_task_ms: ms(tasks.reduce((sum, [, duration]) => sum + duration, 0)),
+    };
+}
+"""
+
+_active = None
+
+
+class WebVitalsCollector:
+    """테스트 하나의 화면 전환별 성능 지표 수집기"""
+
+    def __init__(self):
+        self.records: list[dict] = []
+        self._urls: dict[Page, str] = {}  # 페이지별 마지막으로 수집한 URL
+
+    def capture(self, page: Page, trigger: str, target: str):
+        """화면 전환이 있었으면 지표를 기록 (trigger: navigate/click, target: URL 또는 셀렉터)
+
+        page.url은 Playwright가 framenavigated 이벤트로 갱신하는 로컬 값이므로,
+        URL이 바뀌지 않은 액션은 브라우저 호출(evaluate) 없이 건너뛴다.
+        """
+        url = page.url
+        if self._urls.get(page) == url:
+            return
+        try:
+            metrics = page.evaluate(COLLECT_SCRIPT)
+        except PlaywrightError:
+            return  # 페이지가 닫혔거나 문서가 교체되는 중
+        self._urls[page] = url
+        if metrics:
+            metrics["trigger"] = trigger
+            metrics["target"] = target
+            self.records.append(metrics)
+
+    def to_json(self) -> str:
+        return json.dumps(self.records, ensure_ascii=False, indent=2)
+
+
+def install(context: BrowserContext):
+    """컨텍스트에 관찰 스크립트 등록 (컨텍스트 풀에서 재사용되는 컨텍스트에는 한 번만)"""
+    if not getattr(context, "_web_vitals_installed", False):
+        context.add_init_script(INIT_SCRIPT)
+        context._web_vitals_installed = True
+
+
+def set_active(collector: WebVitalsCollector = None):
+    """BasePage가 화면 전환 시 사용할 수집기 지정 (None이면 수집 안 함)"""
+    global _active
+    _active = collector
+
+
+def capture(page: Page, trigger: str, target: str):
+    """활성 수집기가 있으면 현재 페이지의 지표 수집"""
+    if _active is not None:
+        _active.capture(page, trigger, target)
+
+
+def append_results(path: str, nodeid: str, records: list[dict]):
+    """테스트별 지표를 JSONL 파일에 추가 (회귀 추적용)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    line = json.dumps({"nodeid": nodeid, "records": records}, ensure_ascii=False)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")